@@ -15,7 +15,7 @@ from .models import constants as model_constants
 from .simple.detector import SimpleDetector
 from .simple.tracker import SimpleTracker
 
-Backend = Literal["serial", "mpi", "dask"]
+Backend = Literal["serial", "mpi", "dask", "processes"]
 Algorithm = Literal["simple", "hodges"]
 
 
@@ -41,6 +41,7 @@ def run_tracker(
     max_chunk_size: int | None = None,
     threshold: float | None = None,
     engine: str | None = None,
+    scheduler: str | None = None,
     algorithm: Algorithm = "simple",
     output_format: str = "imilast",
     # Hodges-specific
@@ -59,8 +60,17 @@ def run_tracker(
     lmax: int = constants.LMAX_DEFAULT,
     taper_points: int = constants.TAPER_DEFAULT,
     overlap: int = model_constants.OVERLAP_DEFAULT,
+    compact: bool = False,
 ) -> None:
     """Orchestrates the storm tracking process from the CLI."""
+    simple = algorithm == "simple" and map_proj != "healpix"
+    if backend == "processes" and not simple:
+        raise ValueError(
+            "The processes backend is only available for the simple tracker"
+        )
+    if scheduler is not None and not simple:
+        raise ValueError("A dask scheduler is only used by the simple tracker")
+
     timer: dict[str, float] = {}
 
     # 1. Backend Auto-detection
@@ -147,9 +157,10 @@ def run_tracker(
             else constants.MISSING_DEFAULT,
             zones=zones,
             adapt_params=adapt_params,
+            compact=compact,
         )
     elif algorithm == "simple":
-        tracker = SimpleTracker()
+        tracker = SimpleTracker(compact=compact)
     else:
         # Initialize with standard defaults and override if provided
         tracker = HodgesTracker(
@@ -168,6 +179,7 @@ def run_tracker(
             else constants.MISSING_DEFAULT,
             zones=zones,
             adapt_params=adapt_params,
+            compact=compact,
         )
 
     tracks = tracker.track(
@@ -190,6 +202,8 @@ def run_tracker(
         lmax=lmax,
         taper_points=taper_points,
         overlap=overlap,
+        # Only the simple tracker runs on a dask scheduler
+        **({"scheduler": scheduler} if simple else {}),
     )
 
     # Export Phase
@@ -237,9 +251,9 @@ def parse_args() -> Namespace:
     general.add_argument(
         "-f",
         "--format",
-        choices=["imilast", "hodges"],
+        choices=["imilast", "hodges", "store"],
         default="imilast",
-        help="Output format. Default is 'imilast'.",
+        help="Output format. Default is 'imilast'. 'store' writes a directory.",
     )
     general.add_argument(
         "-m",
@@ -303,9 +317,12 @@ def parse_args() -> Namespace:
     perf.add_argument(
         "-b",
         "--backend",
-        choices=["serial", "mpi", "dask"],
+        choices=["serial", "mpi", "dask", "processes"],
         default=None,
-        help="Parallel backend. Auto-detected by default.",
+        help=(
+            "Parallel backend. Auto-detected by default. 'processes' is only "
+            "available for the simple algorithm."
+        ),
     )
     perf.add_argument(
         "-w",
@@ -321,6 +338,14 @@ def parse_args() -> Namespace:
         default=60,
         help="Steps per chunk for Dask/RSPLICE. Default 60.",
     )
+    perf.add_argument(
+        "--scheduler",
+        default=None,
+        help=(
+            "Dask scheduler: 'threads' (default), 'processes', 'distributed' "
+            "for a local dask.distributed cluster, or a scheduler address."
+        ),
+    )
     perf.add_argument(
         "--overlap",
         type=int,
@@ -337,6 +362,11 @@ def parse_args() -> Namespace:
         default=None,
         help="Xarray engine for reading input.",
     )
+    perf.add_argument(
+        "--compact",
+        action="store_true",
+        help="Store tracks as float32/int32 to halve memory and transfer size.",
+    )
 
     # 4. Hodges (TRACK) Specific Options
     hodges = parser.add_argument_group("Hodges (TRACK) Algorithm Options")
@@ -417,7 +447,13 @@ def parse_args() -> Namespace:
         help="JSON string defining adaptive smoothness parameters (2x4 array).",
     )
 
-    return parser.parse_args()
+    args = parser.parse_args()
+    simple = args.algorithm == "simple" and args.map_proj != "healpix"
+    if args.backend == "processes" and not simple:
+        parser.error("--backend processes is only available for the simple algorithm")
+    if args.scheduler is not None and not simple:
+        parser.error("--scheduler is only available for the simple algorithm")
+    return args
 
 
 def main() -> None:
@@ -507,6 +543,7 @@ def main() -> None:
         max_chunk_size=args.chunk_size,
         threshold=args.threshold,
         engine=args.engine,
+        scheduler=args.scheduler,
         algorithm=args.algorithm,
         output_format=args.format,
         # Hodges-specific
@@ -525,6 +562,7 @@ def main() -> None:
         lmax=lmax,
         taper_points=args.taper,
         overlap=args.overlap,
+        compact=args.compact,
     )
 
 
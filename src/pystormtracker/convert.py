@@ -5,6 +5,7 @@ from pathlib import Path
 from . import __version__
 from .io.imilast import read_imilast
 from .io.json import infer_track_type, read_json, write_json
+from .io.store import read_store
 from .models.tracks import Tracks
 
 
@@ -90,14 +91,14 @@ def main() -> None:
     parser.add_argument(
         "-f",
         "--in-format",
-        choices=["imilast", "json"],
+        choices=["imilast", "json", "store"],
         required=True,
         help="Input file format",
     )
     parser.add_argument(
         "-F",
         "--out-format",
-        choices=["imilast", "hodges", "json", "html"],
+        choices=["imilast", "hodges", "json", "store", "html"],
         required=True,
         help="Output file format",
     )
@@ -119,6 +120,8 @@ def main() -> None:
         tracks = read_imilast(args.input)
     elif args.in_format == "json":
         tracks = read_json(args.input)
+    elif args.in_format == "store":
+        tracks = read_store(args.input)
 
     # Track Type Detection / Override
     if args.type:
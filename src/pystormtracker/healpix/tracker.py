@@ -49,6 +49,7 @@ class HealpixTracker(Tracker):
         zones: NDArray[np.float64] | None = None,
         adapt_params: NDArray[np.float64] | None = None,
         use_standard_constraints: bool = True,
+        compact: bool = False,
     ) -> None:
         self.w1 = w1
         self.w2 = w2
@@ -57,6 +58,7 @@ class HealpixTracker(Tracker):
         self.n_iterations = n_iterations
         self.min_lifetime = min_lifetime
         self.max_missing = max_missing
+        self.compact = compact
 
         if zones is None:
             if use_standard_constraints:
@@ -139,6 +141,7 @@ class HealpixTracker(Tracker):
             max_missing=self.max_missing,
             zones=self.zones,
             adapt_params=self.adapt_params,
+            compact=self.compact,
         )
         tracks = linker.link(raw_steps)
         t3 = timeit.default_timer()
@@ -155,7 +158,7 @@ class HealpixTracker(Tracker):
         map_proj: Literal["global", "nh_stereo", "sh_stereo", "healpix"] = "global",
         resolution: float = 100.0,
         extent: MapExtent | None = None,
-        backend: Literal["serial", "mpi", "dask"] = "serial",
+        backend: Literal["serial", "mpi", "dask", "processes"] = "serial",
         n_workers: int | None = None,
         max_chunk_size: int | None = None,
         threshold: float | None = None,
@@ -207,6 +210,7 @@ class HealpixTracker(Tracker):
                     max_missing=self.max_missing,
                     zones=self.zones,
                     adapt_params=self.adapt_params,
+                    compact=self.compact,
                 )
                 tracks = linker.link(raw_steps)
             else:
@@ -326,13 +326,17 @@ def _get_cost(
 
 
 @nb.njit(cache=True, nogil=True)  # type: ignore[untyped-decorator]
-def _check_max_missing(track: NDArray[np.int64], max_missing: int) -> bool:
+def _check_max_missing(
+    track: NDArray[np.int64], max_missing: int, at: int = -1, point: int = -1
+) -> bool:
     """
     Checks if a track exceeds the maximum allowed consecutive missing frames.
 
     Args:
         track: Array of feature indices for a single track.
         max_missing: Limit on consecutive phantoms (-1 for unlimited).
+        at, point: Frame at which to read ``point`` instead of the track's
+            own entry (none by default).
 
     Returns:
         True if the track is valid under the constraint.
@@ -344,7 +348,7 @@ def _check_max_missing(track: NDArray[np.int64], max_missing: int) -> bool:
     first_real = -1
     last_real = -1
     for i in range(len(track)):
-        if track[i] != -1:
+        if (point if i == at else track[i]) != -1:
             if first_real == -1:
                 first_real = i
             last_real = i
@@ -354,7 +358,7 @@ def _check_max_missing(track: NDArray[np.int64], max_missing: int) -> bool:
 
     # Only count gaps between real start and end
     for i in range(first_real, last_real + 1):
-        if track[i] == -1:
+        if (point if i == at else track[i]) == -1:
             current_missing += 1
             if current_missing > max_missing:
                 return False
@@ -363,6 +367,197 @@ def _check_max_missing(track: NDArray[np.int64], max_missing: int) -> bool:
     return True
 
 
+@nb.njit(cache=True, nogil=True)  # type: ignore[untyped-decorator]
+def _swap_gain(
+    tracks: NDArray[np.int64],
+    features_lat: NDArray[np.float64],
+    features_lon: NDArray[np.float64],
+    k: int,
+    target_k: int,
+    i: int,
+    j: int,
+    cost_i: float,
+    cost_j: float,
+    w1: float,
+    w2: float,
+    default_dmax: float,
+    phimax: float,
+    zones: NDArray[np.float64],
+    adapt_params: NDArray[np.float64],
+    max_missing: int,
+) -> float:
+    """
+    Cost gain of swapping the points of tracks i and j at frame target_k, or
+    -inf if the swap violates a constraint. The track matrix is only read.
+    """
+    rad_to_deg = 180.0 / np.pi
+    deg_to_rad = np.pi / 180.0
+    p_i_orig = tracks[i, target_k]
+    p_j_orig = tracks[j, target_k]
+
+    # 1. Displacement Check
+    idx_i_k = tracks[i, k]
+    if idx_i_k != -1 and p_j_orig != -1:
+        lat_k, lon_k = features_lat[idx_i_k], features_lon[idx_i_k]
+        lat_t, lon_t = features_lat[p_j_orig], features_lon[p_j_orig]
+        dmax_i = 0.5 * (
+            get_regional_dmax(lat_k, lon_k, zones, default_dmax)
+            + get_regional_dmax(lat_t, lon_t, zones, default_dmax)
+        )
+        if geod_dist(lat_k, lon_k, lat_t, lon_t) > dmax_i * deg_to_rad:
+            return -np.inf
+
+    idx_j_k = tracks[j, k]
+    if idx_j_k != -1 and p_i_orig != -1:
+        lat_k, lon_k = features_lat[idx_j_k], features_lon[idx_j_k]
+        lat_t, lon_t = features_lat[p_i_orig], features_lon[p_i_orig]
+        dmax_j = 0.5 * (
+            get_regional_dmax(lat_k, lon_k, zones, default_dmax)
+            + get_regional_dmax(lat_t, lon_t, zones, default_dmax)
+        )
+        if geod_dist(lat_k, lon_k, lat_t, lon_t) > dmax_j * deg_to_rad:
+            return -np.inf
+
+    # 2. Max Missing Check, reading the swapped points in place of the
+    # originals so that searches at other frames can read the matrix
+    # concurrently
+    if not _check_max_missing(
+        tracks[i], max_missing, target_k, p_j_orig
+    ) or not _check_max_missing(tracks[j], max_missing, target_k, p_i_orig):
+        return -np.inf
+
+    # Frames k - 1 to k + 1 of the swapped tracks
+    swapped = np.empty((2, 3), dtype=np.int64)
+    for c in range(3):
+        swapped[0, c] = tracks[i, k - 1 + c]
+        swapped[1, c] = tracks[j, k - 1 + c]
+    swapped[0, target_k - k + 1] = p_j_orig
+    swapped[1, target_k - k + 1] = p_i_orig
+
+    # 3. Cost Gain Calculation
+    new_cost_i = _get_cost(swapped, 1, 0, features_lat, features_lon, w1, w2, phimax)
+    new_cost_j = _get_cost(swapped, 1, 1, features_lat, features_lon, w1, w2, phimax)
+
+    # 4. Dynamic Smoothness Check
+    valid_swap = True
+    if swapped[0, 0] != -1 and swapped[0, 1] != -1 and swapped[0, 2] != -1:
+        d1 = geod_dist(
+            features_lat[swapped[0, 0]],
+            features_lon[swapped[0, 0]],
+            features_lat[swapped[0, 1]],
+            features_lon[swapped[0, 1]],
+        )
+        d2 = geod_dist(
+            features_lat[swapped[0, 1]],
+            features_lon[swapped[0, 1]],
+            features_lat[swapped[0, 2]],
+            features_lon[swapped[0, 2]],
+        )
+        phi_max_i = get_adaptive_phimax(
+            0.5 * (d1 + d2) * rad_to_deg, adapt_params, phimax
+        )
+        if new_cost_i > phi_max_i:
+            valid_swap = False
+
+    if (
+        valid_swap
+        and swapped[1, 0] != -1
+        and swapped[1, 1] != -1
+        and swapped[1, 2] != -1
+    ):
+        d1 = geod_dist(
+            features_lat[swapped[1, 0]],
+            features_lon[swapped[1, 0]],
+            features_lat[swapped[1, 1]],
+            features_lon[swapped[1, 1]],
+        )
+        d2 = geod_dist(
+            features_lat[swapped[1, 1]],
+            features_lon[swapped[1, 1]],
+            features_lat[swapped[1, 2]],
+            features_lon[swapped[1, 2]],
+        )
+        phi_max_j = get_adaptive_phimax(
+            0.5 * (d1 + d2) * rad_to_deg, adapt_params, phimax
+        )
+        if new_cost_j > phi_max_j:
+            valid_swap = False
+
+    if not valid_swap:
+        return -np.inf
+    return (cost_i + cost_j) - (new_cost_i + new_cost_j)
+
+
+@nb.njit(cache=True, nogil=True)  # type: ignore[untyped-decorator]
+def _grid_cell(lat: float, lon: float, cell: float) -> tuple[int, int, int]:
+    """Cell of a point's unit vector in a grid of cubes of side ``cell``."""
+    phi = lat * DEGTORAD
+    lam = lon * DEGTORAD
+    return (
+        int((np.cos(phi) * np.cos(lam) + 1.0) / cell),
+        int((np.cos(phi) * np.sin(lam) + 1.0) / cell),
+        int((np.sin(phi) + 1.0) / cell),
+    )
+
+
+@nb.njit(cache=True, nogil=True)  # type: ignore[untyped-decorator]
+def _candidate_rows(
+    tracks: NDArray[np.int64],
+    k: int,
+    target_k: int,
+    max_missing: int,
+    step_offsets: NDArray[np.int64],
+    row_of: NDArray[np.int64],
+    row_len: NDArray[np.int64],
+) -> NDArray[np.int64]:
+    """
+    Sorted track rows that can take part in a swap at frame target_k.
+
+    These are the rows with a point close enough in time to frame k or
+    target_k to be affected, plus one representative of all other rows:
+    their costs and constraints do not depend on the row, so only the first
+    valid one can win a swap.
+    """
+    n_rows, n_frames = tracks.shape
+
+    # Points further than max_missing + 1 frames from target_k would leave a
+    # gap longer than max_missing
+    lo = k - 1
+    hi = k + 1
+    if max_missing >= 0:
+        lo = min(lo, target_k - max_missing - 1)
+        hi = max(hi, target_k + max_missing + 1)
+    lo = max(lo, 0)
+    hi = min(hi, n_frames - 1)
+    rows = np.unique(row_of[step_offsets[lo] : step_offsets[hi + 1]])
+
+    # Representative of the other rows: the first empty row when gaps are
+    # limited, else the first row outside the window
+    extra = -1
+    if max_missing >= 0:
+        for r in range(n_rows):
+            if row_len[r] == 0:
+                extra = r
+                break
+    else:
+        extra = 0
+        for r in rows:
+            if r != extra:
+                break
+            extra += 1
+        if extra >= n_rows:
+            extra = -1
+    if extra == -1:
+        return rows
+
+    out = np.empty(len(rows) + 1, dtype=np.int64)
+    pos = np.searchsorted(rows, extra)
+    out[:pos] = rows[:pos]
+    out[pos] = extra
+    out[pos + 1 :] = rows[pos:]
+    return out
+
+
 @nb.njit(cache=True, nogil=True)  # type: ignore[untyped-decorator]
 def _mge_iteration(
     tracks: NDArray[np.int64],
@@ -377,12 +572,20 @@ def _mge_iteration(
     zones: NDArray[np.float64],
     adapt_params: NDArray[np.float64],
     max_missing: int,
+    step_offsets: NDArray[np.int64],
+    row_of: NDArray[np.int64],
+    row_len: NDArray[np.int64],
+    costs: NDArray[np.float64],
 ) -> tuple[int, int]:
     """
     A single MGE iteration step at frame k.
 
-    Iterates through all possible track pairs and identifies the single BEST
-    swap that reduces the total cost while satisfying all constraints.
+    Identifies the single BEST swap over all track pairs that reduces the
+    total cost while satisfying all constraints, ties going to the first pair
+    in row order. Only pairs that can pass the constraints are evaluated:
+    rows near frame k in time (see ``_candidate_rows``), and pairs whose
+    displacement check is not trivially violated, found with a grid hash of
+    unit vectors.
 
     Args:
         tracks: Track matrix.
@@ -395,136 +598,313 @@ def _mge_iteration(
         zones: Regional dmax definitions.
         adapt_params: Adaptive smoothness definitions.
         max_missing: Missing frame limit.
+        step_offsets: Offsets of each frame's features in the flat arrays.
+        row_of: Track row of every feature.
+        row_len: Number of points of every track row.
+        costs: Cost of every track at every frame, NaN where unknown; filled
+            in for the candidate rows at frame k.
 
     Returns:
         (best_i, best_j) indices of the track pair to swap, or (-1, -1).
     """
-    n_tracks = tracks.shape[0]
     best_gain = 1e-8
     best_i = -1
     best_j = -1
 
     # Target frame to swap
     target_k = k + 1 if forward else k - 1
-
-    rad_to_deg = 180.0 / np.pi
     deg_to_rad = np.pi / 180.0
 
-    # Cache current costs
-    costs = np.zeros(n_tracks)
-    for i in range(n_tracks):
-        costs[i] = _get_cost(tracks, k, i, features_lat, features_lon, w1, w2, phimax)
+    rows = _candidate_rows(
+        tracks, k, target_k, max_missing, step_offsets, row_of, row_len
+    )
+    n_cand = len(rows)
+    has_k = np.empty(n_cand, dtype=np.bool_)
+    has_t = np.empty(n_cand, dtype=np.bool_)
+    row_costs = np.empty(n_cand)
+    for a in range(n_cand):
+        has_k[a] = tracks[rows[a], k] != -1
+        has_t[a] = tracks[rows[a], target_k] != -1
+        cost = costs[rows[a], k]
+        if np.isnan(cost):
+            cost = _get_cost(
+                tracks, k, rows[a], features_lat, features_lon, w1, w2, phimax
+            )
+            costs[rows[a], k] = cost
+        row_costs[a] = cost
+
+    # Pairs (a < b, as positions in rows) that need no displacement check
+    pairs = []
+    for a in range(n_cand):
+        for b in range(a + 1, n_cand):
+            if not (has_t[a] or has_t[b]):
+                continue
+            if (has_k[a] and has_t[b]) or (has_k[b] and has_t[a]):
+                continue
+            pairs.append(a * n_cand + b)
+
+    # Pairs where the point of one row at k is within the largest search
+    # radius of the point of the other at target_k
+    max_dmax = default_dmax
+    for z in range(zones.shape[0]):
+        max_dmax = max(max_dmax, zones[z, 4])
+    radius = 2.0 * np.sin(min(max_dmax * deg_to_rad, np.pi) / 2.0)
+    cell = max(radius * (1.0 + 1e-9) + 1e-12, 1e-3)
+    n_axis = int(2.0 / cell) + 2
+
+    t_pos = np.flatnonzero(has_t)
+    keys = np.empty(len(t_pos), dtype=np.int64)
+    for n in range(len(t_pos)):
+        f = tracks[rows[t_pos[n]], target_k]
+        ix, iy, iz = _grid_cell(features_lat[f], features_lon[f], cell)
+        keys[n] = (ix * n_axis + iy) * n_axis + iz
+    order = np.argsort(keys)
+    keys = keys[order]
+    t_pos = t_pos[order]
+
+    for a in range(n_cand):
+        if not has_k[a]:
+            continue
+        f = tracks[rows[a], k]
+        ix, iy, iz = _grid_cell(features_lat[f], features_lon[f], cell)
+        for dx in range(-1, 2):
+            for dy in range(-1, 2):
+                for dz in range(-1, 2):
+                    key = ((ix + dx) * n_axis + iy + dy) * n_axis + iz + dz
+                    pos = int(np.searchsorted(keys, key))
+                    while pos < len(keys) and keys[pos] == key:
+                        b = t_pos[pos]
+                        if b != a:
+                            pairs.append(min(a, b) * n_cand + max(a, b))
+                        pos += 1
+
+    # Evaluate in row order, so ties resolve as over all pairs
+    for pair in np.unique(np.array(pairs, dtype=np.int64)):
+        a, b = divmod(pair, n_cand)
+        gain = _swap_gain(
+            tracks,
+            features_lat,
+            features_lon,
+            k,
+            target_k,
+            rows[a],
+            rows[b],
+            row_costs[a],
+            row_costs[b],
+            w1,
+            w2,
+            default_dmax,
+            phimax,
+            zones,
+            adapt_params,
+            max_missing,
+        )
+        if gain > best_gain:
+            best_gain = gain
+            best_i = rows[a]
+            best_j = rows[b]
 
-    for i in range(n_tracks):
-        for j in range(i + 1, n_tracks):
-            p_i_orig = tracks[i, target_k]
-            p_j_orig = tracks[j, target_k]
+    return best_i, best_j
 
-            if p_i_orig == p_j_orig:
-                continue
 
-            # 1. Displacement Check
-            valid_swap = True
-            idx_i_k = tracks[i, k]
-            if idx_i_k != -1 and p_j_orig != -1:
-                lat_k, lon_k = features_lat[idx_i_k], features_lon[idx_i_k]
-                lat_t, lon_t = features_lat[p_j_orig], features_lon[p_j_orig]
-                dmax_i = 0.5 * (
-                    get_regional_dmax(lat_k, lon_k, zones, default_dmax)
-                    + get_regional_dmax(lat_t, lon_t, zones, default_dmax)
-                )
-                if geod_dist(lat_k, lon_k, lat_t, lon_t) > dmax_i * deg_to_rad:
-                    valid_swap = False
-
-            idx_j_k = tracks[j, k]
-            if valid_swap and idx_j_k != -1 and p_i_orig != -1:
-                lat_k, lon_k = features_lat[idx_j_k], features_lon[idx_j_k]
-                lat_t, lon_t = features_lat[p_i_orig], features_lon[p_i_orig]
-                dmax_j = 0.5 * (
-                    get_regional_dmax(lat_k, lon_k, zones, default_dmax)
-                    + get_regional_dmax(lat_t, lon_t, zones, default_dmax)
-                )
-                if geod_dist(lat_k, lon_k, lat_t, lon_t) > dmax_j * deg_to_rad:
-                    valid_swap = False
+@nb.njit(cache=True, nogil=True, parallel=True)  # type: ignore[untyped-decorator]
+def _mge_search_frames(
+    tracks: NDArray[np.int64],
+    features_lat: NDArray[np.float64],
+    features_lon: NDArray[np.float64],
+    frames: NDArray[np.int64],
+    forward: bool,
+    w1: float,
+    w2: float,
+    default_dmax: float,
+    phimax: float,
+    zones: NDArray[np.float64],
+    adapt_params: NDArray[np.float64],
+    max_missing: int,
+    step_offsets: NDArray[np.int64],
+    row_of: NDArray[np.int64],
+    row_len: NDArray[np.int64],
+    costs: NDArray[np.float64],
+) -> NDArray[np.int64]:
+    """
+    ``_mge_iteration`` at each of ``frames``, in parallel.
 
-            if not valid_swap:
-                continue
+    The searches only read the tracks and each fills in the costs of its own
+    frame, so they are independent of each other.
 
-            # 2. Max Missing Check
-            tracks[i, target_k] = p_j_orig
-            tracks[j, target_k] = p_i_orig
+    Returns:
+        (n_frames, 2) array of the best swap of each frame, or (-1, -1).
+    """
+    out = np.empty((len(frames), 2), dtype=np.int64)
+    for n in nb.prange(len(frames)):
+        best_i, best_j = _mge_iteration(
+            tracks,
+            features_lat,
+            features_lon,
+            frames[n],
+            forward,
+            w1,
+            w2,
+            default_dmax,
+            phimax,
+            zones,
+            adapt_params,
+            max_missing,
+            step_offsets,
+            row_of,
+            row_len,
+            costs,
+        )
+        out[n, 0] = best_i
+        out[n, 1] = best_j
+    return out
 
-            if not _check_max_missing(tracks[i], max_missing) or not _check_max_missing(
-                tracks[j], max_missing
-            ):
-                tracks[i, target_k] = p_i_orig
-                tracks[j, target_k] = p_j_orig
-                continue
 
-            # 3. Cost Gain Calculation
-            new_cost_i = _get_cost(
-                tracks, k, i, features_lat, features_lon, w1, w2, phimax
-            )
-            new_cost_j = _get_cost(
-                tracks, k, j, features_lat, features_lon, w1, w2, phimax
-            )
+@nb.njit(cache=True, nogil=True)  # type: ignore[untyped-decorator]
+def _index_rows(
+    tracks: NDArray[np.int64], n_features: int
+) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+    """
+    Returns the track row of every feature and the number of points of every
+    row of the track matrix.
+    """
+    n_rows, n_frames = tracks.shape
+    row_of = np.full(n_features, -1, dtype=np.int64)
+    row_len = np.zeros(n_rows, dtype=np.int64)
+    for r in range(n_rows):
+        for k in range(n_frames):
+            f = tracks[r, k]
+            if f != -1:
+                row_of[f] = r
+                row_len[r] += 1
+    return row_of, row_len
 
-            # 4. Dynamic Smoothness Check
-            if tracks[i, k - 1] != -1 and tracks[i, k] != -1 and tracks[i, k + 1] != -1:
-                d1 = geod_dist(
-                    features_lat[tracks[i, k - 1]],
-                    features_lon[tracks[i, k - 1]],
-                    features_lat[tracks[i, k]],
-                    features_lon[tracks[i, k]],
-                )
-                d2 = geod_dist(
-                    features_lat[tracks[i, k]],
-                    features_lon[tracks[i, k]],
-                    features_lat[tracks[i, k + 1]],
-                    features_lon[tracks[i, k + 1]],
-                )
-                phi_max_i = get_adaptive_phimax(
-                    0.5 * (d1 + d2) * rad_to_deg, adapt_params, phimax
-                )
-                if new_cost_i > phi_max_i:
-                    valid_swap = False
 
-            if (
-                valid_swap
-                and tracks[j, k - 1] != -1
-                and tracks[j, k] != -1
-                and tracks[j, k + 1] != -1
-            ):
-                d1 = geod_dist(
-                    features_lat[tracks[j, k - 1]],
-                    features_lon[tracks[j, k - 1]],
-                    features_lat[tracks[j, k]],
-                    features_lon[tracks[j, k]],
-                )
-                d2 = geod_dist(
-                    features_lat[tracks[j, k]],
-                    features_lon[tracks[j, k]],
-                    features_lat[tracks[j, k + 1]],
-                    features_lon[tracks[j, k + 1]],
-                )
-                phi_max_j = get_adaptive_phimax(
-                    0.5 * (d1 + d2) * rad_to_deg, adapt_params, phimax
-                )
-                if new_cost_j > phi_max_j:
-                    valid_swap = False
+@nb.njit(cache=True, nogil=True)  # type: ignore[untyped-decorator]
+def _swap_points(
+    tracks: NDArray[np.int64],
+    row_of: NDArray[np.int64],
+    row_len: NDArray[np.int64],
+    i: int,
+    j: int,
+    k: int,
+) -> None:
+    """Swaps the points of tracks i and j at frame k, updating the row index."""
+    p_i = tracks[i, k]
+    p_j = tracks[j, k]
+    tracks[i, k] = p_j
+    tracks[j, k] = p_i
+    if p_j != -1:
+        row_of[p_j] = i
+        row_len[i] += 1
+        row_len[j] -= 1
+    if p_i != -1:
+        row_of[p_i] = j
+        row_len[j] += 1
+        row_len[i] -= 1
+
+
+@nb.njit(cache=True, nogil=True)  # type: ignore[untyped-decorator]
+def _initial_link(
+    features_lat: NDArray[np.float64],
+    features_lon: NDArray[np.float64],
+    step_offsets: NDArray[np.int64],
+    zones: NDArray[np.float64],
+    default_dmax: float,
+) -> NDArray[np.int64]:
+    """
+    Seeds tracks by greedy nearest-neighbor linking of consecutive frames.
 
-            if valid_swap:
-                gain = (costs[i] + costs[j]) - (new_cost_i + new_cost_j)
-                if gain > best_gain:
-                    best_gain = gain
-                    best_i = i
-                    best_j = j
+    Track tails are visited in row order and each takes the nearest unused
+    feature of the next frame within the search radius; unlinked features
+    start new rows in feature order.
 
-            # Revert swap for next pair check
-            tracks[i, target_k] = p_i_orig
-            tracks[j, target_k] = p_j_orig
+    Args:
+        features_lat, features_lon: Flat arrays of all feature coordinates.
+        step_offsets: Offsets of each frame's features in the flat arrays.
+        zones: Regional dmax definitions.
+        default_dmax: Default search radius.
 
-    return best_i, best_j
+    Returns:
+        The track matrix [n_tracks, n_frames] of feature indices (-1 if none).
+    """
+    n_frames = len(step_offsets) - 1
+    n_features = step_offsets[n_frames]
+    deg_to_rad = np.pi / 180.0
+
+    # Regional dmax of every feature, looked up once
+    feature_dmax = np.empty(n_features)
+    for f in range(n_features):
+        feature_dmax[f] = get_regional_dmax(
+            features_lat[f], features_lon[f], zones, default_dmax
+        )
+
+    # Track row of every feature, and the tails at the current frame in row
+    # order (linked tails keep their order and new rows come after them)
+    row_of = np.empty(n_features, dtype=np.int64)
+    used = np.zeros(n_features, dtype=np.bool_)
+    tails = np.empty(n_features, dtype=np.int64)
+    next_tails = np.empty(n_features, dtype=np.int64)
+    n_tails = step_offsets[1]
+    for f in range(n_tails):
+        row_of[f] = f
+        tails[f] = f
+    n_rows = n_tails
+
+    for k in range(n_frames - 1):
+        start = step_offsets[k + 1]
+        stop = step_offsets[k + 2]
+        n_next = 0
+        for t in range(n_tails):
+            idx_k = tails[t]
+            lat_k = features_lat[idx_k]
+            lon_k = features_lon[idx_k]
+            best_dist = 1e30
+            best_feat = -1
+            for f in range(start, stop):
+                if used[f]:
+                    continue
+                dmax_eff = 0.5 * (feature_dmax[idx_k] + feature_dmax[f])
+                dist = geod_dist(lat_k, lon_k, features_lat[f], features_lon[f])
+                if dist < dmax_eff * deg_to_rad and dist < best_dist:
+                    best_dist = dist
+                    best_feat = f
+            if best_feat != -1:
+                used[best_feat] = True
+                row_of[best_feat] = row_of[idx_k]
+                next_tails[n_next] = best_feat
+                n_next += 1
+
+        # Unlinked features start new tracks
+        for f in range(start, stop):
+            if not used[f]:
+                row_of[f] = n_rows
+                n_rows += 1
+                next_tails[n_next] = f
+                n_next += 1
+        tails, next_tails = next_tails, tails
+        n_tails = n_next
+
+    out = np.full((n_rows, n_frames), -1, dtype=np.int64)
+    for k in range(n_frames):
+        for f in range(step_offsets[k], step_offsets[k + 1]):
+            out[row_of[f], k] = f
+    return out
+
+
+@nb.njit(cache=True, nogil=True)  # type: ignore[untyped-decorator]
+def _grow_rows(
+    tracks: NDArray[np.int64], n_rows: int, min_rows: int
+) -> NDArray[np.int64]:
+    """
+    Returns a copy of the first ``n_rows`` rows of the track matrix with room
+    for at least ``min_rows`` rows, growing the capacity by half at least.
+    Rows past ``n_rows`` are empty (-1).
+    """
+    capacity = max(min_rows, tracks.shape[0] + tracks.shape[0] // 2)
+    out = np.full((capacity, tracks.shape[1]), -1, dtype=np.int64)
+    out[:n_rows] = tracks[:n_rows]
+    return out
 
 
 @nb.njit(cache=True, nogil=True)  # type: ignore[untyped-decorator]
@@ -536,7 +916,7 @@ def _initial_break_pass(
     w2: float,
     phimax: float,
     adapt_params: NDArray[np.float64],
-) -> NDArray[np.int64]:
+) -> tuple[NDArray[np.int64], int]:
     """
     Identifies tracks that violate smoothness constraints after initial linking
     and breaks them into separate tracks.
@@ -549,10 +929,12 @@ def _initial_break_pass(
         adapt_params: Adaptive smoothness definitions.
 
     Returns:
-        A new track matrix with broken tracks appended as new rows.
+        A new track matrix with each piece of a broken track in its own row,
+        with spare empty rows at the end, and the number of used rows.
     """
     n_tracks, n_frames = tracks.shape
-    new_tracks_list = []
+    out = np.full((n_tracks + n_tracks // 4 + 1, n_frames), -1, dtype=np.int64)
+    n_out = 0
     rad_to_deg = 180.0 / np.pi
 
     for i in range(n_tracks):
@@ -593,26 +975,27 @@ def _initial_break_pass(
 
                 if cost > phi_max:
                     # Break track at point k
-                    new_tr = np.full(n_frames, -1, dtype=np.int64)
-                    new_tr[last_break : k + 1] = current_track[last_break : k + 1]
-                    new_tracks_list.append(new_tr)
+                    if n_out == out.shape[0]:
+                        out = _grow_rows(out, n_out, n_out + 1)
+                    out[n_out, last_break : k + 1] = current_track[last_break : k + 1]
+                    n_out += 1
                     last_break = k + 1
 
         # Add remaining part
-        new_tr = np.full(n_frames, -1, dtype=np.int64)
-        new_tr[last_break:] = current_track[last_break:]
-        new_tracks_list.append(new_tr)
-
-    # Convert list to 2D array
-    out = np.full((len(new_tracks_list), n_frames), -1, dtype=np.int64)
-    for i in range(len(new_tracks_list)):
-        out[i] = new_tracks_list[i]
-    return out
+        if n_out == out.shape[0]:
+            out = _grow_rows(out, n_out, n_out + 1)
+        out[n_out, last_break:] = current_track[last_break:]
+        n_out += 1
+
+    return out, n_out
 
 
 @nb.njit(cache=True, nogil=True)  # type: ignore[untyped-decorator]
 def _break_track(
     tracks: NDArray[np.int64],
+    n_rows: int,
+    row_of: NDArray[np.int64],
+    row_len: NDArray[np.int64],
     track_idx: int,
     k: int,
     features_lat: NDArray[np.float64],
@@ -620,7 +1003,7 @@ def _break_track(
     zones: NDArray[np.float64],
     default_dmax: float,
     forward: bool,
-) -> NDArray[np.int64]:
+) -> int:
     """
     Breaks a track at frame k if the displacement to the next/previous point
     violates the search radius constraint.
@@ -628,7 +1011,11 @@ def _break_track(
     This matches the TRACK 'track_fail' behavior.
 
     Args:
-        tracks: The track matrix.
+        tracks: The track matrix, with at least one empty row after the first
+            ``n_rows``.
+        n_rows: Number of used rows of the track matrix.
+        row_of, row_len: Row index of the track matrix (see ``_index_rows``),
+            updated for the moved points; row_len covers the spare rows.
         track_idx: Index of the track to check.
         k: Frame index where the potential break starts.
         features_lat, features_lon: Coordinate arrays.
@@ -637,20 +1024,21 @@ def _break_track(
         forward: If True, check k to k+1; otherwise k to k-1.
 
     Returns:
-        The updated track matrix (potentially with a new row).
+        The number of used rows after the break (the broken-off part is moved
+        to row ``n_rows``).
     """
-    n_tracks, n_frames = tracks.shape
+    n_frames = tracks.shape[1]
     deg_to_rad = np.pi / 180.0
 
     target_k = k + 1 if forward else k - 1
     if target_k < 0 or target_k >= n_frames:
-        return tracks
+        return n_rows
 
     idx1 = tracks[track_idx, k]
     idx2 = tracks[track_idx, target_k]
 
     if idx1 == -1 or idx2 == -1:
-        return tracks
+        return n_rows
 
     lat1, lon1 = features_lat[idx1], features_lon[idx1]
     lat2, lon2 = features_lat[idx2], features_lon[idx2]
@@ -661,25 +1049,26 @@ def _break_track(
     )
 
     if geod_dist(lat1, lon1, lat2, lon2) > dmax_eff * deg_to_rad:
-        # Violation! Break the track.
-        new_tr = np.full(n_frames, -1, dtype=np.int64)
+        # Violation! Break the track into the next empty row.
+        new_tr = tracks[n_rows]
+        new_tr[:] = -1
         if forward:
             # Move k+1 onwards to a new track
-            new_tr[target_k:] = tracks[track_idx, target_k:]
-            tracks[track_idx, target_k:] = -1
+            start, stop = target_k, n_frames
         else:
             # Move k-1 backwards to a new track
-            new_tr[:k] = tracks[track_idx, :k]
-            tracks[track_idx, :k] = -1
-
-        # Append new track as a new row
-        # (Numba cannot easily resize the matrix, so we return a new one)
-        out = np.zeros((n_tracks + 1, n_frames), dtype=np.int64)
-        out[:n_tracks] = tracks
-        out[n_tracks] = new_tr
-        return out
-
-    return tracks
+            start, stop = 0, k
+        for t in range(start, stop):
+            f = tracks[track_idx, t]
+            if f != -1:
+                new_tr[t] = f
+                tracks[track_idx, t] = -1
+                row_of[f] = n_rows
+                row_len[n_rows] += 1
+                row_len[track_idx] -= 1
+        return n_rows + 1
+
+    return n_rows
 
 
 @nb.njit(cache=True, nogil=True)  # type: ignore[untyped-decorator]
@@ -1,18 +1,23 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 import numpy as np
 from numpy.typing import NDArray
 
 from ..models.center import Center
-from ..models.geo import geod_dist
 from ..models.tracker import RawDetectionStep
 from ..models.tracks import Tracks
 from . import constants
 from .kernels import (
     _break_track,
+    _grow_rows,
+    _index_rows,
     _initial_break_pass,
+    _initial_link,
     _mge_iteration,
-    get_regional_dmax,
+    _mge_search_frames,
+    _swap_points,
 )
 
 
@@ -35,6 +40,8 @@ class HodgesLinker:
         max_missing: int = constants.MISSING_DEFAULT,
         zones: NDArray[np.float64] = constants.TRACK_ZONES,
         adapt_params: NDArray[np.float64] = constants.ADAPT_PARAMS,
+        compact: bool = False,
+        parallel: bool = False,
     ) -> None:
         """
         Initialize the MGE linker.
@@ -47,6 +54,11 @@ class HodgesLinker:
             max_missing: Maximum consecutive phantom points allowed.
             zones: Regional dmax definitions.
             adapt_params: Piecewise linear adaptive smoothness parameters (2xN).
+            compact: Build the output Tracks with compact (float32) storage.
+            parallel: Search groups of independent frames of each MGE pass
+                concurrently (see ``_sweep_parallel``). The tracks are
+                deterministic but can differ from the default sequential
+                sweep, which reproduces the original frame order exactly.
         """
         self.w1 = w1
         self.w2 = w2
@@ -56,6 +68,8 @@ class HodgesLinker:
         self.max_missing = max_missing
         self.zones = zones
         self.adapt_params = adapt_params
+        self.compact = compact
+        self.parallel = parallel
 
     def link(self, detections: list[RawDetectionStep]) -> Tracks:
         """
@@ -69,7 +83,7 @@ class HodgesLinker:
         """
         n_frames = len(detections)
         if n_frames < 2:
-            return Tracks()
+            return Tracks(compact=self.compact)
 
         # 1. Flatten features and store offsets for mapping to track matrix
         all_lats: list[float] = []
@@ -91,77 +105,13 @@ class HodgesLinker:
 
         # 2. Initial Linking (Greedy Nearest Neighbor)
         # Seed tracks with points from the first frame
-        n_init = step_offsets[1]
-        track_matrix = np.full((n_init, n_frames), -1, dtype=np.int64)
-        for i in range(n_init):
-            track_matrix[i, 0] = i
-
-        current_n_tracks = n_init
-        deg_to_rad = np.pi / 180.0
-
-        for k in range(n_frames - 1):
-            features_kp1 = np.arange(step_offsets[k + 1], step_offsets[k + 2])
-            used_kp1 = np.zeros(len(features_kp1), dtype=bool)
-
-            # Match existing track tails to features in the next frame
-            for t_idx in range(current_n_tracks):
-                idx_k = track_matrix[t_idx, k]
-                if idx_k == -1:
-                    continue
-
-                best_dist = 1e30
-                best_feat = -1
-                for f_idx, f_global in enumerate(features_kp1):
-                    if used_kp1[f_idx]:
-                        continue
-
-                    # Determine effective dmax based on zones
-                    dmax_eff = 0.5 * (
-                        get_regional_dmax(
-                            features_lat[idx_k],
-                            features_lon[idx_k],
-                            self.zones,
-                            self.dmax,
-                        )
-                        + get_regional_dmax(
-                            features_lat[f_global],
-                            features_lon[f_global],
-                            self.zones,
-                            self.dmax,
-                        )
-                    )
-
-                    dist = geod_dist(
-                        features_lat[idx_k],
-                        features_lon[idx_k],
-                        features_lat[f_global],
-                        features_lon[f_global],
-                    )
-                    if dist < dmax_eff * deg_to_rad and dist < best_dist:
-                        best_dist, best_feat = dist, f_idx
-
-                if best_feat != -1:
-                    track_matrix[t_idx, k + 1] = features_kp1[best_feat]
-                    used_kp1[best_feat] = True
-
-            # Unlinked features start new tracks
-            unlinked_indices = []
-            for i in range(len(features_kp1)):
-                if not used_kp1[i]:
-                    unlinked_indices.append(features_kp1[i])
-
-            if unlinked_indices:
-                new_rows = np.full(
-                    (len(unlinked_indices), n_frames), -1, dtype=np.int64
-                )
-                for i, f_global in enumerate(unlinked_indices):
-                    new_rows[i, k + 1] = f_global
-                track_matrix = np.vstack((track_matrix, new_rows))
-                current_n_tracks += len(unlinked_indices)
+        track_matrix = _initial_link(
+            features_lat, features_lon, step_offsets, self.zones, self.dmax
+        )
 
         # 3. Initial Smoothness Breaking Pass
         # Breaks tracks that violate adaptive smoothness right after linking
-        track_matrix = _initial_break_pass(
+        track_matrix, n_rows = _initial_break_pass(
             track_matrix,
             features_lat,
             features_lon,
@@ -170,113 +120,27 @@ class HodgesLinker:
             self.phimax,
             self.adapt_params,
         )
+        state = _MGEState.from_matrix(
+            track_matrix, n_rows, step_offsets, self.max_missing
+        )
 
         # 4. MGE Optimization (Iterate until convergence)
+        # Frames are only searched again once a swap or break nearby may have
+        # changed their best swap, so later passes cost in proportion to the
+        # changes of the previous one.
+        sweep = self._sweep_parallel if self.parallel else self._sweep
         for _ in range(self.n_iterations):
-            changed = False
-            # Forward Pass: one best swap per frame
-            for k in range(1, n_frames - 1):
-                best_i, best_j = _mge_iteration(
-                    track_matrix,
-                    features_lat,
-                    features_lon,
-                    k,
-                    True,
-                    self.w1,
-                    self.w2,
-                    self.dmax,
-                    self.phimax,
-                    self.zones,
-                    self.adapt_params,
-                    self.max_missing,
-                )
-                if best_i != -1:
-                    # Apply swap
-                    p_i = track_matrix[best_i, k + 1]
-                    p_j = track_matrix[best_j, k + 1]
-                    track_matrix[best_i, k + 1] = p_j
-                    track_matrix[best_j, k + 1] = p_i
-                    changed = True
-
-                    # Track Fail Check (Post-swap displacement violation)
-                    # If swapping p_i/p_j at k+1 causes displacement violation
-                    # at k+1 to k+2, break track
-                    if k + 2 < n_frames:
-                        track_matrix = _break_track(
-                            track_matrix,
-                            best_i,
-                            k + 1,
-                            features_lat,
-                            features_lon,
-                            self.zones,
-                            self.dmax,
-                            True,
-                        )
-                        track_matrix = _break_track(
-                            track_matrix,
-                            best_j,
-                            k + 1,
-                            features_lat,
-                            features_lon,
-                            self.zones,
-                            self.dmax,
-                            True,
-                        )
-
-            # Backward Pass: one best swap per frame
-            for k in range(n_frames - 2, 0, -1):
-                best_i, best_j = _mge_iteration(
-                    track_matrix,
-                    features_lat,
-                    features_lon,
-                    k,
-                    False,
-                    self.w1,
-                    self.w2,
-                    self.dmax,
-                    self.phimax,
-                    self.zones,
-                    self.adapt_params,
-                    self.max_missing,
-                )
-                if best_i != -1:
-                    # Apply swap
-                    p_i = track_matrix[best_i, k - 1]
-                    p_j = track_matrix[best_j, k - 1]
-                    track_matrix[best_i, k - 1] = p_j
-                    track_matrix[best_j, k - 1] = p_i
-                    changed = True
-
-                    # Track Fail Check (Post-swap displacement violation)
-                    # If swapping at k-1 causes displacement violation at k-1 to k-2,
-                    # break track
-                    if k - 2 >= 0:
-                        track_matrix = _break_track(
-                            track_matrix,
-                            best_i,
-                            k - 1,
-                            features_lat,
-                            features_lon,
-                            self.zones,
-                            self.dmax,
-                            False,
-                        )
-                        track_matrix = _break_track(
-                            track_matrix,
-                            best_j,
-                            k - 1,
-                            features_lat,
-                            features_lon,
-                            self.zones,
-                            self.dmax,
-                            False,
-                        )
-
+            # Forward pass, then backward pass
+            changed = sweep(state, features_lat, features_lon, True)
+            changed |= sweep(state, features_lat, features_lon, False)
             if not changed:
                 break
 
+        track_matrix, n_rows = state.tracks, state.n_rows
+
         # 5. Convert track_matrix back to PyStormTracker's Tracks model
-        tracks = Tracks()
+        track_matrix = track_matrix[:n_rows]
+        tracks = Tracks(compact=self.compact)
         times = [d[0] for d in detections]
         for t_idx in range(track_matrix.shape[0]):
             centers: list[Center] = []
@@ -301,4 +165,280 @@ class HodgesLinker:
                     consecutive_missing += 1
             if centers:
                 tracks.add_track(centers)
-        return tracks
+        return tracks.finalize()
+
+    def _sweep(
+        self,
+        state: _MGEState,
+        features_lat: NDArray[np.float64],
+        features_lon: NDArray[np.float64],
+        forward: bool,
+    ) -> bool:
+        """
+        One MGE pass over the frames in time order (reversed if not
+        ``forward``), applying the best swap of each frame before searching
+        the next. Returns whether any swap was made.
+        """
+        n_frames = state.tracks.shape[1]
+        direction = 0 if forward else 1
+        frames = range(1, n_frames - 1) if forward else range(n_frames - 2, 0, -1)
+        changed = False
+        for k in frames:
+            if not state.stale[direction, k]:
+                continue
+            state.stale[direction, k] = False
+            best_i, best_j = self._search(state, features_lat, features_lon, k, forward)
+            if best_i != -1:
+                self._apply(
+                    state, features_lat, features_lon, best_i, best_j, k, forward
+                )
+                changed = True
+        return changed
+
+    def _sweep_parallel(
+        self,
+        state: _MGEState,
+        features_lat: NDArray[np.float64],
+        features_lon: NDArray[np.float64],
+        forward: bool,
+    ) -> bool:
+        """
+        One MGE pass with the frames split into groups searched concurrently.
+
+        Frames ``reach + 2`` apart do not see each other's swaps, so the
+        frames are dealt round-robin into that many groups (a red-black
+        ordering generalised to more colours). The frames of a group are
+        searched in parallel against the same tracks and their swaps applied
+        in sweep order. A frame whose best swap may have been changed by a
+        break applied before it in the same group is searched again, so every
+        swap made is the best one for the tracks it is applied to. The result
+        only depends on the inputs, not on the number of threads, but the
+        frames are visited in a different order than by ``_sweep``.
+
+        The swaps of later groups can make frames of earlier groups stale
+        again, so more frames are searched than by ``_sweep`` and this only
+        pays off with several cores.
+        """
+        n_frames = state.tracks.shape[1]
+        direction = 0 if forward else 1
+        frames = np.arange(1, n_frames - 1)
+        if not forward:
+            frames = frames[::-1]
+        stride = state.reach + 2
+        changed = False
+        for color in range(stride):
+            group = frames[color::stride]
+            pending = group[state.stale[direction, group]]
+            while len(pending):
+                state.stale[direction, pending] = False
+                n = state.n_rows
+                found = _mge_search_frames(
+                    state.tracks[:n],
+                    features_lat,
+                    features_lon,
+                    pending,
+                    forward,
+                    self.w1,
+                    self.w2,
+                    self.dmax,
+                    self.phimax,
+                    self.zones,
+                    self.adapt_params,
+                    self.max_missing,
+                    state.step_offsets,
+                    state.row_of,
+                    state.row_len,
+                    state.costs,
+                )
+                redo = np.zeros(len(pending), dtype=np.bool_)
+                for pos, k in enumerate(pending):
+                    if state.stale[direction, k]:
+                        redo[pos] = True
+                        continue
+                    best_i, best_j = int(found[pos, 0]), int(found[pos, 1])
+                    if best_i != -1:
+                        self._apply(
+                            state,
+                            features_lat,
+                            features_lon,
+                            best_i,
+                            best_j,
+                            int(k),
+                            forward,
+                        )
+                        changed = True
+                pending = pending[redo]
+        return changed
+
+    def _apply(
+        self,
+        state: _MGEState,
+        features_lat: NDArray[np.float64],
+        features_lon: NDArray[np.float64],
+        best_i: int,
+        best_j: int,
+        k: int,
+        forward: bool,
+    ) -> None:
+        """Applies the swap found at frame k."""
+        target_k = k + 1 if forward else k - 1
+        state.swap(best_i, best_j, target_k)
+
+        # Track Fail Check (Post-swap displacement violation)
+        # If swapping p_i/p_j at target_k causes displacement violation
+        # between target_k and the next frame in the sweep, break track
+        if 0 <= 2 * target_k - k < state.tracks.shape[1]:
+            for row in (best_i, best_j):
+                state.break_track(
+                    row,
+                    target_k,
+                    forward,
+                    features_lat,
+                    features_lon,
+                    self.zones,
+                    self.dmax,
+                )
+
+    def _search(
+        self,
+        state: _MGEState,
+        features_lat: NDArray[np.float64],
+        features_lon: NDArray[np.float64],
+        k: int,
+        forward: bool,
+    ) -> tuple[int, int]:
+        """Best swap at frame k of the current tracks (see ``_mge_iteration``)."""
+        n = state.n_rows
+        best_i, best_j = _mge_iteration(
+            state.tracks[:n],
+            features_lat,
+            features_lon,
+            k,
+            forward,
+            self.w1,
+            self.w2,
+            self.dmax,
+            self.phimax,
+            self.zones,
+            self.adapt_params,
+            self.max_missing,
+            state.step_offsets,
+            state.row_of,
+            state.row_len,
+            state.costs,
+        )
+        return int(best_i), int(best_j)
+
+
+@dataclass(slots=True)
+class _MGEState:
+    """
+    Track matrix under MGE optimization, with the indexes kept in sync with it.
+
+    Rows past ``n_rows`` are spare room for tracks broken off during MGE,
+    grown geometrically when they run out.
+    """
+
+    tracks: NDArray[np.int64]
+    n_rows: int
+    step_offsets: NDArray[np.int64]
+    # Track row of every feature and number of points of every row
+    row_of: NDArray[np.int64]
+    row_len: NDArray[np.int64]
+    # Cost of every track at every frame, NaN until computed
+    costs: NDArray[np.float64]
+    # Frames (forward, backward) whose best swap may have changed since they
+    # were last searched
+    stale: NDArray[np.bool_]
+    # Number of empty rows, and frames around a change that it may affect
+    n_empty: int
+    reach: int
+    max_missing: int
+
+    @classmethod
+    def from_matrix(
+        cls,
+        tracks: NDArray[np.int64],
+        n_rows: int,
+        step_offsets: NDArray[np.int64],
+        max_missing: int,
+    ) -> _MGEState:
+        row_of, row_len = _index_rows(tracks, int(step_offsets[-1]))
+        return cls(
+            tracks=tracks,
+            n_rows=n_rows,
+            step_offsets=step_offsets,
+            row_of=row_of,
+            row_len=row_len,
+            costs=np.full(tracks.shape, np.nan),
+            stale=np.ones((2, tracks.shape[1]), dtype=np.bool_),
+            n_empty=int(np.count_nonzero(row_len[:n_rows] == 0)),
+            # A frame's search sees points up to max_missing + 2 frames away
+            reach=max(max_missing, 0) + 3,
+            max_missing=max_missing,
+        )
+
+    def _changed(self, row: int, start: int, stop: int) -> None:
+        """Invalidates what depends on frames ``start:stop`` of ``row``."""
+        n_frames = self.tracks.shape[1]
+        self.costs[row, max(start - 1, 0) : min(stop + 1, n_frames)] = np.nan
+        self.stale[:, max(start - self.reach, 0) : min(stop + self.reach, n_frames)] = (
+            True
+        )
+
+    def _set_empty(self, n_empty: int) -> None:
+        # A first empty row can take points at any frame
+        if self.n_empty == 0 and n_empty > 0 and self.max_missing >= 0:
+            self.stale[:] = True
+        self.n_empty = n_empty
+
+    def swap(self, i: int, j: int, k: int) -> None:
+        """Swaps the points of tracks i and j at frame k."""
+        was_empty = int(self.row_len[i] == 0) + int(self.row_len[j] == 0)
+        _swap_points(self.tracks, self.row_of, self.row_len, i, j, k)
+        is_empty = int(self.row_len[i] == 0) + int(self.row_len[j] == 0)
+        self._set_empty(self.n_empty + is_empty - was_empty)
+        self._changed(i, k, k + 1)
+        self._changed(j, k, k + 1)
+
+    def break_track(
+        self,
+        row: int,
+        k: int,
+        forward: bool,
+        features_lat: NDArray[np.float64],
+        features_lon: NDArray[np.float64],
+        zones: NDArray[np.float64],
+        dmax: float,
+    ) -> None:
+        """Breaks a track at frame k on a displacement violation (see
+        ``_break_track``)."""
+        n = self.n_rows
+        if n + 1 > len(self.tracks):
+            self.tracks = _grow_rows(self.tracks, n, n + 1)
+            extra = len(self.tracks) - len(self.row_len)
+            self.row_len = np.pad(self.row_len, (0, extra))
+            self.costs = np.pad(
+                self.costs, ((0, extra), (0, 0)), constant_values=np.nan
+            )
+        self.n_rows = _break_track(
+            self.tracks,
+            n,
+            self.row_of,
+            self.row_len,
+            row,
+            k,
+            features_lat,
+            features_lon,
+            zones,
+            dmax,
+            forward,
+        )
+        if self.n_rows > n:
+            start, stop = (k + 1, self.tracks.shape[1]) if forward else (0, k)
+            self._changed(row, start, stop)
+            self._changed(n, start, stop)
+            # With unlimited gaps, any row beyond the searched ones can take
+            # points
+            if self.max_missing < 0:
+                self.stale[:] = True
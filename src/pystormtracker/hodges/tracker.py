@@ -8,7 +8,7 @@ from numpy.typing import NDArray
 
 from ..models import constants as model_constants
 from ..models.tracker import Tracker
-from ..models.tracks import Tracks
+from ..models.tracks import Track, Tracks
 from ..preprocessing.spectral import SpectralFilter
 from ..preprocessing.taper import TaperFilter
 from . import constants
@@ -36,6 +36,8 @@ class HodgesTracker(Tracker):
         zones: NDArray[np.float64] | None = None,
         adapt_params: NDArray[np.float64] | None = None,
         use_standard_constraints: bool = True,
+        compact: bool = False,
+        parallel_mge: bool = False,
     ) -> None:
         """
         Initialize the Hodges Tracker.
@@ -52,6 +54,9 @@ class HodgesTracker(Tracker):
             adapt_params: Adaptive smoothness parameters (2x4 array).
             use_standard_constraints: If True, use legacy standard zones/adaptive
                 values if None provided.
+            compact: Store the output tracks with compact (float32) storage.
+            parallel_mge: Search independent frames of each MGE pass in
+                parallel (see ``HodgesLinker``).
         """
         self.w1 = w1
         self.w2 = w2
@@ -60,6 +65,8 @@ class HodgesTracker(Tracker):
         self.n_iterations = n_iterations
         self.min_lifetime = min_lifetime
         self.max_missing = max_missing
+        self.compact = compact
+        self.parallel_mge = parallel_mge
 
         if zones is None:
             if use_standard_constraints:
@@ -166,41 +173,49 @@ class HodgesTracker(Tracker):
         Matching logic: if tracks in chunk N end with same points as chunk N+1 head.
         """
         if not tracks_all:
-            return Tracks()
+            return Tracks(compact=self.compact)
 
         final_tracks = tracks_all[0]
 
         for i in range(1, len(tracks_all)):
             next_chunk = tracks_all[i]
-            matched_next_indices = set()
-            current_tails = list(final_tracks)
-
-            for tr_tail in current_tails:
-                last_pt = tr_tail[-1]
-
-                for idx_next, tr_next in enumerate(next_chunk):
-                    if idx_next in matched_next_indices:
-                        continue
-
-                    first_pt = tr_next[0]
-
-                    # Match if time, lat, lon are identical
-                    if (
-                        last_pt.time == first_pt.time
-                        and abs(last_pt.lat - first_pt.lat) < 1e-5
-                        and abs(last_pt.lon - first_pt.lon) < 1e-5
-                    ):
-                        # Splice: extend skipping the first overlapping point
-                        for j in range(1, len(tr_next)):
-                            tr_tail.append(tr_next[j])
-
-                        matched_next_indices.add(idx_next)
-                        break
+            next_list = list(next_chunk)
+            head_times = np.array([tr.times[0] for tr in next_list])
+            head_lats = np.array([tr.lats[0] for tr in next_list])
+            head_lons = np.array([tr.lons[0] for tr in next_list])
+            matched = np.zeros(len(next_list), dtype=bool)
+
+            # Pair each tail with the first unmatched head at its last point.
+            # Splicing only touches the matched tail, so appends are deferred.
+            spliced: list[tuple[Track, Track]] = []
+            for tr_tail in list(final_tracks):
+                hits = np.flatnonzero(
+                    ~matched
+                    & (head_times == tr_tail.times[-1])
+                    & (np.abs(tr_tail.lats[-1] - head_lats) < 1e-5)
+                    & (np.abs(tr_tail.lons[-1] - head_lons) < 1e-5)
+                )
+                if len(hits) > 0:
+                    matched[hits[0]] = True
+                    spliced.append((tr_tail, next_list[hits[0]]))
+
+            # Splice: extend skipping the first overlapping point
+            if spliced:
+                ext = next_chunk.take([tr_next.track_id for _, tr_next in spliced])
+                lengths = ext.lengths
+                keep = np.ones(len(ext.track_ids), dtype=bool)
+                keep[np.cumsum(lengths) - lengths] = False
+                tail_ids = [tr_tail.track_id for tr_tail, _ in spliced]
+                final_tracks.bulk_append(
+                    np.repeat(np.array(tail_ids, dtype=np.int64), lengths - 1),
+                    ext.times[keep],
+                    ext.lats[keep],
+                    ext.lons[keep],
+                    {k: v[keep] for k, v in ext.vars.items()},
+                )
 
             # Add unmatched tracks from next_chunk as new tracks
-            for idx_next, tr_next in enumerate(next_chunk):
-                if idx_next not in matched_next_indices:
-                    final_tracks.append(tr_next)
+            final_tracks = Tracks.concat([final_tracks, next_chunk.filter(~matched)])
 
         return final_tracks
 
@@ -214,7 +229,7 @@ class HodgesTracker(Tracker):
         map_proj: Literal["global", "nh_stereo", "sh_stereo", "healpix"] = "global",
         resolution: float = 100.0,
         extent: MapExtent | None = None,
-        backend: Literal["serial", "mpi", "dask"] = "serial",
+        backend: Literal["serial", "mpi", "dask", "processes"] = "serial",
         n_workers: int | None = None,
         max_chunk_size: int | None = None,
         threshold: float | None = None,
@@ -249,6 +264,11 @@ class HodgesTracker(Tracker):
         """
         import timeit
 
+        if backend == "processes":
+            raise ValueError(
+                "The processes backend is only available for the simple tracker"
+            )
+
         t_total_start = timeit.default_timer()
 
         # 1. Load and optionally filter data
@@ -366,6 +386,8 @@ class HodgesTracker(Tracker):
             max_missing=self.max_missing,
             zones=self.zones,
             adapt_params=self.adapt_params,
+            compact=self.compact,
+            parallel=self.parallel_mge,
         )
 
         tracks = linker.link(detections)
@@ -373,13 +395,4 @@ class HodgesTracker(Tracker):
         print(f"    [Serial] Linking time: {t_link_end - t_link_start:.4f}s")
 
         # 3. Pruning
-        valid_tracks = []
-        for tr in tracks:
-            if len(tr) >= self.min_lifetime:
-                valid_tracks.append(tr)
-
-        out = Tracks()
-        for tr in valid_tracks:
-            out.append(tr)
-
-        return out
+        return tracks.filter(tracks.lengths >= self.min_lifetime)
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
     from ..models.tracks import Tracks
 
@@ -33,9 +35,15 @@ def write_hodges(tracks: Tracks, outfile: str) -> None:
 
             # TRACK format: time_step_idx longitude latitude intensity
             # [additional_fields]
-            for i, center in enumerate(track, start=1):
-                intensity = center.vars.get(varname, 0.0)
-                # Ensure longitude is in [0, 360] as per standard TRACK
-                lon = center.lon % 360.0
-
-                f.write(f"{i:d} {lon:10.6f} {center.lat:10.6f} {intensity:12.6e}\n")
+            lats = track.lats
+            intensity = track.vars.get(varname)
+            if intensity is None:
+                intensity = np.zeros(n_points)
+            # Ensure longitude is in [0, 360] as per standard TRACK
+            lons = track.lons % 360.0
+
+            for i, (lon, lat, val) in enumerate(
+                zip(lons.tolist(), lats.tolist(), intensity.tolist(), strict=True),
+                start=1,
+            ):
+                f.write(f"{i:d} {lon:10.6f} {lat:10.6f} {val:12.6e}\n")
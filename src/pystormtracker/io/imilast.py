@@ -105,15 +105,48 @@ def write_imilast(tracks: Tracks, outfile: str | Path, decimal_places: int = 6)
         )
         f.write(header)
 
-        t0 = np.datetime64("1970-01-01T00:00:00")
+        key = var_header.lower()
+        first_key = next(iter(tracks.vars), None)
+        track_type = tracks.track_type.lower()
 
         for i, track in enumerate(tracks, start=1):
-            f.write(f"90 {i} {len(track)}\n")
-            for step, center in enumerate(track, start=1):
+            columns = track.vars
+            times = track.times
+            f.write(f"90 {i} {len(times)}\n")
+
+            # Use the key corresponding to var_header if it exists in vars,
+            # falling back to the first variable where it is missing
+            vals = columns.get(key)
+            if first_key is None:
+                vals = np.full(len(times), np.nan)
+            elif vals is None:
+                vals = columns[first_key]
+            else:
+                vals = np.where(np.isnan(vals), columns[first_key], vals)
+
+            # Unit conversion for standard variables, in double precision
+            # for compact (float32) tracks
+            vals = np.asarray(vals, dtype=np.float64)
+            if track_type == "msl":
+                vals = vals * 0.01  # Pa -> hPa
+            elif track_type == "vo":
+                vals = vals * 1e5  # s^-1 -> 10^-5 s^-1
+
+            lons = track.lons
+            lons = np.where(lons > 180, lons - 360, lons)
+            # Integer timestamps avoid float precision issues
+            secs = times.astype("datetime64[s]").astype(np.int64)
+            rows = zip(
+                secs.tolist(),
+                lons.tolist(),
+                track.lats.tolist(),
+                vals.tolist(),
+                strict=True,
+            )
+
+            for step, (ts, lon, lat, val) in enumerate(rows, start=1):
                 try:
-                    ts = (center.time - t0) / np.timedelta64(1, "s")
-                    # Use integer timestamp for datetime to avoid float precision issues
-                    dt = datetime.fromtimestamp(int(ts), tz=UTC)
+                    dt = datetime.fromtimestamp(ts, tz=UTC)
                     yyyymmddhh = dt.strftime("%Y%m%d%H")
                     yyyy, mm, dd, hh = dt.year, dt.month, dt.day, dt.hour
                 except Exception:
@@ -121,25 +154,10 @@ def write_imilast(tracks: Tracks, outfile: str | Path, decimal_places: int = 6)
                     yyyy, mm, dd, hh = 0, 0, 0, 0
 
                 # Ensure intensity is formatted with enough precision for VO
-                # Use the key corresponding to var_header if it exists in vars
-                val = center.vars.get(var_header.lower(), np.nan)
-                if np.isnan(val):
-                    val = next(iter(center.vars.values())) if center.vars else np.nan
-
-                # Unit conversion for standard variables
-                if tracks.track_type.lower() == "msl":
-                    val *= 0.01  # Pa -> hPa
-                elif tracks.track_type.lower() == "vo":
-                    val *= 1e5  # s^-1 -> 10^-5 s^-1
-
-                var_val = f"{float(val):.{decimal_places}f}"
-
-                lon = center.lon
-                if lon > 180:
-                    lon -= 360
+                var_val = f"{val:.{decimal_places}f}"
 
                 f.write(
                     f"00 {i} {step} {yyyymmddhh} {yyyy} {mm:02d} "
-                    f"{dd:02d} {hh:02d} {lon:.2f} {center.lat:.2f} "
+                    f"{dd:02d} {hh:02d} {lon:.2f} {lat:.2f} "
                     f"{var_val}\n"
                 )
@@ -37,6 +37,17 @@ def infer_track_type(tracks: Tracks) -> str:
     return "unknown"
 
 
+def _as_float64(arr: NDArray[np.floating]) -> NDArray[np.float64]:
+    """
+    Widens a column to float64. Compact (float32) columns go through their
+    shortest decimal form so that e.g. 10.1 is written as 10.1, not as
+    10.100000381469727.
+    """
+    if arr.dtype == np.float32:
+        return arr.astype(str).astype(np.float64)
+    return np.asarray(arr, dtype=np.float64)
+
+
 def write_json(tracks: Tracks, outfile: str | Path) -> None:
     """
     Writes a Tracks object to the 'json' Hybrid Index format.
@@ -62,24 +73,34 @@ def write_json(tracks: Tracks, outfile: str | Path) -> None:
     track_type = infer_track_type(tracks)
     tracks.track_type = track_type
 
+    # Points are written track by track; regroup them if tracks are interleaved
+    summary = tracks.summary()
+    diff = np.diff(tracks.track_ids)
+    boundaries = np.where(diff != 0)[0] + 1
+    points = tracks
+    if len(boundaries) + 1 != len(summary):
+        points = tracks.take(summary.track_id)
+        boundaries = np.where(np.diff(points.track_ids) != 0)[0] + 1
+
     # 2. Scale MSL if in Pa (Heuristic: max abs > 500)
-    raw_strength = tracks.vars[var_key] if var_key else np.zeros_like(tracks.lats)
+    lats = _as_float64(points.lats)
+    lons = _as_float64(points.lons)
+    raw_strength = _as_float64(points.vars[var_key]) if var_key else np.zeros_like(lats)
+    scale = 1.0
     if track_type == "msl" and np.nanmax(np.abs(raw_strength)) > 500:
-        raw_strength = raw_strength / 100.0
+        scale = 100.0
+        raw_strength = raw_strength / scale
 
     # 3. Prepare SoA with NaN separators
-    diff = np.diff(tracks.track_ids)
-    boundaries = np.where(diff != 0)[0] + 1
-
     def inject_nans(
         arr: NDArray[np.float64], insert_val: float = np.nan
     ) -> NDArray[np.float64]:
         return np.insert(arr, boundaries, insert_val)
 
-    points_lat = inject_nans(tracks.lats).tolist()
-    points_lon = inject_nans(tracks.lons).tolist()
+    points_lat = inject_nans(lats).tolist()
+    points_lon = inject_nans(lons).tolist()
 
-    timestamps = tracks.times.astype("datetime64[ms]").astype(np.int64)
+    timestamps = points.times.astype("datetime64[ms]").astype(np.int64)
     points_time = np.insert(timestamps.astype(float), boundaries, np.nan)
     points_time_list = [None if np.isnan(x) else int(x) for x in points_time]
 
@@ -89,69 +110,53 @@ def write_json(tracks: Tracks, outfile: str | Path) -> None:
     points_lat_list = [None if np.isnan(x) else float(x) for x in points_lat]
     points_lon_list = [None if np.isnan(x) else float(x) for x in points_lon]
 
-    # 4. Generate metadata
-    tracks_meta = []
-    u_ids = tracks.unique_track_ids
-
-    start_indices = np.concatenate(([0], boundaries))
-    end_indices = np.concatenate((boundaries, [len(tracks.track_ids)]))
-
-    offsets = np.arange(len(start_indices))
-    new_start_indices = start_indices + offsets
-    new_end_indices = end_indices + offsets - 1
-
-    min_time = float("inf")
-    max_time = float("-inf")
-    min_strength = float("inf")
-    max_strength = float("-inf")
+    # 4. Generate metadata from the per-track summary
+    n_points = summary.n_points
+    new_start_indices = np.cumsum(n_points + 1) - n_points - 1
+    new_end_indices = new_start_indices + n_points - 1
 
-    for i, tid in enumerate(u_ids):
-        orig_s = start_indices[i]
-        orig_e = end_indices[i]
-
-        t_times = timestamps[orig_s:orig_e]
-        t_lats = tracks.lats[orig_s:orig_e]
-        t_lons = tracks.lons[orig_s:orig_e]
-        t_vals = raw_strength[orig_s:orig_e]
-
-        if track_type == "msl":
-            t_strength = float(np.min(t_vals))
-        else:
-            t_strength = float(np.max(t_vals))
-
-        min_strength = min(min_strength, float(np.min(t_vals)))
-        max_strength = max(max_strength, float(np.max(t_vals)))
-        min_time = min(min_time, int(t_times[0]))
-        max_time = max(max_time, int(t_times[-1]))
-
-        duration_hrs = float((t_times[-1] - t_times[0]) / (3600 * 1000))
-        from ..models.geo import geod_dist_km
-
-        disp = float(geod_dist_km(t_lats[0], t_lons[0], t_lats[-1], t_lons[-1]))
-
-        tracks_meta.append(
-            {
-                "track_id": int(tid),
-                "start": int(new_start_indices[i]),
-                "end": int(new_end_indices[i]),
-                "strength": t_strength,
-                "duration": duration_hrs,
-                "displacement": disp,
-            }
+    if var_key:
+        t_min = _as_float64(summary.var_min[var_key]) / scale
+        t_max = _as_float64(summary.var_max[var_key]) / scale
+    else:
+        t_min = t_max = np.zeros(len(summary))
+    strength = t_min if track_type == "msl" else t_max
+
+    duration_ms = summary.lifetime.astype("timedelta64[ms]").astype(np.int64)
+    duration = duration_ms / (3600 * 1000)
+    displacement = summary.displacement
+
+    tracks_meta = [
+        {
+            "track_id": tid,
+            "start": s,
+            "end": e,
+            "strength": st,
+            "duration": du,
+            "displacement": di,
+        }
+        for tid, s, e, st, du, di in zip(
+            summary.track_id.tolist(),
+            new_start_indices.tolist(),
+            new_end_indices.tolist(),
+            strength.tolist(),
+            duration.tolist(),
+            displacement.tolist(),
+            strict=True,
         )
+    ]
 
+    start_ms = summary.start.astype("datetime64[ms]").astype(np.int64)
+    end_ms = summary.end.astype("datetime64[ms]").astype(np.int64)
+    has_tracks = len(summary) > 0
     metadata = {
         "track_type": track_type,
-        "min_time": int(min_time) if min_time != float("inf") else 0,
-        "max_time": int(max_time) if max_time != float("-inf") else 0,
-        "min_strength": float(min_strength) if min_strength != float("inf") else 0.0,
-        "max_strength": float(max_strength) if max_strength != float("-inf") else 0.0,
-        "max_duration": float(max(t["duration"] for t in tracks_meta))
-        if tracks_meta
-        else 0.0,
-        "max_displacement": float(max(t["displacement"] for t in tracks_meta))
-        if tracks_meta
-        else 0.0,
+        "min_time": int(np.min(start_ms)) if has_tracks else 0,
+        "max_time": int(np.max(end_ms)) if has_tracks else 0,
+        "min_strength": float(np.min(t_min)) if has_tracks else 0.0,
+        "max_strength": float(np.max(t_max)) if has_tracks else 0.0,
+        "max_duration": float(np.max(duration)) if has_tracks else 0.0,
+        "max_displacement": float(np.max(displacement)) if has_tracks else 0.0,
     }
 
     json_data = {
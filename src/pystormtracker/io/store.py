@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ..models.tracks import TimeRange, Tracks
+
+STORE_FORMAT = "pystormtracker-tracks"
+STORE_VERSION = 1
+MANIFEST = "manifest.json"
+
+
+def write_store(tracks: Tracks, outdir: str | Path) -> None:
+    """
+    Writes tracks to a binary store: a directory with one ``.npy`` file per
+    column, the track offsets and a JSON manifest.
+
+    Points are written track by track in track order, so each track is a
+    contiguous slice of every column. Columns keep the storage profile of
+    ``tracks`` (see ``Tracks``).
+    """
+    path = Path(outdir)
+    path.mkdir(parents=True, exist_ok=True)
+
+    index = tracks._get_index()
+    lengths = index.lengths[index.appearance]
+    offsets = np.concatenate(([0], np.cumsum(lengths))).astype(np.int64)
+    rows: NDArray[np.int64] | slice = index.rows_of(index.appearance)
+    if np.array_equal(rows, np.arange(len(tracks.track_ids))):
+        rows = slice(None)
+
+    n = len(tracks.track_ids)
+    columns: dict[str, NDArray[Any]] = {
+        "track_ids": tracks.track_ids[rows],
+        "times": tracks._times[:n][rows],
+        "lats": tracks.lats[rows],
+        "lons": tracks.lons[rows],
+        "offsets": offsets,
+    }
+    var_files = {}
+    for i, (k, v) in enumerate(tracks.vars.items()):
+        var_files[k] = f"var_{i}.npy"
+        columns[f"var_{i}"] = v[rows]
+    for name, arr in columns.items():
+        np.save(path / f"{name}.npy", np.ascontiguousarray(arr))
+
+    time_range = None
+    if tracks.time_range is not None:
+        tr = tracks.time_range
+        time_range = {
+            "start": str(tr.start),
+            "end": str(tr.end),
+            "step": None if tr.step is None else int(tr.step / np.timedelta64(1, "s")),
+        }
+    step = tracks.time_step
+    manifest = {
+        "format": STORE_FORMAT,
+        "version": STORE_VERSION,
+        "n_points": n,
+        "n_tracks": len(lengths),
+        "track_type": tracks.track_type,
+        "compact": tracks.compact,
+        "time_step": None if step is None else int(step / np.timedelta64(1, "s")),
+        "time_range": time_range,
+        "vars": var_files,
+    }
+    with open(path / MANIFEST, "w") as f:
+        json.dump(manifest, f, indent=2)
+
+
+def read_store(indir: str | Path, mmap: bool = True) -> Tracks:
+    """
+    Opens a store written by ``write_store``.
+
+    With ``mmap`` (the default) columns are memory-mapped copy-on-write, so
+    opening is near-instant, only the pages that are touched are read and
+    processes opening the same store share the page cache. Modifying the
+    returned Tracks never writes back to the store.
+    """
+    path = Path(indir)
+    with open(path / MANIFEST) as f:
+        manifest = json.load(f)
+    if manifest.get("format") != STORE_FORMAT:
+        raise ValueError(f"{path} is not a {STORE_FORMAT} store")
+    if manifest.get("version", 0) > STORE_VERSION:
+        raise ValueError(
+            f"Store version {manifest['version']} is newer than the supported "
+            f"version {STORE_VERSION}"
+        )
+
+    def load(name: str) -> NDArray[Any]:
+        if mmap:
+            return np.load(path / name, mmap_mode="c")  # type: ignore[no-any-return]
+        return np.load(path / name)  # type: ignore[no-any-return]
+
+    track_ids = load("track_ids.npy")
+    offsets = np.load(path / "offsets.npy")
+    # The index comes straight from the offsets when ids increase along tracks
+    heads = track_ids[offsets[:-1]]
+    if np.any(np.diff(heads) <= 0):
+        offsets = None
+
+    step = manifest["time_step"]
+    tracks = Tracks._from_storage(
+        track_ids,
+        load("times.npy"),
+        load("lats.npy"),
+        load("lons.npy"),
+        {k: load(fname) for k, fname in manifest["vars"].items()},
+        offsets=offsets,
+        track_type=manifest["track_type"],
+        compact=manifest["compact"],
+        time_step=None if step is None else np.timedelta64(step, "s"),
+    )
+
+    tr = manifest.get("time_range")
+    if tr is not None:
+        tracks.time_range = TimeRange(
+            start=np.datetime64(tr["start"]),
+            end=np.datetime64(tr["end"]),
+            step=None if tr["step"] is None else np.timedelta64(tr["step"], "s"),
+        )
+    return tracks
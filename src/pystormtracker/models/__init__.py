@@ -1,5 +1,14 @@
 from .center import Center
+from .matching import TrackMatches
+from .summary import TrackSummary
 from .tracker import Tracker
 from .tracks import TimeRange, Tracks
 
-__all__ = ["Center", "TimeRange", "Tracker", "Tracks"]
+__all__ = [
+    "Center",
+    "TimeRange",
+    "TrackMatches",
+    "TrackSummary",
+    "Tracker",
+    "Tracks",
+]
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from typing import TypeAlias
+from typing import Any, TypeAlias
 
 import numba as nb
 import numpy as np
+from numpy.typing import NDArray
 
 from ..models.constants import R_EARTH_KM
 
@@ -41,6 +42,35 @@ def geod_dist_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     return float(geod_dist(lat1, lon1, lat2, lon2) * R_EARTH_KM)
 
 
+@nb.njit(cache=True, nogil=True)  # type: ignore[untyped-decorator]
+def geod_dist_km_pairs(
+    lat1: NDArray[np.float64],
+    lon1: NDArray[np.float64],
+    lat2: NDArray[np.float64],
+    lon2: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """Element-wise ``geod_dist_km`` over arrays of point pairs."""
+    out = np.empty(len(lat1), dtype=np.float64)
+    for i in range(len(lat1)):
+        out[i] = geod_dist_km(lat1[i], lon1[i], lat2[i], lon2[i])
+    return out
+
+
+def latlon_to_xyz(
+    lats: NDArray[np.floating[Any]], lons: NDArray[np.floating[Any]]
+) -> NDArray[np.float64]:
+    """Converts lat/lon in degrees to an (n, 3) array of unit vectors."""
+    phi = np.asarray(lats, dtype=np.float64) * DEGTORAD
+    lam = np.asarray(lons, dtype=np.float64) * DEGTORAD
+    cos_phi = np.cos(phi)
+    return np.column_stack((cos_phi * np.cos(lam), cos_phi * np.sin(lam), np.sin(phi)))
+
+
+def chord_length(angle: float) -> float:
+    """Straight-line distance between two unit vectors ``angle`` radians apart."""
+    return float(2.0 * np.sin(min(angle, np.pi) / 2.0))
+
+
 @nb.njit(cache=True, nogil=True)  # type: ignore[untyped-decorator]
 def stereo_to_latlon(
     x: float, y: float, hemisphere: int, lon_0: float = 0.0
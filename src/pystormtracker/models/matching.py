@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .geo import DEGTORAD, chord_length, latlon_to_xyz
+
+if TYPE_CHECKING:
+    from .tracks import Tracks
+
+# Spacing of the time axis appended to the unit vectors in the KD-tree. Anything
+# larger than the longest chord (2.0) keeps points at different times apart.
+_TIME_SPACING = 4.0
+
+# Earth radius (km) of the Haversine distance in Center.abs_dist
+_R_KM = 6367.0
+
+
+@dataclass(slots=True)
+class TrackMatches:
+    """One-to-one matches between the tracks of two Tracks objects."""
+
+    # Matched track ids in the first and second object
+    ids: NDArray[np.int64]
+    other_ids: NDArray[np.int64]
+    # Number of time steps present in both tracks of a pair
+    n_common: NDArray[np.int64]
+    # Mean great circle separation over the common time steps (km)
+    mean_dist: NDArray[np.float64]
+    # Common time steps divided by the length of the longer track
+    overlap: NDArray[np.float64]
+    # Total number of tracks in each object
+    n_tracks: int
+    n_other: int
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+def _haversine_km(
+    lat1: NDArray[np.float64],
+    lon1: NDArray[np.float64],
+    lat2: NDArray[np.float64],
+    lon2: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """Element-wise Haversine distance, consistent with ``Center.abs_dist``."""
+    phi1 = lat1 * DEGTORAD
+    phi2 = lat2 * DEGTORAD
+    a = (
+        np.sin((phi2 - phi1) / 2.0) ** 2
+        + np.cos(phi1) * np.cos(phi2) * np.sin((lon2 - lon1) * DEGTORAD / 2.0) ** 2
+    )
+    return np.asarray(_R_KM * 2.0 * np.arcsin(np.sqrt(np.minimum(a, 1.0))))
+
+
+def _empty_matches(n_tracks: int, n_other: int) -> TrackMatches:
+    return TrackMatches(
+        ids=np.empty(0, dtype=np.int64),
+        other_ids=np.empty(0, dtype=np.int64),
+        n_common=np.empty(0, dtype=np.int64),
+        mean_dist=np.empty(0, dtype=np.float64),
+        overlap=np.empty(0, dtype=np.float64),
+        n_tracks=n_tracks,
+        n_other=n_other,
+    )
+
+
+def match_tracks(
+    tracks: Tracks,
+    other: Tracks,
+    length_diff_tol: int = 0,
+    coord_tol: float = 1e-4,
+    intensity_tol: float = 1e-4,
+    dist_tol: float | None = None,
+    same_start: bool = True,
+) -> TrackMatches:
+    """
+    Matches the tracks of ``tracks`` against those of ``other``.
+
+    Two tracks match when every time step they share has points within the
+    spatial tolerance (``dist_tol`` in km, or ``coord_tol`` in degrees of lat
+    and lon) and variables within ``intensity_tol``, their lengths differ by
+    at most ``length_diff_tol`` and they share all but ``length_diff_tol``
+    steps of the shorter track. With ``same_start`` they must also start at
+    the same time. Each track is paired at most once, greedily in track order.
+
+    Points are joined on exact time and candidate pairs found with a KD-tree on
+    unit vectors, so the cost is roughly linear in the number of points.
+    """
+    from scipy.spatial import cKDTree
+
+    idx_a = tracks._get_index()
+    idx_b = other._get_index()
+    n_a = len(idx_a.sorted_ids)
+    n_b = len(idx_b.sorted_ids)
+    if n_a == 0 or n_b == 0:
+        return _empty_matches(n_a, n_b)
+
+    # Shared integer time axis for both objects
+    n_pts_a = len(tracks.track_ids)
+    all_times, inv = np.unique(
+        np.concatenate((tracks.times, other.times)), return_inverse=True
+    )
+    n_t = len(all_times)
+    t_a = inv[:n_pts_a].astype(np.int64)
+    t_b = inv[n_pts_a:].astype(np.int64)
+
+    # 1. Candidate point pairs at the same time within the search radius.
+    # In degree mode, |dlat| + |dlon| bounds the great circle separation.
+    angle = dist_tol / _R_KM if dist_tol is not None else 2 * coord_tol * DEGTORAD
+    radius = chord_length(angle) * (1.0 + 1e-9) + 1e-12
+
+    pts_a = np.column_stack(
+        (latlon_to_xyz(tracks.lats, tracks.lons), t_a * _TIME_SPACING)
+    )
+    pts_b = np.column_stack(
+        (latlon_to_xyz(other.lats, other.lons), t_b * _TIME_SPACING)
+    )
+    pairs = cKDTree(pts_a).sparse_distance_matrix(
+        cKDTree(pts_b), radius, output_type="ndarray"
+    )
+    ra = pairs["i"].astype(np.int64)
+    rb = pairs["j"].astype(np.int64)
+
+    # 2. Exact point tolerances
+    lat_a, lon_a = tracks.lats[ra], tracks.lons[ra]
+    lat_b, lon_b = other.lats[rb], other.lons[rb]
+    dist = _haversine_km(lat_a, lon_a, lat_b, lon_b)
+    if dist_tol is not None:
+        ok = ~(dist > dist_tol)
+    else:
+        dlon = np.abs(lon_a - lon_b) % 360
+        dlon = np.where(dlon > 180, 360 - dlon, dlon)
+        ok = ~((np.abs(lat_a - lat_b) > coord_tol) | (dlon > coord_tol))
+    for k in tracks.vars:
+        if k in other.vars:
+            diff = np.abs(tracks.vars[k][ra] - other.vars[k][rb])
+            ok &= ~(diff > intensity_tol)
+    ra, rb, dist = ra[ok], rb[ok], dist[ok]
+
+    # 3. Reduce valid point pairs to track pairs (one point pair per time step)
+    pair = idx_a.row_groups[ra] * n_b + idx_b.row_groups[rb]
+    _, first = np.unique(pair * n_t + t_a[ra], return_index=True)
+    cand, inv_c, n_valid = np.unique(
+        pair[first], return_inverse=True, return_counts=True
+    )
+    sum_dist = np.bincount(inv_c, weights=dist[first], minlength=len(cand))
+    ga = cand // n_b
+    gb = cand % n_b
+
+    # 4. Time steps shared by each candidate pair, whatever the distance
+    key_a = np.unique(idx_a.row_groups * n_t + t_a)
+    key_b = np.unique(idx_b.row_groups * n_t + t_b)
+    steps_a = np.bincount(key_a // n_t, minlength=n_a)
+    start_a = np.cumsum(steps_a) - steps_a
+    n_exp = steps_a[ga]
+    seg = np.cumsum(n_exp) - n_exp
+    pos = np.arange(int(n_exp.sum()), dtype=np.int64) + np.repeat(
+        start_a[ga] - seg, n_exp
+    )
+    probe = np.repeat(gb, n_exp) * n_t + key_a[pos] % n_t
+    hit = np.searchsorted(key_b, probe)
+    hit = (hit < len(key_b)) & (key_b[np.minimum(hit, len(key_b) - 1)] == probe)
+    n_common = np.bincount(
+        np.repeat(np.arange(len(cand)), n_exp), weights=hit, minlength=len(cand)
+    ).astype(np.int64)
+
+    # 5. Track-level criteria
+    len_a = idx_a.lengths[ga]
+    len_b = idx_b.lengths[gb]
+    ok = (
+        (n_valid == n_common)
+        & (np.abs(len_a - len_b) <= length_diff_tol)
+        & (n_common >= np.minimum(len_a, len_b) - length_diff_tol)
+    )
+    if same_start:
+        start_ok = (
+            tracks.times[idx_a.first_rows[ga]] == other.times[idx_b.first_rows[gb]]
+        )
+        ok &= start_ok
+
+    # 6. Greedy one-to-one assignment in track order
+    cands = np.flatnonzero(ok)
+    pos_a = idx_a.positions[ga[cands]]
+    pos_b = idx_b.positions[gb[cands]]
+    cands = cands[np.lexsort((pos_b, pos_a))]
+    used_a = np.zeros(n_a, dtype=bool)
+    used_b = np.zeros(n_b, dtype=bool)
+    chosen: list[int] = []
+    for c in cands:
+        if not used_a[ga[c]] and not used_b[gb[c]]:
+            used_a[ga[c]] = True
+            used_b[gb[c]] = True
+            chosen.append(int(c))
+
+    sel = np.array(chosen, dtype=np.int64)
+    return TrackMatches(
+        ids=idx_a.sorted_ids[ga[sel]],
+        other_ids=idx_b.sorted_ids[gb[sel]],
+        n_common=n_common[sel],
+        mean_dist=sum_dist[sel] / n_valid[sel],
+        overlap=n_common[sel] / np.maximum(len_a[sel], len_b[sel]),
+        n_tracks=n_a,
+        n_other=n_b,
+    )
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .geo import geod_dist_km_pairs
+
+if TYPE_CHECKING:
+    from .tracks import Tracks
+
+
+@dataclass(slots=True)
+class TrackSummary:
+    """Per-track statistics of a Tracks object, one row per track in track order."""
+
+    track_id: NDArray[np.int64]
+    n_points: NDArray[np.int64]
+    # Times of the first (genesis) and last (lysis) points
+    start: NDArray[np.datetime64]
+    end: NDArray[np.datetime64]
+    lifetime: NDArray[np.timedelta64]
+    genesis_lat: NDArray[np.float64]
+    genesis_lon: NDArray[np.float64]
+    lysis_lat: NDArray[np.float64]
+    lysis_lon: NDArray[np.float64]
+    # Great circle distance from genesis to lysis (km)
+    displacement: NDArray[np.float64]
+    # Sum of the great circle distances between consecutive points (km)
+    path_length: NDArray[np.float64]
+    # Path length over lifetime (km/h), NaN for tracks at a single time
+    mean_speed: NDArray[np.float64]
+    # Extremes of each variable, ignoring NaN
+    var_min: dict[str, NDArray[np.float64]]
+    var_max: dict[str, NDArray[np.float64]]
+
+    def __len__(self) -> int:
+        return len(self.track_id)
+
+
+def summarize_tracks(tracks: Tracks) -> TrackSummary:
+    """
+    Computes the TrackSummary of ``tracks``.
+
+    Every column is a reduction over the track offsets of the points grouped by
+    track, so the cost is linear in the number of points with no per-track
+    Python work.
+    """
+    index = tracks._get_index()
+    lengths = index.lengths[index.appearance]
+    rows = index.rows_of(index.appearance)
+    offsets = np.cumsum(lengths) - lengths
+    first = offsets
+    last = offsets + lengths - 1
+
+    times = tracks._times_at(rows)
+    lats = np.asarray(tracks.lats[rows], dtype=np.float64)
+    lons = np.asarray(tracks.lons[rows], dtype=np.float64)
+    var_cols = {k: v[rows] for k, v in tracks.vars.items()}
+
+    if len(lengths) == 0:
+        empty = np.empty(0, dtype=np.float64)
+        return TrackSummary(
+            track_id=index.ids,
+            n_points=lengths,
+            start=times,
+            end=times,
+            lifetime=times - times,
+            genesis_lat=empty,
+            genesis_lon=empty,
+            lysis_lat=empty,
+            lysis_lon=empty,
+            displacement=empty,
+            path_length=empty,
+            mean_speed=empty,
+            var_min=dict.fromkeys(var_cols, empty),
+            var_max=dict.fromkeys(var_cols, empty),
+        )
+
+    # Distance from the previous point of the same track (0 at track starts)
+    step = np.zeros(len(rows), dtype=np.float64)
+    step[1:] = geod_dist_km_pairs(lats[:-1], lons[:-1], lats[1:], lons[1:])
+    step[first] = 0.0
+    path_length = np.add.reduceat(step, first)
+
+    start = times[first]
+    end = times[last]
+    lifetime = end - start
+    hours = lifetime / np.timedelta64(1, "h")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_speed = np.where(hours > 0, path_length / hours, np.nan)
+
+    return TrackSummary(
+        track_id=index.ids,
+        n_points=lengths,
+        start=start,
+        end=end,
+        lifetime=lifetime,
+        genesis_lat=lats[first],
+        genesis_lon=lons[first],
+        lysis_lat=lats[last],
+        lysis_lon=lons[last],
+        displacement=geod_dist_km_pairs(
+            lats[first], lons[first], lats[last], lons[last]
+        ),
+        path_length=path_length,
+        mean_speed=mean_speed,
+        var_min={k: np.fmin.reduceat(v, first) for k, v in var_cols.items()},
+        var_max={k: np.fmax.reduceat(v, first) for k, v in var_cols.items()},
+    )
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal, Protocol, TypeAlias, runtime_checkable
+from typing import TYPE_CHECKING, Any, Literal, Protocol, TypeAlias, runtime_checkable
 
 import numpy as np
 from numpy.typing import NDArray
@@ -13,8 +13,8 @@ if TYPE_CHECKING:
 # Type alias for a single time step's raw detection arrays
 RawDetectionStep: TypeAlias = tuple[
     np.datetime64,
-    NDArray[np.float64],
-    NDArray[np.float64],
+    NDArray[np.floating[Any]],
+    NDArray[np.floating[Any]],
     dict[str, NDArray[np.float64]],
 ]
 
@@ -36,7 +36,7 @@ class Tracker(Protocol):
         map_proj: Literal["global", "nh_stereo", "sh_stereo", "healpix"] = "global",
         resolution: float = 100.0,
         extent: MapExtent | None = None,
-        backend: Literal["serial", "mpi", "dask"] = "serial",
+        backend: Literal["serial", "mpi", "dask", "processes"] = "serial",
         n_workers: int | None = None,
         max_chunk_size: int | None = None,
         threshold: float | None = None,
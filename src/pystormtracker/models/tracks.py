@@ -1,14 +1,196 @@
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Iterator, Mapping, MutableMapping, Sequence
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
 
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import ArrayLike, NDArray
 
 from .center import Center
 
+if TYPE_CHECKING:
+    from .geo import MapExtent
+    from .matching import TrackMatches
+    from .summary import TrackSummary
+
+# Smallest buffer allocated when a Tracks object first grows
+_MIN_CAPACITY = 16
+
+# Origin of the integer time offsets of compact Tracks with a time_step
+_TIME_EPOCH = np.datetime64("1970-01-01T00:00:00", "s")
+
+
+def _grow(buf: NDArray[Any], n: int, fill: float | None = None) -> NDArray[Any]:
+    """Returns a buffer holding ``buf`` with room for at least ``n`` elements.
+
+    Capacity doubles on every reallocation so that repeated appends cost
+    amortized O(1) per element. Unused slots are left uninitialized unless a
+    ``fill`` value is given.
+    """
+    if len(buf) >= n:
+        return buf
+    capacity = max(n, 2 * len(buf), _MIN_CAPACITY)
+    if fill is None:
+        out = np.empty(capacity, dtype=buf.dtype)
+    else:
+        out = np.full(capacity, fill, dtype=buf.dtype)
+    out[: len(buf)] = buf
+    return out
+
+
+class _VarColumns(MutableMapping[str, NDArray[np.float64]]):
+    """Dict-like access to the variable columns of a Tracks object.
+
+    Values are views of length ``len(tracks.track_ids)`` into the growable
+    column buffers, so they stay in sync with the other point arrays.
+    """
+
+    def __init__(self, owner: Tracks) -> None:
+        self._owner = owner
+        self._bufs: dict[str, NDArray[np.float64]] = {}
+
+    def __getitem__(self, key: str) -> NDArray[np.float64]:
+        return self._bufs[key][: self._owner._size]
+
+    def __setitem__(self, key: str, value: NDArray[np.float64]) -> None:
+        self._bufs[key] = np.asarray(value, dtype=self._owner._float_dtype)
+        self._owner._summary = None
+
+    def __delitem__(self, key: str) -> None:
+        del self._bufs[key]
+        self._owner._summary = None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._bufs)
+
+    def __len__(self) -> int:
+        return len(self._bufs)
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+
+@dataclass(slots=True)
+class _TrackIndex:
+    """CSR-style index grouping the point rows of a Tracks object by track.
+
+    ``order`` lists point rows grouped by ascending track id (stable, so each
+    track keeps its physical point order), or is None when the rows already
+    are in that order. The rows of the ``g``-th id in ``sorted_ids`` are
+    ``order[starts[g] : starts[g] + lengths[g]]``. ``appearance`` maps the
+    public track position (order of first appearance in ``track_ids``) to
+    ``g``.
+    """
+
+    order: NDArray[np.int64] | None
+    sorted_ids: NDArray[np.int64]
+    starts: NDArray[np.int64]
+    lengths: NDArray[np.int64]
+    appearance: NDArray[np.int64]
+
+    @classmethod
+    def build(cls, track_ids: NDArray[np.int64]) -> _TrackIndex:
+        order: NDArray[np.int64] | None = None
+        grouped = track_ids
+        if np.any(track_ids[1:] < track_ids[:-1]):
+            order = np.argsort(track_ids, kind="stable")
+            grouped = track_ids[order]
+        if len(grouped) == 0:
+            starts = np.empty(0, dtype=np.int64)
+        else:
+            starts = np.flatnonzero(np.diff(grouped)) + 1
+            starts = np.concatenate(([0], starts))
+        if order is None:
+            return cls.from_offsets(grouped[starts], np.append(starts, len(grouped)))
+        lengths = np.diff(np.append(starts, len(grouped)))
+        # The first row of each group is its first appearance (stable sort)
+        appearance = np.argsort(order[starts], kind="stable")
+        return cls(
+            order=order,
+            sorted_ids=grouped[starts],
+            starts=starts,
+            lengths=lengths,
+            appearance=appearance,
+        )
+
+    @classmethod
+    def from_offsets(
+        cls, ids: NDArray[np.int64], offsets: NDArray[np.int64]
+    ) -> _TrackIndex:
+        """Index of contiguous tracks with increasing ``ids``, where track ``g``
+        spans rows ``offsets[g] : offsets[g + 1]``."""
+        offsets = np.asarray(offsets, dtype=np.int64)
+        return cls(
+            order=None,
+            sorted_ids=np.asarray(ids),
+            starts=offsets[:-1],
+            lengths=np.diff(offsets),
+            appearance=np.arange(len(ids), dtype=np.int64),
+        )
+
+    @property
+    def ids(self) -> NDArray[np.int64]:
+        """Unique track ids in order of first appearance."""
+        return self.sorted_ids[self.appearance]
+
+    def group(self, track_id: int) -> int:
+        """Returns the group of ``track_id`` in ``sorted_ids``, or -1."""
+        g = int(np.searchsorted(self.sorted_ids, track_id))
+        if g < len(self.sorted_ids) and self.sorted_ids[g] == track_id:
+            return g
+        return -1
+
+    def grouped(self, col: NDArray[Any]) -> NDArray[Any]:
+        """Point column reordered so that groups are contiguous."""
+        return col if self.order is None else col[self.order]
+
+    def rows(self, g: int) -> NDArray[np.int64]:
+        s = self.starts[g]
+        if self.order is None:
+            return np.arange(s, s + self.lengths[g], dtype=np.int64)
+        return self.order[s : s + self.lengths[g]]
+
+    def rows_of(self, groups: NDArray[np.int64]) -> NDArray[np.int64]:
+        """Concatenated point rows of several groups, in the given order."""
+        lengths = self.lengths[groups]
+        total = int(lengths.sum())
+        # Position of each output row inside its group, shifted by group start
+        seg_offsets = np.cumsum(lengths) - lengths
+        pos: NDArray[np.int64] = np.arange(total, dtype=np.int64) + np.repeat(
+            self.starts[groups] - seg_offsets, lengths
+        )
+        return pos if self.order is None else self.order[pos]
+
+    @property
+    def first_rows(self) -> NDArray[np.int64]:
+        """Row of the first point of each group."""
+        return self.starts if self.order is None else self.order[self.starts]
+
+    @property
+    def last_rows(self) -> NDArray[np.int64]:
+        """Row of the last point of each group."""
+        last = self.starts + self.lengths - 1
+        return last if self.order is None else self.order[last]
+
+    @property
+    def row_groups(self) -> NDArray[np.int64]:
+        """Group of every point row (inverse of ``order``)."""
+        groups = np.repeat(np.arange(len(self.starts), dtype=np.int64), self.lengths)
+        if self.order is None:
+            return groups
+        out = np.empty(len(self.order), dtype=np.int64)
+        out[self.order] = groups
+        return out
+
+    @property
+    def positions(self) -> NDArray[np.int64]:
+        """Public track position of every group (inverse of ``appearance``)."""
+        out = np.empty(len(self.appearance), dtype=np.int64)
+        out[self.appearance] = np.arange(len(self.appearance), dtype=np.int64)
+        return out
+
 
 @dataclass(slots=True)
 class TimeRange:
@@ -21,7 +203,13 @@ class TimeRange:
 
 class Track:
     """Represents a single storm track. In the array-backed architecture,
-    it acts as a view into the parent Tracks object."""
+    it acts as a view into the parent Tracks object.
+
+    ``times``, ``lats``, ``lons`` and ``vars`` return the columns of the track
+    as arrays: views of the parent buffers when the points of the track are
+    contiguous (always the case after ``Tracks.finalize()``), copies otherwise.
+    Iterating yields ``Center`` objects.
+    """
 
     def __init__(self, track_id: int, tracks: Tracks) -> None:
         self.track_id = track_id
@@ -32,80 +220,107 @@ class Track:
             return False
         if len(self) != len(other):
             return False
-        for c1, c2 in zip(self, other, strict=False):
-            if (
-                c1.time != c2.time
-                or c1.lat != c2.lat
-                or c1.lon != c2.lon
-                or c1.vars != c2.vars
-            ):
-                return False
-        return True
+        v1, v2 = self.vars, other.vars
+        return (
+            np.array_equal(self.times, other.times)
+            and np.array_equal(self.lats, other.lats)
+            and np.array_equal(self.lons, other.lons)
+            and v1.keys() == v2.keys()
+            and all(np.array_equal(v1[k], v2[k]) for k in v1)
+        )
 
     @property
     def indices(self) -> NDArray[np.int64]:
-        return np.where(self._tracks.track_ids == self.track_id)[0]
+        return self._tracks._track_rows(self.track_id)
 
-    def __iter__(self) -> Iterator[Center]:
+    def _rows(self) -> slice | NDArray[np.int64]:
+        """Row selector of the track: a slice when its points are contiguous."""
         idx = self.indices
-        for i in idx:
-            yield Center(
-                self._tracks.times[i],
-                float(self._tracks.lats[i]),
-                float(self._tracks.lons[i]),
-                {k: float(v[i]) for k, v in self._tracks.vars.items()},
-            )
+        if len(idx) > 0 and idx[-1] - idx[0] == len(idx) - 1:
+            return slice(int(idx[0]), int(idx[-1]) + 1)
+        return idx
+
+    @property
+    def times(self) -> NDArray[np.datetime64]:
+        return self._tracks._times_at(self._rows())
+
+    @property
+    def lats(self) -> NDArray[np.float64]:
+        return self._tracks.lats[self._rows()]
+
+    @property
+    def lons(self) -> NDArray[np.float64]:
+        return self._tracks.lons[self._rows()]
+
+    @property
+    def vars(self) -> dict[str, NDArray[np.float64]]:
+        rows = self._rows()
+        return {k: v[rows] for k, v in self._tracks.vars.items()}
+
+    def to_records(self) -> np.recarray[Any, np.dtype[np.void]]:
+        """Returns the points as a record array with time, lat, lon and vars."""
+        rows = self._rows()
+        src = self._tracks
+        dtype = [
+            ("time", "datetime64[s]"),
+            ("lat", np.float64),
+            ("lon", np.float64),
+        ] + [(k, np.float64) for k in src.vars]
+        lats = src.lats[rows]
+        out = np.recarray(len(lats), dtype=dtype)
+        out["time"] = src._times_at(rows)
+        out["lat"] = lats
+        out["lon"] = src.lons[rows]
+        for k, v in src.vars.items():
+            out[k] = v[rows]
+        return out
+
+    def __iter__(self) -> Iterator[Center]:
+        rows = self._rows()
+        src = self._tracks
+        times = src._times_at(rows)
+        lats = src.lats[rows].tolist()
+        lons = src.lons[rows].tolist()
+        vals = {k: v[rows].tolist() for k, v in src.vars.items()}
+        for i in range(len(lats)):
+            yield Center(times[i], lats[i], lons[i], {k: v[i] for k, v in vals.items()})
 
     def __len__(self) -> int:
         return len(self.indices)
 
     def __getitem__(self, index: int) -> Center:
-        idx = self.indices[index]
+        rows = self.indices[[index]]
+        idx = rows[0]
         return Center(
-            self._tracks.times[idx],
+            self._tracks._times_at(rows)[0],
             float(self._tracks.lats[idx]),
             float(self._tracks.lons[idx]),
             {k: float(v[idx]) for k, v in self._tracks.vars.items()},
         )
 
     def append(self, center: Center) -> None:
-        self._tracks.track_ids = np.append(self._tracks.track_ids, self.track_id)
-        self._tracks.times = np.append(self._tracks.times, center.time)
-        self._tracks.lats = np.append(self._tracks.lats, center.lat)
-        self._tracks.lons = np.append(self._tracks.lons, center.lon)
-
-        for k, v in center.vars.items():
-            if k not in self._tracks.vars:
-                # If a new var appears, fill previous points with NaN
-                self._tracks.vars[k] = np.full(len(self._tracks.track_ids) - 1, np.nan)
-            self._tracks.vars[k] = np.append(self._tracks.vars[k], v)
+        self._tracks.bulk_append(
+            np.array([self.track_id], dtype=np.int64),
+            np.array([center.time], dtype="datetime64[s]"),
+            np.array([center.lat], dtype=np.float64),
+            np.array([center.lon], dtype=np.float64),
+            {k: np.array([v], dtype=np.float64) for k, v in center.vars.items()},
+        )
 
     def extend(self, other: Track) -> None:
         idx = other.indices
         if self._tracks is not other._tracks:
-            self._tracks.track_ids = np.concatenate(
-                [self._tracks.track_ids, np.full(len(idx), self.track_id)]
-            )
-            self._tracks.times = np.concatenate(
-                [self._tracks.times, other._tracks.times[idx]]
-            )
-            self._tracks.lats = np.concatenate(
-                [self._tracks.lats, other._tracks.lats[idx]]
-            )
-            self._tracks.lons = np.concatenate(
-                [self._tracks.lons, other._tracks.lons[idx]]
+            src = other._tracks
+            self._tracks.bulk_append(
+                np.full(len(idx), self.track_id, dtype=np.int64),
+                src._times_at(idx),
+                src.lats[idx],
+                src.lons[idx],
+                {k: v[idx] for k, v in src.vars.items()},
             )
-
-            for k in other._tracks.vars:
-                if k not in self._tracks.vars:
-                    self._tracks.vars[k] = np.full(
-                        len(self._tracks.track_ids) - len(idx), np.nan
-                    )
-                self._tracks.vars[k] = np.concatenate(
-                    [self._tracks.vars[k], other._tracks.vars[k][idx]]
-                )
         else:
             other._tracks.track_ids[idx] = self.track_id
+            other._tracks._invalidate_index()
 
     def abs_dist(self, other: Track | Center) -> float:
         c1 = self[-1]
@@ -114,6 +329,28 @@ class Track:
 
 
 class Tracks:
+    """
+    Array-backed container of storm tracks.
+
+    Points are stored as parallel columns (``track_ids``, ``times``, ``lats``,
+    ``lons`` and one array per entry of ``vars``). The columns live in
+    growable buffers with spare capacity, so appending points costs amortized
+    O(1); the public attributes are views of the first ``len(track_ids)``
+    elements. Call ``shrink_to_fit()`` (or ``finalize()``) to release the
+    spare capacity once the object is fully built.
+
+    Track lookups go through a CSR-style index (points grouped by track id
+    with per-track offsets) that is built on first use and dropped whenever
+    the point columns change, so iterating tracks or indexing points within a
+    track does not rescan the whole point array.
+
+    With ``compact=True`` the columns are stored as float32 coordinates and
+    variables with int32 track ids, halving memory and pickling volume at the
+    cost of float32 precision (about 1e-5 degrees). Passing a ``time_step``
+    as well stores times as int32 multiples of the step since 1970-01-01;
+    ``times`` then returns decoded copies rather than views.
+    """
+
     def __init__(
         self,
         track_ids: NDArray[np.int64] | None = None,
@@ -122,25 +359,35 @@ class Tracks:
         lons: NDArray[np.float64] | None = None,
         vars_dict: dict[str, NDArray[np.float64]] | None = None,
         track_type: str = "unknown",
+        compact: bool = False,
+        time_step: np.timedelta64 | None = None,
     ) -> None:
+        if time_step is not None:
+            if not compact:
+                raise ValueError("time_step requires compact=True")
+            time_step = np.timedelta64(time_step, "s")
+            if time_step <= np.timedelta64(0, "s"):
+                raise ValueError(f"time_step must be positive, got {time_step}")
+        self.compact = compact
+        self.time_step = time_step
         self.track_type = track_type
+        self._summary: tuple[_TrackIndex, TrackSummary] | None = None
+        self._vars = _VarColumns(self)
         if track_ids is not None:
-            self.track_ids = np.asarray(track_ids, dtype=np.int64)
-            self.times = np.asarray(times, dtype="datetime64[s]")
-            self.lats = np.asarray(lats, dtype=np.float64)
-            self.lons = np.asarray(lons, dtype=np.float64)
+            self._track_ids = np.asarray(track_ids, dtype=self._id_dtype)
+            self._times = self._encode_times(times)
+            self._lats = np.asarray(lats, dtype=self._float_dtype)
+            self._lons = np.asarray(lons, dtype=self._float_dtype)
             if vars_dict:
-                self.vars = {
-                    k: np.asarray(v, dtype=np.float64) for k, v in vars_dict.items()
-                }
-            else:
-                self.vars = {}
+                for k, v in vars_dict.items():
+                    self._vars[k] = v
         else:
-            self.track_ids = np.empty(0, dtype=np.int64)
-            self.times = np.empty(0, dtype="datetime64[s]")
-            self.lats = np.empty(0, dtype=np.float64)
-            self.lons = np.empty(0, dtype=np.float64)
-            self.vars = {}
+            self._track_ids = np.empty(0, dtype=self._id_dtype)
+            self._times = self._encode_times(np.empty(0, dtype="datetime64[s]"))
+            self._lats = np.empty(0, dtype=self._float_dtype)
+            self._lons = np.empty(0, dtype=self._float_dtype)
+        self._size = len(self._track_ids)
+        self._index: _TrackIndex | None = None
 
         self.time_range: TimeRange | None = None
         self._next_id = 0
@@ -149,31 +396,234 @@ class Tracks:
         self._head_ids: set[int] = set()
         self._tail_ids: set[int] = set()
 
+    @property
+    def _id_dtype(self) -> type[np.signedinteger[Any]]:
+        return np.int32 if self.compact else np.int64
+
+    @property
+    def _float_dtype(self) -> type[np.floating[Any]]:
+        return np.float32 if self.compact else np.float64
+
+    def _encode_times(self, times: ArrayLike) -> NDArray[Any]:
+        """Converts datetimes to the storage representation of ``_times``."""
+        arr = np.asarray(times, dtype="datetime64[s]")
+        if self.time_step is None:
+            return arr
+        offsets, rem = np.divmod(
+            (arr - _TIME_EPOCH).astype(np.int64), self.time_step.astype(np.int64)
+        )
+        info = np.iinfo(np.int32)
+        if np.any(np.isnat(arr) | (rem != 0)) or np.any(
+            (offsets < info.min) | (offsets > info.max)
+        ):
+            raise ValueError(
+                f"Times must be multiples of {self.time_step} since {_TIME_EPOCH} "
+                "to be stored as int32 offsets"
+            )
+        return offsets.astype(np.int32)
+
+    def _decode_times(self, raw: NDArray[Any]) -> NDArray[np.datetime64]:
+        if self.time_step is None:
+            return raw
+        return _TIME_EPOCH + raw.astype(np.int64) * self.time_step
+
+    def _times_at(self, rows: slice | NDArray[np.int64]) -> NDArray[np.datetime64]:
+        """Times of the points at ``rows``, decoding only those points."""
+        return self._decode_times(self._times[: self._size][rows])
+
+    @property
+    def track_ids(self) -> NDArray[np.int64]:
+        return self._track_ids[: self._size]
+
+    @track_ids.setter
+    def track_ids(self, val: NDArray[np.int64]) -> None:
+        self._track_ids = np.asarray(val, dtype=self._id_dtype)
+        self._size = len(self._track_ids)
+        self._index = None
+
+    @property
+    def times(self) -> NDArray[np.datetime64]:
+        return self._decode_times(self._times[: self._size])
+
+    @times.setter
+    def times(self, val: NDArray[np.datetime64]) -> None:
+        self._times = self._encode_times(val)
+        self._summary = None
+
+    @property
+    def lats(self) -> NDArray[np.float64]:
+        return self._lats[: self._size]
+
+    @lats.setter
+    def lats(self, val: NDArray[np.float64]) -> None:
+        self._lats = np.asarray(val, dtype=self._float_dtype)
+        self._summary = None
+
+    @property
+    def lons(self) -> NDArray[np.float64]:
+        return self._lons[: self._size]
+
+    @lons.setter
+    def lons(self, val: NDArray[np.float64]) -> None:
+        self._lons = np.asarray(val, dtype=self._float_dtype)
+        self._summary = None
+
+    @property
+    def vars(self) -> _VarColumns:
+        return self._vars
+
+    @vars.setter
+    def vars(self, val: Mapping[str, NDArray[np.float64]]) -> None:
+        self._vars = _VarColumns(self)
+        for k, v in val.items():
+            self._vars[k] = v
+
+    @property
+    def capacity(self) -> int:
+        """Number of points the column buffers can hold without reallocating."""
+        return min(
+            [len(self._track_ids), len(self._times), len(self._lats), len(self._lons)]
+            + [len(b) for b in self._vars._bufs.values()]
+        )
+
+    def _reserve(self, n: int) -> None:
+        """Ensures every column buffer can hold at least ``n`` points."""
+        self._track_ids = _grow(self._track_ids, n)
+        self._times = _grow(self._times, n)
+        self._lats = _grow(self._lats, n)
+        self._lons = _grow(self._lons, n)
+        bufs = self._vars._bufs
+        for k in bufs:
+            bufs[k] = _grow(bufs[k], n, np.nan)
+
+    def _take(self, idx: NDArray[np.int64]) -> None:
+        """Replaces every column with its elements at ``idx`` (exact capacity)."""
+        self._track_ids = self.track_ids[idx]
+        self._times = self._times[: self._size][idx]
+        self._lats = self.lats[idx]
+        self._lons = self.lons[idx]
+        bufs = self._vars._bufs
+        for k in bufs:
+            bufs[k] = self._vars[k][idx]
+        self._size = len(self._track_ids)
+        self._index = None
+
+    def _get_index(self) -> _TrackIndex:
+        if self._index is None:
+            self._index = _TrackIndex.build(self.track_ids)
+        return self._index
+
+    def _invalidate_index(self) -> None:
+        """Drops the cached track index after ``track_ids`` changed in place."""
+        self._index = None
+
+    def _track_rows(self, track_id: int) -> NDArray[np.int64]:
+        """Point rows of ``track_id`` in physical order."""
+        index = self._get_index()
+        g = index.group(track_id)
+        if g == -1:
+            return np.empty(0, dtype=np.int64)
+        return index.rows(g)
+
+    def shrink_to_fit(self) -> None:
+        """Releases the spare capacity of the column buffers."""
+        n = self._size
+        self._track_ids = self._track_ids[:n].copy()
+        self._times = self._times[:n].copy()
+        self._lats = self._lats[:n].copy()
+        self._lons = self._lons[:n].copy()
+        bufs = self._vars._bufs
+        for k in bufs:
+            bufs[k] = bufs[k][:n].copy()
+
+    def finalize(self) -> Tracks:
+        """Marks the end of incremental building and compacts the storage.
+
+        Points are regrouped so that every track occupies a contiguous block of
+        rows in track order, which lets ``Track`` columns be plain views.
+        """
+        index = self._get_index()
+        rows = index.rows_of(index.appearance)
+        if np.array_equal(rows, np.arange(self._size)):
+            self.shrink_to_fit()
+        else:
+            self._take(rows)
+        return self
+
+    @classmethod
+    def _from_storage(
+        cls,
+        track_ids: NDArray[Any],
+        raw_times: NDArray[Any],
+        lats: NDArray[Any],
+        lons: NDArray[Any],
+        vars_dict: Mapping[str, NDArray[Any]],
+        offsets: NDArray[np.int64] | None = None,
+        track_type: str = "unknown",
+        compact: bool = False,
+        time_step: np.timedelta64 | None = None,
+    ) -> Tracks:
+        """
+        Wraps columns already in the storage format of the given profile
+        (e.g. memory maps) without copying or decoding them.
+
+        ``offsets`` optionally gives the track boundaries of contiguous tracks
+        with increasing ids, so that the index is built without a sort.
+        """
+        out = cls(track_type=track_type, compact=compact, time_step=time_step)
+        out._track_ids = track_ids
+        out._times = raw_times
+        out._lats = lats
+        out._lons = lons
+        out._vars._bufs.update(vars_dict)
+        out._size = len(track_ids)
+        if offsets is not None:
+            starts = np.asarray(offsets[:-1])
+            out._index = _TrackIndex.from_offsets(track_ids[starts], offsets)
+            if len(starts) > 0:
+                out._next_id = int(out._index.sorted_ids[-1])
+        elif out._size > 0:
+            out._next_id = int(np.max(track_ids))
+        return out
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Only ship the logical part of the buffers through pickle (MPI, Dask)
+        state = self.__dict__.copy()
+        n = self._size
+        for name in ("_track_ids", "_times", "_lats", "_lons"):
+            state[name] = state[name][:n]
+        state["_vars"] = {k: v[:n] for k, v in self._vars._bufs.items()}
+        state["_index"] = None
+        state["_summary"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        var_bufs = state.pop("_vars")
+        self.__dict__.update(state)
+        self._vars = _VarColumns(self)
+        self._vars._bufs.update(var_bufs)
+
     def add_track(self, centers: list[Center]) -> Track:
         """Helper to append a new track from a list of Centers."""
         tid = self._get_new_id()
         if not centers:
             return Track(tid, self)
 
-        times = np.array([c.time for c in centers], dtype="datetime64[s]")
-        lats = np.array([c.lat for c in centers], dtype=np.float64)
-        lons = np.array([c.lon for c in centers], dtype=np.float64)
-
         # Consolidate vars from centers
-        var_keys: set[str] = set()
+        var_keys: dict[str, None] = {}
         for c in centers:
-            var_keys.update(c.vars.keys())
-
-        self.track_ids = np.concatenate([self.track_ids, np.full(len(centers), tid)])
-        self.times = np.concatenate([self.times, times])
-        self.lats = np.concatenate([self.lats, lats])
-        self.lons = np.concatenate([self.lons, lons])
-
-        for k in var_keys:
-            vals = np.array([c.vars.get(k, np.nan) for c in centers], dtype=np.float64)
-            if k not in self.vars:
-                self.vars[k] = np.full(len(self.track_ids) - len(centers), np.nan)
-            self.vars[k] = np.concatenate([self.vars[k], vals])
+            var_keys.update(dict.fromkeys(c.vars))
+
+        self.bulk_append(
+            np.full(len(centers), tid, dtype=np.int64),
+            np.array([c.time for c in centers], dtype="datetime64[s]"),
+            np.array([c.lat for c in centers], dtype=np.float64),
+            np.array([c.lon for c in centers], dtype=np.float64),
+            {
+                k: np.array([c.vars.get(k, np.nan) for c in centers], dtype=np.float64)
+                for k in var_keys
+            },
+        )
 
         return Track(tid, self)
 
@@ -196,69 +646,77 @@ class Tracks:
     @property
     def unique_track_ids(self) -> list[int]:
         # Return unique track IDs in order of first appearance
-        if len(self.track_ids) == 0:
-            return []
-        _, idx = np.unique(self.track_ids, return_index=True)
-        return list(self.track_ids[np.sort(idx)])
+        return list(self._get_index().ids)
 
     def __getitem__(self, index: int) -> Track:
-        tid = self.unique_track_ids[index]
-        return Track(tid, self)
+        index_ = self._get_index()
+        tid = index_.sorted_ids[index_.appearance[index]]
+        return Track(int(tid), self)
 
     def __setitem__(self, index: int, value: Track) -> None:
         # Replaces track at index with value track
-        tid = self.unique_track_ids[index]
+        idx = self[index].indices
         if value._tracks is self:
-            idx = np.where(self.track_ids == tid)[0]
             self.track_ids[idx] = value.track_id
+            self._invalidate_index()
         else:
             # Replace physical data
-            idx = np.where(self.track_ids != tid)[0]
-            self.track_ids = self.track_ids[idx]
-            self.times = self.times[idx]
-            self.lats = self.lats[idx]
-            self.lons = self.lons[idx]
-            for k in list(self.vars.keys()):
-                self.vars[k] = self.vars[k][idx]
+            keep = np.ones(self._size, dtype=bool)
+            keep[idx] = False
+            self._take(np.flatnonzero(keep))
             self.append(value)
 
     def __iter__(self) -> Iterator[Track]:
-        for tid in self.unique_track_ids:
-            yield Track(tid, self)
+        for tid in self._get_index().ids:
+            yield Track(int(tid), self)
 
     def __len__(self) -> int:
-        return len(self.unique_track_ids)
+        return len(self._get_index().sorted_ids)
 
     def _get_new_id(self) -> int:
         self._next_id += 1
         # In bulk operations, we might want a more efficient way if many IDs are needed
         return self._next_id
 
+    def _get_new_ids(self, n: int) -> NDArray[np.int64]:
+        """Reserves ``n`` consecutive new track ids."""
+        ids = np.arange(self._next_id + 1, self._next_id + 1 + n, dtype=np.int64)
+        self._next_id += n
+        return ids
+
     def bulk_append(
         self,
         tids: NDArray[np.int64],
         times: NDArray[np.datetime64],
         lats: NDArray[np.float64],
         lons: NDArray[np.float64],
-        vars_dict: dict[str, NDArray[np.float64]],
+        vars_dict: Mapping[str, NDArray[np.float64]],
     ) -> None:
         """Appends multiple points to multiple tracks at once."""
-        self.track_ids = np.concatenate([self.track_ids, tids])
-        self.times = np.concatenate([self.times, times])
-        self.lats = np.concatenate([self.lats, lats])
-        self.lons = np.concatenate([self.lons, lons])
+        times = self._encode_times(times)
+        n = self._size
+        m = len(tids)
+        self._reserve(n + m)
 
+        self._track_ids[n : n + m] = tids
+        self._times[n : n + m] = times
+        self._lats[n : n + m] = lats
+        self._lons[n : n + m] = lons
+
+        bufs = self._vars._bufs
         for k, v in vars_dict.items():
-            if k not in self.vars:
-                self.vars[k] = np.full(len(self.track_ids) - len(v), np.nan)
-            self.vars[k] = np.concatenate([self.vars[k], v])
+            if k not in bufs:
+                # If a new var appears, fill previous points with NaN
+                bufs[k] = np.full(len(self._track_ids), np.nan, self._float_dtype)
+            bufs[k][n : n + m] = v
 
         # For any keys in self.vars NOT in vars_dict, fill with NaN
-        for k in self.vars:
+        for k in bufs:
             if k not in vars_dict:
-                self.vars[k] = np.concatenate(
-                    [self.vars[k], np.full(len(tids), np.nan)]
-                )
+                bufs[k][n : n + m] = np.nan
+
+        self._size = n + m
+        self._index = None
 
     def append(self, obj: Track) -> None:
         if obj._tracks is self:
@@ -267,53 +725,309 @@ class Tracks:
         tid = self._get_new_id()
 
         assert obj._tracks is not None
+        src = obj._tracks
         idx = obj.indices
-        self.track_ids = np.concatenate([self.track_ids, np.full(len(idx), tid)])
-        self.times = np.concatenate([self.times, obj._tracks.times[idx]])
-        self.lats = np.concatenate([self.lats, obj._tracks.lats[idx]])
-        self.lons = np.concatenate([self.lons, obj._tracks.lons[idx]])
-
-        for k in obj._tracks.vars:
-            if k not in self.vars:
-                self.vars[k] = np.full(len(self.track_ids) - len(idx), np.nan)
-            self.vars[k] = np.concatenate([self.vars[k], obj._tracks.vars[k][idx]])
+        self.bulk_append(
+            np.full(len(idx), tid, dtype=np.int64),
+            src._times_at(idx),
+            src.lats[idx],
+            src.lons[idx],
+            {k: v[idx] for k, v in src.vars.items()},
+        )
 
         obj.track_id = tid
         obj._tracks = self
 
-    def sort(self) -> None:
-        """Sorts tracks by their first point's time, lat, then lon."""
-        if len(self.track_ids) == 0:
-            return
+    @property
+    def lengths(self) -> NDArray[np.int64]:
+        """Number of points of each track, in track order."""
+        index = self._get_index()
+        return index.lengths[index.appearance]
+
+    def summary(self) -> TrackSummary:
+        """
+        Returns per-track statistics (times, lifetime, genesis and lysis,
+        displacement, path length, speed and variable extremes).
+
+        The table is computed in one vectorized pass and cached until the
+        points change through the Tracks API. In-place edits of the column
+        arrays are not detected.
+        """
+        index = self._get_index()
+        if self._summary is None or self._summary[0] is not index:
+            from .summary import summarize_tracks
+
+            self._summary = (index, summarize_tracks(self))
+        return self._summary[1]
+
+    def _gather(
+        self,
+        rows: NDArray[np.int64] | slice,
+        track_ids: NDArray[np.int64],
+        compact: bool | None = None,
+        time_step: np.timedelta64 | None = None,
+    ) -> Tracks:
+        """New Tracks object with the points at ``rows`` relabelled ``track_ids``.
+
+        The storage profile is copied from ``self`` unless ``compact`` is given.
+        """
+        if compact is None:
+            compact, time_step = self.compact, self.time_step
+        out = Tracks(
+            track_ids=track_ids,
+            times=self._times_at(rows),
+            lats=self.lats[rows],
+            lons=self.lons[rows],
+            vars_dict={k: v[rows] for k, v in self.vars.items()},
+            track_type=self.track_type,
+            compact=compact,
+            time_step=time_step,
+        )
+        out.time_range = self.time_range
+        out._next_id = int(np.max(track_ids)) if len(track_ids) > 0 else 0
+        return out
+
+    def astype(
+        self, compact: bool = True, time_step: np.timedelta64 | None = None
+    ) -> Tracks:
+        """Returns a copy stored with the given profile (see the class docs).
+
+        Track ids and point order are preserved.
+        """
+        out = self._gather(slice(None), self.track_ids, compact, time_step)
+        out._next_id = self._next_id
+        return out
+
+    def take(self, track_ids: Sequence[int] | NDArray[np.int64]) -> Tracks:
+        """
+        Returns a new Tracks object holding the given tracks in the given order.
 
-        first_indices_list = []
-        u_ids = self.unique_track_ids
-        for tid in u_ids:
-            idx = np.where(self.track_ids == tid)[0][0]
-            first_indices_list.append(idx)
-
-        first_indices = np.array(first_indices_list)
-        sort_keys = np.lexsort(
-            (
-                self.lons[first_indices],
-                self.lats[first_indices],
-                self.times[first_indices],
+        Tracks are renumbered from 1 and stored contiguously. All columns are
+        gathered in a single pass.
+        """
+        index = self._get_index()
+        ids = np.asarray(track_ids, dtype=np.int64)
+        groups = np.searchsorted(index.sorted_ids, ids)
+        found = groups < len(index.sorted_ids)
+        found[found] = index.sorted_ids[groups[found]] == ids[found]
+        if not found.all():
+            raise KeyError(f"Unknown track ids: {ids[~found].tolist()}")
+
+        new_ids = np.repeat(
+            np.arange(1, len(ids) + 1, dtype=np.int64), index.lengths[groups]
+        )
+        return self._gather(index.rows_of(groups), new_ids)
+
+    def filter(self, mask: NDArray[np.bool_]) -> Tracks:
+        """Returns a new Tracks object with the tracks where ``mask`` is True.
+
+        ``mask`` holds one value per track, in track order (see ``take``).
+        """
+        mask = np.asarray(mask, dtype=bool)
+        if mask.shape != (len(self),):
+            raise ValueError(
+                f"Mask of shape {mask.shape} does not match {len(self)} tracks"
             )
+        return self.take(self._get_index().ids[mask])
+
+    def where(
+        self,
+        min_lifetime: int | None = None,
+        bbox: MapExtent | None = None,
+        time: tuple[str | np.datetime64 | None, str | np.datetime64 | None]
+        | None = None,
+        var_range: Mapping[str, tuple[float | None, float | None]] | None = None,
+    ) -> Tracks:
+        """
+        Returns a new Tracks object with the tracks meeting every criterion.
+
+        Args:
+            min_lifetime: Minimum number of points.
+            bbox: (lon_min, lon_max, lat_min, lat_max) box the track must
+                enter. Longitudes wrap, so (170, -170, ...) spans the dateline.
+            time: (start, end) window, inclusive, that the lifetime of the
+                track (first to last time) must overlap. Either bound may be
+                None.
+            var_range: Per-variable (low, high) bounds, inclusive, that at
+                least one point of the track must fall within. Either bound
+                may be None.
+
+        Per-point tests are reduced per track over the track offsets, so the
+        cost is linear in the number of points.
+        """
+        index = self._get_index()
+        keep = np.ones(len(index.sorted_ids), dtype=bool)
+        if len(keep) == 0:
+            return self.take([])
+
+        rows = index.rows_of(index.appearance)
+        lengths = index.lengths[index.appearance]
+        offsets = np.cumsum(lengths) - lengths
+
+        def any_point(mask: NDArray[np.bool_]) -> NDArray[np.bool_]:
+            return np.asarray(np.logical_or.reduceat(mask[rows], offsets))
+
+        if min_lifetime is not None:
+            keep &= lengths >= min_lifetime
+        if bbox is not None:
+            lon_min, lon_max, lat_min, lat_max = bbox
+            lats = self.lats
+            in_box = (lats >= lat_min) & (lats <= lat_max)
+            span = lon_max - lon_min
+            if span < 360:
+                in_box &= (self.lons - lon_min) % 360 <= span % 360
+            keep &= any_point(in_box)
+        if time is not None:
+            # The lifetime [first, last] of the track overlaps the window
+            start, end = time
+            times = self._times_at(rows)
+            if start is not None:
+                keep &= np.maximum.reduceat(times, offsets) >= np.datetime64(start)
+            if end is not None:
+                keep &= np.minimum.reduceat(times, offsets) <= np.datetime64(end)
+        for k, (low, high) in (var_range or {}).items():
+            vals = self.vars[k]
+            in_range = ~np.isnan(vals)
+            if low is not None:
+                in_range &= vals >= low
+            if high is not None:
+                in_range &= vals <= high
+            keep &= any_point(in_range)
+
+        return self.filter(keep)
+
+    @classmethod
+    def concat(cls, tracks_list: Sequence[Tracks]) -> Tracks:
+        """
+        Concatenates several Tracks objects into a new one.
+
+        Tracks are renumbered from 1 in order (all tracks of the first object,
+        then the second, ...) and every column is copied once. Variables
+        missing from some inputs are filled with NaN. The result uses the
+        storage profile of the first object and spans the union of the time
+        ranges of the inputs when they share a step.
+        """
+        if not tracks_list:
+            return cls()
+
+        ids = []
+        n_tracks = 0
+        for t in tracks_list:
+            index = t._get_index()
+            ids.append(index.positions[index.row_groups] + n_tracks + 1)
+            n_tracks += len(index.sorted_ids)
+
+        var_keys = dict.fromkeys(k for t in tracks_list for k in t.vars)
+        out = cls(
+            track_ids=np.concatenate(ids),
+            times=np.concatenate([t.times for t in tracks_list]),
+            lats=np.concatenate([t.lats for t in tracks_list]),
+            lons=np.concatenate([t.lons for t in tracks_list]),
+            vars_dict={
+                k: np.concatenate(
+                    [
+                        t.vars[k] if k in t.vars else np.full(len(t.lats), np.nan)
+                        for t in tracks_list
+                    ]
+                )
+                for k in var_keys
+            },
+            track_type=tracks_list[0].track_type,
+            compact=tracks_list[0].compact,
+            time_step=tracks_list[0].time_step,
         )
+        out._next_id = n_tracks
+
+        # Union of the time ranges, if every input with points has one and
+        # they share a step
+        ranges = [t.time_range for t in tracks_list if t.time_range is not None]
+        unranged = any(t.time_range is None and len(t.lats) for t in tracks_list)
+        if ranges and not unranged and len({r.step for r in ranges}) == 1:
+            out.time_range = TimeRange(
+                start=min(r.start for r in ranges),
+                end=max(r.end for r in ranges),
+                step=ranges[0].step,
+            )
+        return out
+
+    def sort(
+        self,
+        by: Literal[
+            "genesis", "lifetime", "max_intensity", "min_intensity"
+        ] = "genesis",
+        var: str | None = None,
+        descending: bool = False,
+    ) -> None:
+        """
+        Reorders tracks in place. Points within a track keep their order.
 
-        sorted_u_ids = np.array(u_ids)[sort_keys]
+        Args:
+            by: Sort key. "genesis" orders by the first point's time, lat,
+                then lon. "lifetime" orders by number of points, and
+                "max_intensity"/"min_intensity" by the extreme value of
+                ``var`` along each track. Ties fall back to genesis order.
+            var: Variable used by the intensity keys (default: first var).
+            descending: Reverse the primary key.
+        """
+        if self._size == 0:
+            return
+
+        index = self._get_index()
+        # Per-track keys, indexed by position in first-appearance order
+        groups = index.appearance
+        first = index.first_rows[groups]
+        keys: list[NDArray[Any]] = [self.lons[first], self.lats[first]]
+        genesis = self._times_at(first)
+
+        if by == "genesis":
+            keys.append(-genesis.astype(np.int64) if descending else genesis)
+        else:
+            keys.append(genesis)
+            primary: NDArray[Any]
+            if by == "lifetime":
+                primary = index.lengths[groups]
+            elif by in ("max_intensity", "min_intensity"):
+                if var is None:
+                    if not self.vars:
+                        raise ValueError(f"Cannot sort by {by}: no variables")
+                    var = next(iter(self.vars))
+                vals = index.grouped(self.vars[var])
+                reduce = np.fmax if by == "max_intensity" else np.fmin
+                primary = reduce.reduceat(vals, index.starts)[groups]
+            else:
+                raise ValueError(f"Unsupported sort key: {by}")
+            keys.append(-primary if descending else primary)
+
+        perm = np.lexsort(keys)
+        self._take(index.rows_of(groups[perm]))
 
-        new_indices: list[int] = []
-        for tid in sorted_u_ids:
-            new_indices.extend(np.where(self.track_ids == tid)[0])
+    def match(
+        self,
+        other: Tracks,
+        length_diff_tol: int = 0,
+        coord_tol: float = 1e-4,
+        intensity_tol: float = 1e-4,
+        dist_tol: float | None = None,
+        same_start: bool = True,
+    ) -> TrackMatches:
+        """
+        Pairs the tracks of this object with those of another.
 
-        new_indices_arr = np.array(new_indices)
-        self.track_ids = self.track_ids[new_indices_arr]
-        self.times = self.times[new_indices_arr]
-        self.lats = self.lats[new_indices_arr]
-        self.lons = self.lons[new_indices_arr]
-        for k in list(self.vars.keys()):
-            self.vars[k] = self.vars[k][new_indices_arr]
+        Returns a table of one-to-one matches with the number of common time
+        steps, mean separation (km) and overlap fraction of each pair. See
+        ``matching.match_tracks`` for the matching criteria.
+        """
+        from .matching import match_tracks
+
+        return match_tracks(
+            self,
+            other,
+            length_diff_tol=length_diff_tol,
+            coord_tol=coord_tol,
+            intensity_tol=intensity_tol,
+            dist_tol=dist_tol,
+            same_start=same_start,
+        )
 
     def compare(
         self,
@@ -329,89 +1043,17 @@ class Tracks:
             f"Track count mismatch: {len(self)} vs {len(other)}"
         )
 
-        # For every track in self, find if a "close enough" track exists in other
-        matched_in_other = set()
-
-        # Optimization: Group other tracks by their first point's time
-        other_by_time: dict[np.datetime64, list[int]] = {}
-        u_ids_other = other.unique_track_ids
-        for i, tid in enumerate(u_ids_other):
-            t_start = other.times[np.where(other.track_ids == tid)[0][0]]
-            if t_start not in other_by_time:
-                other_by_time[t_start] = []
-            other_by_time[t_start].append(i)
-
-        for tr1 in self:
-            t_start = tr1[0].time
-            found_match = False
-
-            # Only search candidates starting at the same time (strict)
-            candidates = other_by_time.get(t_start, [])
-
-            for idx_other in candidates:
-                if idx_other in matched_in_other:
-                    continue
-
-                tr2 = other[idx_other]
-
-                # Check length
-                if abs(len(tr1) - len(tr2)) > length_diff_tol:
-                    continue
-
-                # Deep check of points
-                d1 = {c.time: c for c in tr1}
-                d2 = {c.time: c for c in tr2}
-                common_times = set(d1.keys()) & set(d2.keys())
-
-                if len(common_times) < min(len(tr1), len(tr2)) - length_diff_tol:
-                    continue
-
-                points_match = True
-                for t_val in common_times:
-                    c1, c2 = d1[t_val], d2[t_val]
-
-                    # Spatial check
-                    if dist_tol is not None:
-                        if c1.abs_dist(c2) > dist_tol:
-                            points_match = False
-                            break
-                    else:
-                        if abs(c1.lat - c2.lat) > coord_tol:
-                            points_match = False
-                            break
-                        lon_diff = abs(c1.lon - c2.lon) % 360
-                        if lon_diff > 180:
-                            lon_diff = 360 - lon_diff
-                        if lon_diff > coord_tol:
-                            points_match = False
-                            break
-
-                    # Intensity check
-                    for k in c1.vars:
-                        if k in c2.vars and (
-                            abs(c1.vars[k] - c2.vars[k]) > intensity_tol
-                        ):
-                            points_match = False
-                            break
-                    if not points_match:
-                        break
-
-                if points_match:
-                    matched_in_other.add(idx_other)
-                    found_match = True
-
-                    # Early exit for "near perfect" matches
-                    if abs(len(tr1) - len(tr2)) <= 1:
-                        break
-
-                    break
-
-            if not found_match:
-                pass
-
-        # Final check: Did we match enough?
-        assert len(matched_in_other) >= len(self) - count_tol, (
-            f"Only {len(matched_in_other)} out of {len(self)} tracks matched."
+        # Every track in self must find a "close enough" track in other
+        matches = self.match(
+            other,
+            length_diff_tol=length_diff_tol,
+            coord_tol=coord_tol,
+            intensity_tol=intensity_tol,
+            dist_tol=dist_tol,
+        )
+
+        assert len(matches) >= len(self) - count_tol, (
+            f"Only {len(matches)} out of {len(self)} tracks matched."
         )
 
     def write(self, outfile: str | Path, format: str = "imilast") -> None:
@@ -420,7 +1062,8 @@ class Tracks:
 
         Args:
             outfile (str | Path): Output file path.
-            format (str): Output format. Supports "imilast", "hodges", "tracks-json".
+            format (str): Output format. Supports "imilast", "hodges", "json" and
+                "store" (a directory, see ``io.store``).
         """
         if format.lower() == "imilast":
             from ..io.imilast import write_imilast
@@ -434,5 +1077,9 @@ class Tracks:
             from ..io.json import write_json
 
             write_json(self, outfile)
+        elif format.lower() == "store":
+            from ..io.store import write_store
+
+            write_store(self, outfile)
         else:
             raise ValueError(f"Unsupported output format: {format}")
@@ -2,7 +2,11 @@ from __future__ import annotations
 
 import os
 import timeit
-from typing import TYPE_CHECKING, Literal
+from itertools import pairwise
+from typing import TYPE_CHECKING, Any, Literal
+
+import numpy as np
+from numpy.typing import NDArray
 
 if TYPE_CHECKING:
     from mpi4py import MPI
@@ -10,8 +14,15 @@ if TYPE_CHECKING:
 from ..hodges import constants
 from ..models import TimeRange, Tracks
 from ..models.tracker import RawDetectionStep
-from .detector import SimpleDetector
-from .tracker import _detect_and_link, _link_centers
+from .detector import SimpleDetector, detect_block
+from .linker import SimpleLinker
+from .tracker import LinkedChunk, _detect_and_match, _link_centers, _stitch_chunks
+
+# Packed detections of a time chunk: centers per step, their flat grid
+# indices and values, and the matches of steps 1.. against the previous step
+PackedChunk = tuple[
+    NDArray[np.int64], NDArray[np.int64], NDArray[np.float64], NDArray[np.int64]
+]
 
 
 def run_simple_dask(
@@ -27,18 +38,45 @@ def run_simple_dask(
     lmin: int = constants.LMIN_DEFAULT,
     lmax: int = constants.LMAX_DEFAULT,
     taper_points: int = constants.TAPER_DEFAULT,
+    compact: bool = False,
+    scheduler: str | None = None,
     **kwargs: float | int | str | None,
 ) -> Tracks:
-    """Dask Orchestrator: Maps detection tasks using threads."""
+    """
+    Dask Orchestrator: Maps preprocessing, detection and chunk linking over a
+    field chunked along time.
+
+    The field stays a lazy dask array from the file to the detector, so each
+    task reads, tapers, filters and detects one time chunk and only packed
+    detections are gathered. ``scheduler`` is "threads" (default),
+    "processes", "distributed" for a ``LocalCluster`` of ``n_workers``
+    single-threaded workers, or the address of a running dask scheduler.
+    """
     import dask
 
     if n_workers is None or n_workers <= 0:
         n_workers = min(os.cpu_count() or 1, 4)
 
+    t0 = timeit.default_timer()
     detector_peek = SimpleDetector(
         pathname=infile, varname=varname, time_range=time_range, engine=engine
     )
     data_xr = detector_peek.get_xarray()
+    time_dim, _, _ = detector_peek._loader.get_coords()
+    total_steps = data_xr.sizes[time_dim]
+
+    if max_chunk_size is None or max_chunk_size <= 0:
+        max_chunk_size = 60
+    else:
+        max_chunk_size = max(1, max_chunk_size)
+
+    # Decouple task chunks from worker count to prevent OOM on high-res data,
+    # but ensure we at least split into n_workers tasks
+    n_splits = max(n_workers, (total_steps + max_chunk_size - 1) // max_chunk_size)
+    chunk_size = max(1, -(-total_steps // n_splits))
+    data_xr = data_xr.chunk(
+        {d: chunk_size if d == time_dim else -1 for d in data_xr.dims}
+    )
 
     if filter:
         from .tracker import SimpleTracker
@@ -48,56 +86,89 @@ def run_simple_dask(
             lmin=lmin,
             lmax=lmax,
             taper_points=taper_points,
+            lazy=True,
         )
 
     detector_obj = SimpleDetector.from_xarray(data_xr)
-
-    # Decouple task chunks from worker count to prevent OOM on high-res data.
     times = detector_obj.get_time()
-    total_steps = len(times) if times is not None else 1
-
-    if max_chunk_size is None or max_chunk_size <= 0:
-        max_chunk_size = 60
-    else:
-        max_chunk_size = max(1, max_chunk_size)
-
-    # Ensure we at least split into n_workers tasks
-    n_splits = max(n_workers, (total_steps + max_chunk_size - 1) // max_chunk_size)
+    assert times is not None
+    lat, lon = detector_obj.lat, detector_obj.lon
+    if threshold is None:
+        threshold = detector_obj.default_threshold()
 
-    detectors = detector_obj.split(n_splits)
+    field = data_xr.data
+    field = field.reshape((field.shape[0], field.shape[-2], field.shape[-1]))
+    bounds = np.concatenate(([0], np.cumsum(field.chunks[0]))).tolist()
 
-    t0 = timeit.default_timer()
     t1 = timeit.default_timer()
     print(f"    [Dask] Setup time: {t1 - t0:.4f}s")
     print(
-        f"    [Dask] Splitting {total_steps} steps into {n_splits} "
-        f"tasks (across {n_workers} threads)"
+        f"    [Dask] Splitting {total_steps} steps into {len(bounds) - 1} "
+        f"tasks (across {n_workers} workers)"
     )
 
     size = int(kwargs.get("size", 5))  # type: ignore[arg-type]
     tasks = [
-        dask.delayed(_detect_and_link)(d, size, threshold, mode)  # type: ignore[attr-defined]
-        for d in detectors
+        dask.delayed(_detect_packed)(  # type: ignore[attr-defined]
+            block, times[a:b], lat, lon, size, threshold, mode
+        )
+        for block, (a, b) in zip(
+            field.to_delayed().ravel(), pairwise(bounds), strict=True
+        )
     ]
 
-    all_raw_chunks = dask.compute(*tasks, scheduler="threads", num_workers=n_workers)  # type: ignore[attr-defined]
-
-    # Flatten chunks into a single sequence of steps
-    all_raw_steps: list[RawDetectionStep] = [
-        step for chunk in all_raw_chunks for step in chunk
-    ]
+    if scheduler in (None, "threads", "processes", "synchronous"):
+        packed_chunks = dask.compute(  # type: ignore[attr-defined]
+            *tasks, scheduler=scheduler or "threads", num_workers=n_workers
+        )
+    else:
+        packed_chunks = _compute_distributed(tasks, scheduler, n_workers)
 
     t2 = timeit.default_timer()
     print(f"    [Dask] Task execution & gather time: {t2 - t1:.4f}s")
 
-    # Centralized linking guarantees bit-wise identity with Serial
+    # Stitching chunk boundaries and replaying the matches in order
+    # guarantees bit-wise identity with Serial
     t3 = timeit.default_timer()
-    tracks = _link_centers(all_raw_steps, time_range=time_range)
+    tracks = _link_packed(
+        list(packed_chunks),
+        bounds,
+        times,
+        lat,
+        lon,
+        detector_obj.varname,
+        time_range,
+        compact,
+    )
     t4 = timeit.default_timer()
-    print(f"    [Dask] Linking time: {t4 - t3:.4f}s")
+    print(f"    [Dask] Stitching time: {t4 - t3:.4f}s")
     return tracks
 
 
+def _compute_distributed(
+    tasks: list[Any], scheduler: str, n_workers: int
+) -> list[PackedChunk]:
+    """Computes ``tasks`` on a dask.distributed cluster: a new ``LocalCluster``
+    for "distributed", else the scheduler at the address ``scheduler``."""
+    try:
+        from dask.distributed import Client, LocalCluster
+    except ImportError:
+        raise ImportError(
+            "distributed is required for the dask.distributed scheduler. "
+            "Please install it with: `uv pip install "
+            "'pystormtracker[distributed]'`"
+        ) from None
+
+    if scheduler == "distributed":
+        with (
+            LocalCluster(n_workers=n_workers, threads_per_worker=1) as cluster,
+            Client(cluster) as client,
+        ):
+            return list(client.gather(client.compute(tasks)))
+    with Client(scheduler) as client:
+        return list(client.gather(client.compute(tasks)))
+
+
 def run_simple_mpi(
     infile: str,
     varname: str,
@@ -109,9 +180,11 @@ def run_simple_mpi(
     lmin: int = constants.LMIN_DEFAULT,
     lmax: int = constants.LMAX_DEFAULT,
     taper_points: int = constants.TAPER_DEFAULT,
+    compact: bool = False,
     **kwargs: float | int | str | None,
 ) -> Tracks:
-    """MPI Orchestrator: Splits frames across ranks, gathers raw detections."""
+    """MPI Orchestrator: Every rank reads, preprocesses and links its own
+    frames; root gathers the packed chunks with ``Gatherv`` and stitches them."""
     from mpi4py import MPI
 
     comm: MPI.Intracomm = MPI.COMM_WORLD
@@ -119,54 +192,399 @@ def run_simple_mpi(
     size = comm.Get_size()
     root = 0
 
-    t0 = timeit.default_timer()
-    if rank == root:
-        detector_peek = SimpleDetector(
-            pathname=infile, varname=varname, time_range=time_range, engine=engine
-        )
-        data_xr = detector_peek.get_xarray()
-
-        if filter:
-            from .tracker import SimpleTracker
-
-            data_xr = SimpleTracker().preprocess_standard_track(
-                data_xr,
-                lmin=lmin,
-                lmax=lmax,
-                taper_points=taper_points,
-            )
-
-        detector_obj = SimpleDetector.from_xarray(data_xr)
-        detectors: list[SimpleDetector] | None = detector_obj.split(size)
-    else:
-        detectors = None
-
-    detector: SimpleDetector = comm.scatter(detectors, root=root)
-    t_scatter = timeit.default_timer()
-    if rank == root:
-        print(f"    [MPI] Prep & Scatter time: {t_scatter - t0:.4f}s")
+    # Prevent OpenMP oversubscription when MPI is handling parallelism
+    os.environ.setdefault("OMP_NUM_THREADS", "1")
 
     t1 = timeit.default_timer()
     ext_size = int(kwargs.get("size", 5))  # type: ignore[arg-type]
-    raw_chunk = _detect_and_link(
-        detector, size=ext_size, threshold=threshold, mode=mode
+    linked_chunk = _detect_rank_slice(
+        infile,
+        varname,
+        time_range,
+        mode,
+        rank,
+        size,
+        threshold=threshold,
+        engine=engine,
+        filter=filter,
+        lmin=lmin,
+        lmax=lmax,
+        taper_points=taper_points,
+        ext_size=ext_size,
     )
 
-    # Gather all raw chunks at root
-    all_raw_chunks = comm.gather(raw_chunk, root=root)
+    # Gather the packed chunks of all ranks at root, rank after rank: sizes
+    # (steps, centers, matches) per rank, then one Gatherv per buffer
+    buffers = _pack_linked_chunk(linked_chunk)
+    local = np.array([len(buffers[0]), len(buffers[2]), len(buffers[5])])
+    sizes = np.empty((size, 3), dtype=np.int64) if rank == root else None
+    comm.Gather(local.astype(np.int64), sizes, root=root)
+    gathered = [
+        _gatherv(comm, buf, None if sizes is None else sizes[:, col], root)
+        for buf, col in zip(buffers, (0, 0, 1, 1, 1, 2), strict=True)
+    ]
     t3 = timeit.default_timer()
 
     if rank == root:
-        print(f"    [MPI] Detection & Gather time: {t3 - t1:.4f}s")
-        assert all_raw_chunks is not None
-        all_raw_steps: list[RawDetectionStep] = [
-            step for chunk in all_raw_chunks for step in chunk
-        ]
+        print(f"    [MPI] Read, Preprocessing, Detection & Gather time: {t3 - t1:.4f}s")
+        assert sizes is not None
         t4 = timeit.default_timer()
-        tracks = _link_centers(all_raw_steps, time_range=time_range)
+        steps = linked_chunk[0]
+        var_name = next(iter(steps[0][3]), "") if steps else ""
+        all_chunks = _unpack_linked_chunks(
+            [g for g in gathered if g is not None], sizes[:, 0], var_name
+        )
+        all_raw_steps, matches = _stitch_chunks(all_chunks)
+        tracks = _link_centers(
+            all_raw_steps, time_range=time_range, compact=compact, matches=matches
+        )
         t5 = timeit.default_timer()
-        print(f"    [MPI] Linking time: {t5 - t4:.4f}s")
+        print(f"    [MPI] Stitching time: {t5 - t4:.4f}s")
         return tracks
 
     # Non-root ranks return empty Tracks
-    return Tracks()
+    return Tracks(compact=compact)
+
+
+def _detect_rank_slice(
+    infile: str,
+    varname: str,
+    time_range: TimeRange | None,
+    mode: Literal["min", "max"],
+    rank: int,
+    size: int,
+    threshold: float | None = None,
+    engine: str | None = None,
+    filter: bool = True,
+    lmin: int = constants.LMIN_DEFAULT,
+    lmax: int = constants.LMAX_DEFAULT,
+    taper_points: int = constants.TAPER_DEFAULT,
+    ext_size: int = 5,
+) -> LinkedChunk:
+    """
+    MPI worker: Opens the dataset and reads, preprocesses, detects and matches
+    the frames of ``rank`` out of ``size`` contiguous slices of the time range.
+
+    Preprocessing is per frame, so filtering a slice gives the same frames as
+    filtering the whole period.
+    """
+    detector_peek = SimpleDetector(
+        pathname=infile, varname=varname, time_range=time_range, engine=engine
+    )
+    data_xr = detector_peek.get_xarray()
+    time_dim, _, _ = detector_peek._loader.get_coords()
+    total_steps = data_xr.sizes[time_dim]
+
+    chunk_size, remainder = divmod(total_steps, size)
+    s_idx = rank * chunk_size + min(rank, remainder)
+    e_idx = (rank + 1) * chunk_size + min(rank + 1, remainder)
+    if s_idx >= e_idx:
+        return [], []
+    data_xr = data_xr.isel({time_dim: slice(s_idx, e_idx)})
+
+    if filter:
+        from .tracker import SimpleTracker
+
+        data_xr = SimpleTracker().preprocess_standard_track(
+            data_xr,
+            lmin=lmin,
+            lmax=lmax,
+            taper_points=taper_points,
+        )
+
+    detector = SimpleDetector.from_xarray(data_xr)
+    detector.global_start_idx = s_idx
+    detector.global_total_steps = total_steps
+    return _detect_and_match(detector, size=ext_size, threshold=threshold, mode=mode)
+
+
+def _gatherv(
+    comm: MPI.Intracomm,
+    sendbuf: NDArray[Any],
+    counts: NDArray[np.int64] | None,
+    root: int,
+) -> NDArray[Any] | None:
+    """Concatenates the 1D arrays of all ranks at root (None elsewhere).
+
+    ``counts`` gives the length of each rank's array and is only used at root.
+    """
+    if comm.Get_rank() != root:
+        comm.Gatherv(sendbuf, None, root=root)
+        return None
+    assert counts is not None
+    recvbuf = np.empty(int(counts.sum()), dtype=sendbuf.dtype)
+    comm.Gatherv(sendbuf, (recvbuf, counts.tolist()), root=root)
+    return recvbuf
+
+
+def _pack_linked_chunk(chunk: LinkedChunk) -> list[NDArray[Any]]:
+    """
+    Packs a linked chunk of single-variable steps into contiguous buffers:
+    step times (int64 seconds) and center counts, the lats, lons and values of
+    all centers, and the matches of steps 1.. against the previous step.
+    """
+    steps, matches = chunk
+    return [
+        np.array([s[0] for s in steps], dtype="datetime64[s]").view(np.int64),
+        np.array([len(s[1]) for s in steps], dtype=np.int64),
+        np.concatenate([np.empty(0), *[s[1] for s in steps]]).astype(np.float64),
+        np.concatenate([np.empty(0), *[s[2] for s in steps]]).astype(np.float64),
+        np.concatenate(
+            [np.empty(0), *[v for s in steps for v in s[3].values()]]
+        ).astype(np.float64),
+        np.concatenate(
+            [np.empty(0, dtype=np.int64), *[m for m in matches if m is not None]]
+        ),
+    ]
+
+
+def _unpack_linked_chunks(
+    buffers: list[NDArray[Any]], n_steps: NDArray[np.int64], varname: str
+) -> list[LinkedChunk]:
+    """Splits the concatenated buffers of ``_pack_linked_chunk`` back into the
+    linked chunks of ``n_steps`` steps each."""
+    times, counts, lats, lons, vals, packed = buffers
+    times = times.view("datetime64[s]")
+    offsets = np.concatenate(([0], np.cumsum(counts)))
+    chunks: list[LinkedChunk] = []
+    m = 0
+    for a, b in pairwise(np.concatenate(([0], np.cumsum(n_steps))).tolist()):
+        steps: list[RawDetectionStep] = []
+        matches: list[NDArray[np.int64] | None] = []
+        for k in range(a, b):
+            lo, hi = offsets[k], offsets[k + 1]
+            steps.append((times[k], lats[lo:hi], lons[lo:hi], {varname: vals[lo:hi]}))
+            if k == a:
+                matches.append(None)
+            else:
+                matches.append(packed[m : m + hi - lo])
+                m += hi - lo
+        chunks.append((steps, matches))
+    return chunks
+
+
+def _unpack_steps(
+    times: NDArray[np.datetime64],
+    lat: NDArray[np.floating[Any]],
+    lon: NDArray[np.floating[Any]],
+    varname: str,
+    counts: NDArray[np.int64],
+    flat: NDArray[np.int64],
+    vals: NDArray[np.float64],
+) -> list[RawDetectionStep]:
+    """Rebuilds the RawDetectionSteps of packed detections."""
+    offsets = np.concatenate(([0], np.cumsum(counts)))
+    r_idx, c_idx = np.divmod(flat, len(lon))
+    return [
+        (times[k], lat[r_idx[a:b]], lon[c_idx[a:b]], {varname: vals[a:b]})
+        for k, (a, b) in enumerate(pairwise(offsets))
+    ]
+
+
+def _detect_packed(
+    block: NDArray[np.floating[Any]],
+    times: NDArray[np.datetime64],
+    lat: NDArray[np.floating[Any]],
+    lon: NDArray[np.floating[Any]],
+    size: int,
+    threshold: float,
+    mode: Literal["min", "max"],
+) -> PackedChunk:
+    """Detects and matches the frames of a (time, lat, lon) block, returning
+    packed arrays."""
+    flat, counts = detect_block(block, size, threshold, mode == "min", False)
+    vals = (
+        np.asarray(block)
+        .reshape(len(block), -1)[np.repeat(np.arange(len(block)), counts), flat]
+        .astype(np.float64)
+    )
+
+    steps = _unpack_steps(times, lat, lon, "", counts, flat, vals)
+    matches = SimpleLinker().match_chunk(steps)[1:]
+    packed = np.concatenate(
+        [np.empty(0, dtype=np.int64), *[m for m in matches if m is not None]]
+    )
+    return counts, flat, vals, packed
+
+
+def _link_packed(
+    packed_chunks: list[PackedChunk],
+    bounds: list[int],
+    times: NDArray[np.datetime64],
+    lat: NDArray[np.float64],
+    lon: NDArray[np.float64],
+    varname: str,
+    time_range: TimeRange | None,
+    compact: bool,
+) -> Tracks:
+    """Stitches the packed chunks of frames ``bounds[i]:bounds[i + 1]`` and
+    links them into tracks."""
+    chunks: list[LinkedChunk] = []
+    for (a, b), (counts, flat, vals, packed) in zip(
+        pairwise(bounds), packed_chunks, strict=True
+    ):
+        steps = _unpack_steps(times[a:b], lat, lon, varname, counts, flat, vals)
+        split = np.cumsum(counts[1:])[:-1]
+        matches: list[NDArray[np.int64] | None] = [None, *np.split(packed, split)]
+        chunks.append((steps, matches[: len(steps)]))
+    all_raw_steps, step_matches = _stitch_chunks(chunks)
+    return _link_centers(
+        all_raw_steps, time_range=time_range, compact=compact, matches=step_matches
+    )
+
+
+def _detect_shared(
+    shm_name: str,
+    shape: tuple[int, int, int],
+    dtype: str,
+    start: int,
+    stop: int,
+    times: NDArray[np.datetime64],
+    lat: NDArray[np.floating[Any]],
+    lon: NDArray[np.floating[Any]],
+    size: int,
+    threshold: float,
+    mode: Literal["min", "max"],
+) -> PackedChunk:
+    """Process worker: detects and matches frames ``start:stop`` of a field in
+    shared memory, returning packed arrays."""
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        field = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        packed = _detect_packed(
+            field[start:stop], times, lat, lon, size, threshold, mode
+        )
+        del field
+    finally:
+        shm.close()
+    return packed
+
+
+def run_simple_processes(
+    infile: str,
+    varname: str,
+    time_range: TimeRange | None,
+    mode: Literal["min", "max"],
+    n_workers: int | None,
+    max_chunk_size: int | None = None,
+    threshold: float | None = None,
+    engine: str | None = None,
+    filter: bool = True,
+    lmin: int = constants.LMIN_DEFAULT,
+    lmax: int = constants.LMAX_DEFAULT,
+    taper_points: int = constants.TAPER_DEFAULT,
+    compact: bool = False,
+    **kwargs: float | int | str | None,
+) -> Tracks:
+    """
+    Process-pool Orchestrator: Maps detection and chunk linking tasks to
+    worker processes.
+
+    The preprocessed field is copied once into shared memory, which workers
+    attach to without copying, and detections come back as packed arrays.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+
+    if n_workers is None or n_workers <= 0:
+        n_workers = os.cpu_count() or 1
+
+    t0 = timeit.default_timer()
+    detector_peek = SimpleDetector(
+        pathname=infile, varname=varname, time_range=time_range, engine=engine
+    )
+    data_xr = detector_peek.get_xarray()
+
+    if filter:
+        from .tracker import SimpleTracker
+
+        data_xr = SimpleTracker().preprocess_standard_track(
+            data_xr,
+            lmin=lmin,
+            lmax=lmax,
+            taper_points=taper_points,
+        )
+
+    detector_obj = SimpleDetector.from_xarray(data_xr)
+    times = detector_obj.get_time()
+    assert times is not None
+    lat, lon = detector_obj.lat, detector_obj.lon
+    if threshold is None:
+        threshold = detector_obj.default_threshold()
+    total_steps = len(times)
+
+    if max_chunk_size is None or max_chunk_size <= 0:
+        max_chunk_size = 60
+    n_splits = max(n_workers, (total_steps + max_chunk_size - 1) // max_chunk_size)
+    n_splits = max(1, min(n_splits, total_steps))
+    bounds = [i * total_steps // n_splits for i in range(n_splits + 1)]
+
+    values = detector_obj.get_var((0, total_steps))
+    assert values is not None
+    dtype = values.dtype.str
+    shm = shared_memory.SharedMemory(create=True, size=max(1, values.nbytes))
+    try:
+        field: NDArray[np.float64] = np.ndarray(
+            values.shape, dtype=values.dtype, buffer=shm.buf
+        )
+        field[...] = values
+        del values, field
+
+        t1 = timeit.default_timer()
+        print(f"    [Processes] Setup time: {t1 - t0:.4f}s")
+        print(
+            f"    [Processes] Splitting {total_steps} steps into {n_splits} "
+            f"tasks (across {n_workers} processes)"
+        )
+
+        start_methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context(
+            "forkserver" if "forkserver" in start_methods else "spawn"
+        )
+        size = int(kwargs.get("size", 5))  # type: ignore[arg-type]
+        shape = (total_steps, len(lat), len(lon))
+        with ProcessPoolExecutor(max_workers=n_workers, mp_context=context) as pool:
+            futures = [
+                pool.submit(
+                    _detect_shared,
+                    shm.name,
+                    shape,
+                    dtype,
+                    a,
+                    b,
+                    times[a:b],
+                    lat,
+                    lon,
+                    size,
+                    threshold,
+                    mode,
+                )
+                for a, b in pairwise(bounds)
+            ]
+            packed_chunks = [f.result() for f in futures]
+    finally:
+        shm.close()
+        shm.unlink()
+
+    t2 = timeit.default_timer()
+    print(f"    [Processes] Task execution & gather time: {t2 - t1:.4f}s")
+
+    # Stitching chunk boundaries and replaying the matches in order
+    # guarantees bit-wise identity with Serial
+    t3 = timeit.default_timer()
+    tracks = _link_packed(
+        packed_chunks,
+        bounds,
+        times,
+        lat,
+        lon,
+        detector_obj.varname,
+        time_range,
+        compact,
+    )
+    t4 = timeit.default_timer()
+    print(f"    [Processes] Stitching time: {t4 - t3:.4f}s")
+    return tracks
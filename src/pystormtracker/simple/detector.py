@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import threading
+from collections.abc import Iterator
 from pathlib import Path
-from typing import ClassVar, Literal
+from typing import Any, ClassVar, Literal
 
+import numba as nb
 import numpy as np
 import xarray as xr
 from numpy.typing import NDArray
@@ -12,12 +14,50 @@ from ..io.data_loader import DataLoader
 from ..models import TimeRange
 from ..models import constants as model_constants
 from ..models.tracker import RawDetectionStep
-from .kernels import (
-    _numba_extrema_filter,
-    _numba_get_centers,
-    _numba_laplace_masked,
-    _numba_remove_dup,
-)
+from .kernels import _numba_detect_block, _numba_detect_frames
+
+# Maximum number of centers kept per frame
+MAX_CENTERS = 10000
+
+# Default memory (bytes) for one block of frames read by streaming detection
+MEMORY_BUDGET_DEFAULT = 512 * 2**20
+
+
+def detect_block(
+    block: NDArray[np.floating[Any]],
+    size: int,
+    threshold: float,
+    is_min: bool,
+    parallel: bool = True,
+) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+    """
+    Runs the fused detection kernel on a (time, lat, lon) block.
+
+    Returns the packed centers: their flat (lat, lon) indices, frame after
+    frame in row-major order, and the number of centers of each frame.
+    """
+    block = np.ascontiguousarray(block)
+    n, rows, cols = block.shape
+    out = np.empty((n, min(MAX_CENTERS, rows * cols)), dtype=np.int64)
+    counts = np.zeros(n, dtype=np.int64)
+    dup_size = 5
+    if parallel:
+        _numba_detect_block(
+            block,
+            size,
+            threshold,
+            is_min,
+            dup_size,
+            out,
+            counts,
+            nb.get_num_threads(),
+        )
+    else:
+        _numba_detect_frames(
+            block, 0, n, size, threshold, is_min, dup_size, out, counts
+        )
+    flat = out[np.arange(out.shape[1]) < counts[:, None]]
+    return flat, counts
 
 
 class SimpleDetector:
@@ -251,60 +291,88 @@ class SimpleDetector:
                 )
         return detectors
 
+    def default_threshold(self) -> float:
+        """Detection threshold used when none is given, by variable."""
+        if self.requested_varname == "vo":
+            return model_constants.DEFAULT_VO_THRESHOLD
+        return model_constants.DEFAULT_MSL_THRESHOLD
+
     def detect(
         self,
         size: int = 5,
         threshold: float | None = None,
         minmaxmode: Literal["min", "max"] = "min",
+        parallel: bool = True,
+        memory_budget: int = MEMORY_BUDGET_DEFAULT,
     ) -> list[RawDetectionStep]:
+        """Detects the centers of every frame in the time range (see
+        ``iter_detect``)."""
+        return list(
+            self.iter_detect(
+                size=size,
+                threshold=threshold,
+                minmaxmode=minmaxmode,
+                parallel=parallel,
+                memory_budget=memory_budget,
+            )
+        )
+
+    def iter_detect(
+        self,
+        size: int = 5,
+        threshold: float | None = None,
+        minmaxmode: Literal["min", "max"] = "min",
+        parallel: bool = True,
+        memory_budget: int = MEMORY_BUDGET_DEFAULT,
+    ) -> Iterator[RawDetectionStep]:
+        """
+        Detects centers frame by frame, yielding one RawDetectionStep per time.
+
+        Frames are read in blocks of as many frames as fit in
+        ``memory_budget`` bytes (at least one), so peak memory does not depend
+        on the length of the time range. Each block goes through one fused
+        Numba kernel, in parallel over time unless ``parallel`` is False (e.g.
+        when the caller already runs detectors in parallel threads).
+        """
         if size % 2 != 1:
             raise ValueError("size must be an odd number")
-
-        # Set variable specific thresholds if not provided
         if threshold is None:
-            if self.requested_varname == "vo":
-                threshold = model_constants.DEFAULT_VO_THRESHOLD
-            else:
-                threshold = model_constants.DEFAULT_MSL_THRESHOLD
+            threshold = self.default_threshold()
 
         time_array = self.get_time()
         lat, lon = self.lat, self.lon
         assert time_array is not None
+        assert self._data is not None
         num_steps = len(time_array)
 
-        # Optimization: Read the entire time range for this worker in one go
-        full_var = self.get_var()
-        assert full_var is not None
+        rows, cols = self._data.shape[-2], self._data.shape[-1]
+        max_centers = min(MAX_CENTERS, rows * cols)
+        frame_bytes = rows * cols * self._data.dtype.itemsize + max_centers * 8
+        block_size = max(1, memory_budget // frame_bytes)
 
-        raw_results: list[RawDetectionStep] = []
         is_min = minmaxmode == "min"
+        for start in range(0, num_steps, block_size):
+            stop = min(start + block_size, num_steps)
+            var = self.get_var((start, stop))
+            assert var is not None
+            flat, counts = detect_block(var, size, threshold, is_min, parallel)
+            offsets = np.concatenate(([0], np.cumsum(counts)))
+
+            for k in range(stop - start):
+                it = start + k
+                if (it + 1) % 10 == 0 or it == 0 or it == num_steps - 1:
+                    if self.global_total_steps:
+                        s_idx = self.global_start_idx + it + 1
+                        g_steps = self.global_total_steps
+                        print(
+                            f"  Step {it + 1}/{num_steps} (Global: {s_idx}/{g_steps})"
+                        )
+                    else:
+                        print(f"  Step {it + 1}/{num_steps}")
 
-        for it, t in enumerate(time_array):
-            if (it + 1) % 10 == 0 or it == 0 or it == num_steps - 1:
-                if self.global_total_steps:
-                    s_idx = self.global_start_idx + it + 1
-                    g_steps = self.global_total_steps
-                    print(f"  Step {it + 1}/{num_steps} (Global: {s_idx}/{g_steps})")
-                else:
-                    print(f"  Step {it + 1}/{num_steps}")
-
-            frame = full_var[it, :, :]
-
-            fill = np.inf if is_min else -np.inf
-            filled_frame = np.where(np.isnan(frame), fill, frame)
-
-            extrema = _numba_extrema_filter(filled_frame, size, threshold, is_min)
-
-            if np.isnan(frame).any():
-                extrema[np.isnan(frame)] = 0
-
-            laplacian = _numba_laplace_masked(filled_frame, extrema, is_min)
-            extrema = _numba_remove_dup(laplacian, size=5)
-
-            # Extract raw data using Numba
-            r_idx, c_idx, vals = _numba_get_centers(extrema, frame)
-            time_val = t.astype("datetime64[s]")
-
-            raw_results.append((time_val, lat[r_idx], lon[c_idx], {self.varname: vals}))
+                idx = flat[offsets[k] : offsets[k + 1]]
+                r_idx, c_idx = np.divmod(idx, cols)
+                vals = var[k].reshape(-1)[idx].astype(np.float64)
+                time_val = time_array[it].astype("datetime64[s]")
 
-        return raw_results
+                yield (time_val, lat[r_idx], lon[c_idx], {self.varname: vals})
@@ -1,62 +1,192 @@
 from __future__ import annotations
 
+from typing import Any
+
 import numba as nb
 import numpy as np
 from numpy.typing import NDArray
 
 
 @nb.njit(nogil=True, cache=True)  # type: ignore[untyped-decorator]
-def _numba_extrema_filter(
-    data: NDArray[np.float64], size: int, threshold: float, is_min: bool
-) -> NDArray[np.float64]:
-    rows, cols = data.shape
-    out = np.zeros_like(data)
+def _numba_running_extreme(
+    frame: NDArray[np.floating[Any]],
+    size: int,
+    is_min: bool,
+    fill: float,
+    g: NDArray[np.float64],
+    h: NDArray[np.float64],
+    acc: NDArray[np.float64],
+    out: NDArray[np.float64],
+) -> None:
+    """
+    Minimum (or maximum) of ``frame`` over every size x size window, with
+    longitude wrap and NaN read as ``fill``. ``out[i, c]`` is the extreme of
+    the window with top row ``i`` centered on column ``c``, for ``i`` up to
+    ``rows - size``.
+
+    Separable van Herk/Gil-Werman filter: prefix (``g``) and suffix (``h``)
+    extremes within blocks of ``size`` elements give any window as the
+    extreme of two values, so the cost per pixel does not depend on ``size``.
+    ``g`` and ``h`` hold ``cols + size - 1`` elements, ``acc`` and ``out``
+    are grids of the frame shape.
+    """
+    rows, cols = frame.shape
+    half = size // 2
+    n = cols + 2 * half
+
+    # 1. Along longitude, on each row extended by half a window on both sides
+    for r in range(rows):
+        for k in range(n):
+            v = frame[r, (k - half) % cols]
+            if np.isnan(v):
+                v = fill
+            if k % size == 0 or (v < g[k - 1] if is_min else v > g[k - 1]):
+                g[k] = v
+            else:
+                g[k] = g[k - 1]
+        for k in range(n - 1, -1, -1):
+            v = frame[r, (k - half) % cols]
+            if np.isnan(v):
+                v = fill
+            if (
+                k == n - 1
+                or (k + 1) % size == 0
+                or (v < h[k + 1] if is_min else v > h[k + 1])
+            ):
+                h[k] = v
+            else:
+                h[k] = h[k + 1]
+        for c in range(cols):
+            a = h[c]
+            b = g[c + size - 1]
+            acc[r, c] = b if (b < a if is_min else b > a) else a
+
+    # 2. Along latitude (no wrap): suffix extremes in ``out``, prefix in ``acc``
+    for r in range(rows - 1, -1, -1):
+        for c in range(cols):
+            v = acc[r, c]
+            if r == rows - 1 or (r + 1) % size == 0:
+                out[r, c] = v
+            else:
+                w = out[r + 1, c]
+                out[r, c] = w if (w < v if is_min else w > v) else v
+    for r in range(1, rows):
+        if r % size != 0:
+            for c in range(cols):
+                v = acc[r, c]
+                w = acc[r - 1, c]
+                acc[r, c] = w if (w < v if is_min else w > v) else v
+    for r in range(rows - size + 1):
+        for c in range(cols):
+            a = out[r, c]
+            b = acc[r + size - 1, c]
+            out[r, c] = b if (b < a if is_min else b > a) else a
+
+
+@nb.njit(nogil=True, cache=True)  # type: ignore[untyped-decorator]
+def _numba_select(a: NDArray[np.float64], k: int) -> None:
+    """Reorders ``a`` in place so that ``a[k]`` holds the element a full sort
+    would put there (Hoare's selection)."""
+    lo = 0
+    hi = len(a) - 1
+    while lo < hi:
+        pivot = a[(lo + hi) // 2]
+        i = lo
+        j = hi
+        while i <= j:
+            while a[i] < pivot:
+                i += 1
+            while a[j] > pivot:
+                j -= 1
+            if i <= j:
+                a[i], a[j] = a[j], a[i]
+                i += 1
+                j -= 1
+        if k <= j:
+            hi = j
+        elif k >= i:
+            lo = i
+        else:
+            break
+
+
+@nb.njit(nogil=True, cache=True)  # type: ignore[untyped-decorator]
+def _numba_extrema_candidates(
+    frame: NDArray[np.floating[Any]],
+    size: int,
+    threshold: float,
+    is_min: bool,
+    fill: float,
+    g: NDArray[np.float64],
+    h: NDArray[np.float64],
+    acc: NDArray[np.float64],
+    ext: NDArray[np.float64],
+    window: NDArray[np.float64],
+    cand: NDArray[np.int64],
+) -> int:
+    """
+    Writes the flat indices of the local extrema of ``frame`` that pass the
+    rank test to ``cand`` (row-major) and returns their count.
+
+    A point is a local extremum if no point of its size x size window is
+    lower (higher for maxima). To reject plateaus, the window value of rank
+    ``size * size // 3`` from the extreme must also differ from it by more
+    than ``threshold``. Extrema are found with ``_numba_running_extreme``;
+    only those candidates pay for the window gather and rank selection.
+    """
+    rows, cols = frame.shape
     half_size = size // 2
+    rank = (size * size) // 3
+    if not is_min:
+        rank = size * size - 1 - rank
 
+    _numba_running_extreme(frame, size, is_min, fill, g, h, acc, ext)
+
+    n_cand = 0
     for r in range(half_size, rows - half_size):
         for c in range(cols):
-            center_val = data[r, c]
+            center_val = frame[r, c]
             if np.isnan(center_val) or np.isinf(center_val):
                 continue
+            m = ext[r - half_size, c]
+            if m < center_val if is_min else m > center_val:
+                continue
 
-            is_extrema = True
+            idx = 0
             for i in range(-half_size, half_size + 1):
-                rr = r + i
                 for j in range(-half_size, half_size + 1):
-                    cc = (c + j) % cols
-                    if is_min:
-                        if data[rr, cc] < center_val:
-                            is_extrema = False
-                            break
-                    else:
-                        if data[rr, cc] > center_val:
-                            is_extrema = False
-                            break
-                if not is_extrema:
-                    break
+                    v = frame[r + i, (c + j) % cols]
+                    window[idx] = fill if np.isnan(v) else v
+                    idx += 1
 
-            if is_extrema:
-                # Always run the 9th filtering (even if threshold=0) to remove plateaus.
-                # Use a rank that scales with window size (default 8 for 5x5).
-                rank = (size * size) // 3
+            _numba_select(window, rank)
+            diff = window[rank] - center_val
+            if diff > threshold if is_min else diff < -threshold:
+                cand[n_cand] = r * cols + c
+                n_cand += 1
+    return n_cand
 
-                window = np.empty(size * size, dtype=data.dtype)
-                idx = 0
-                for i in range(-half_size, half_size + 1):
-                    rr = r + i
-                    for j in range(-half_size, half_size + 1):
-                        cc = (c + j) % cols
-                        window[idx] = data[rr, cc]
-                        idx += 1
-                window.sort()
-
-                if is_min:
-                    if window[rank] - center_val > threshold:
-                        out[r, c] = 1.0
-                else:
-                    if window[size * size - 1 - rank] - center_val < -threshold:
-                        out[r, c] = 1.0
 
+@nb.njit(nogil=True, cache=True)  # type: ignore[untyped-decorator]
+def _numba_extrema_filter(
+    data: NDArray[np.floating[Any]], size: int, threshold: float, is_min: bool
+) -> NDArray[np.floating[Any]]:
+    """Grid of 1.0 at the points found by ``_numba_extrema_candidates``, with
+    NaN read as +inf (minima) or -inf (maxima)."""
+    rows, cols = data.shape
+    out = np.zeros_like(data)
+    fill = np.full(1, np.inf if is_min else -np.inf, dtype=data.dtype)[0]
+    g = np.empty(cols + size - 1, dtype=data.dtype)
+    h = np.empty(cols + size - 1, dtype=data.dtype)
+    acc = np.empty_like(data)
+    ext = np.empty_like(data)
+    window = np.empty(size * size, dtype=data.dtype)
+    cand = np.empty(rows * cols, dtype=np.int64)
+    n_cand = _numba_extrema_candidates(
+        data, size, threshold, is_min, fill, g, h, acc, ext, window, cand
+    )
+    for k in range(n_cand):
+        out[cand[k] // cols, cand[k] % cols] = 1.0
     return out
 
 
@@ -146,3 +276,168 @@ def _numba_get_centers(
             break
 
     return r_idx_tmp[:count].copy(), c_idx_tmp[:count].copy(), vals_tmp[:count].copy()
+
+
+@nb.njit(nogil=True, cache=True)  # type: ignore[untyped-decorator]
+def _numba_detect_frame(
+    frame: NDArray[np.float64],
+    size: int,
+    threshold: float,
+    is_min: bool,
+    fill: float,
+    dup_size: int,
+    g: NDArray[np.float64],
+    h: NDArray[np.float64],
+    acc: NDArray[np.float64],
+    ext: NDArray[np.float64],
+    lap: NDArray[np.float64],
+    cand: NDArray[np.int64],
+    window: NDArray[np.float64],
+    out: NDArray[np.int64],
+) -> int:
+    """
+    Fused ``_numba_extrema_filter``, ``_numba_laplace_masked``,
+    ``_numba_remove_dup`` and ``_numba_get_centers`` on one frame, with NaN
+    treated as +inf (min) or -inf (max) as in ``SimpleDetector.detect``.
+
+    Writes the flat indices of the centers in row-major order to ``out`` (at
+    most ``len(out)``) and returns their count. ``fill`` must have the dtype of
+    ``frame`` so that arithmetic happens at the same precision. ``lap`` must be
+    all zeros and is left so; the other arrays are scratch buffers (see
+    ``_numba_extrema_candidates``).
+    """
+    rows, cols = frame.shape
+
+    # 1. Extrema with the rank statistic
+    n_cand = _numba_extrema_candidates(
+        frame, size, threshold, is_min, fill, g, h, acc, ext, window, cand
+    )
+
+    # 2. Laplacian of the candidates
+    for k in range(n_cand):
+        r = cand[k] // cols
+        c = cand[k] % cols
+        up = frame[(r - 1) % rows, c]
+        down = frame[(r + 1) % rows, c]
+        left = frame[r, (c - 1) % cols]
+        right = frame[r, (c + 1) % cols]
+        if np.isnan(up):
+            up = fill
+        if np.isnan(down):
+            down = fill
+        if np.isnan(left):
+            left = fill
+        if np.isnan(right):
+            right = fill
+        center = frame[r, c]
+        if is_min:
+            val = up + down + left + right - 4.0 * center
+        else:
+            val = 4.0 * center - (up + down + left + right)
+        lap[r, c] = val
+
+    # 3. Keep the most intense candidate of each neighbourhood
+    half_dup = dup_size // 2
+    count = 0
+    for k in range(n_cand):
+        r = cand[k] // cols
+        c = cand[k] % cols
+        center_val = lap[r, c]
+        if center_val == 0 or count >= len(out):
+            continue
+        is_most_intense = True
+        abs_center = abs(center_val)
+        for i in range(-half_dup, half_dup + 1):
+            rr = (r + i) % rows
+            for j in range(-half_dup, half_dup + 1):
+                cc = (c + j) % cols
+                val = abs(lap[rr, cc])
+                if val > abs_center:
+                    is_most_intense = False
+                    break
+                elif val == abs_center:
+                    # Tie-breaking: lower index wins
+                    if rr < r or (rr == r and cc < c):
+                        is_most_intense = False
+                        break
+            if not is_most_intense:
+                break
+        if is_most_intense:
+            out[count] = cand[k]
+            count += 1
+
+    # Reset the scratch grid for the next frame
+    for k in range(n_cand):
+        lap[cand[k] // cols, cand[k] % cols] = 0
+    return count
+
+
+@nb.njit(nogil=True, cache=True)  # type: ignore[untyped-decorator]
+def _numba_detect_frames(
+    block: NDArray[np.floating[Any]],
+    start: int,
+    stop: int,
+    size: int,
+    threshold: float,
+    is_min: bool,
+    dup_size: int,
+    out: NDArray[np.int64],
+    counts: NDArray[np.int64],
+) -> None:
+    """Runs ``_numba_detect_frame`` on frames ``start:stop`` of a (time, lat,
+    lon) block, sharing one set of scratch buffers."""
+    _, rows, cols = block.shape
+    g = np.empty(cols + size - 1, dtype=block.dtype)
+    h = np.empty(cols + size - 1, dtype=block.dtype)
+    acc = np.empty((rows, cols), dtype=block.dtype)
+    ext = np.empty((rows, cols), dtype=block.dtype)
+    lap = np.zeros((rows, cols), dtype=block.dtype)
+    cand = np.empty(rows * cols, dtype=np.int64)
+    window = np.empty(size * size, dtype=block.dtype)
+    fill = np.full(1, np.inf if is_min else -np.inf, dtype=block.dtype)[0]
+    for t in range(start, stop):
+        counts[t] = _numba_detect_frame(
+            block[t],
+            size,
+            threshold,
+            is_min,
+            fill,
+            dup_size,
+            g,
+            h,
+            acc,
+            ext,
+            lap,
+            cand,
+            window,
+            out[t],
+        )
+
+
+@nb.njit(nogil=True, cache=True, parallel=True)  # type: ignore[untyped-decorator]
+def _numba_detect_block(
+    block: NDArray[np.floating[Any]],
+    size: int,
+    threshold: float,
+    is_min: bool,
+    dup_size: int,
+    out: NDArray[np.int64],
+    counts: NDArray[np.int64],
+    n_threads: int,
+) -> None:
+    """``_numba_detect_frames`` over a whole block, with the frames split in
+    one contiguous run per thread."""
+    n_t = block.shape[0]
+    n_runs = min(n_t, n_threads)
+    for k in nb.prange(n_runs):
+        _numba_detect_frames(
+            block,
+            k * n_t // n_runs,
+            (k + 1) * n_t // n_runs,
+            size,
+            threshold,
+            is_min,
+            dup_size,
+            out,
+            counts,
+        )
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+from typing import Any
+
 import numpy as np
 from numpy.typing import NDArray
 
-from ..models.center import Center
+from ..models.geo import chord_length, latlon_to_xyz
 from ..models.tracker import RawDetectionStep
 from ..models.tracks import TimeRange, Tracks
 
@@ -34,141 +37,240 @@ def haversine_matrix(
     return np.asarray(R * c)
 
 
+def haversine_pairs(
+    lats1: NDArray[np.float64],
+    lons1: NDArray[np.float64],
+    lats2: NDArray[np.float64],
+    lons2: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """Element-wise ``haversine_matrix`` over arrays of point pairs (km)."""
+    R = 6367.0
+    DEGTORAD = np.pi / 180.0
+
+    lats1_rad = lats1 * DEGTORAD
+    lats2_rad = lats2 * DEGTORAD
+
+    dlat = lats2_rad - lats1_rad
+    dlon = lons2 * DEGTORAD - lons1 * DEGTORAD
+
+    a = (
+        np.sin(dlat / 2.0) ** 2
+        + np.cos(lats1_rad) * np.cos(lats2_rad) * np.sin(dlon / 2.0) ** 2
+    )
+    c = 2 * np.arcsin(np.sqrt(a))
+    return np.asarray(R * c)
+
+
+def match_mutual_nearest(
+    tail_lats: NDArray[np.floating[Any]],
+    tail_lons: NDArray[np.floating[Any]],
+    new_lats: NDArray[np.floating[Any]],
+    new_lons: NDArray[np.floating[Any]],
+    threshold: float,
+) -> NDArray[np.int64]:
+    """
+    Matches centers to tails that are each other's nearest neighbor within
+    ``threshold`` km, repeating as matched pairs are removed. Distance ties go
+    to the lowest index.
+
+    Returns the matched tail index of every center, or -1.
+
+    Candidate pairs come from a KD-tree on unit vectors, so only pairs within
+    the threshold are ever measured. Repeated mutual nearest matching is the
+    same as greedily taking those pairs in order of (distance, tail, center),
+    which is done in a single pass.
+    """
+    from scipy.spatial import cKDTree
+
+    matched = np.full(len(new_lats), -1, dtype=np.int64)
+    if len(tail_lats) == 0 or len(new_lats) == 0:
+        return matched
+
+    radius = chord_length(threshold / 6367.0) * (1.0 + 1e-9) + 1e-12
+    pairs = cKDTree(latlon_to_xyz(tail_lats, tail_lons)).sparse_distance_matrix(
+        cKDTree(latlon_to_xyz(new_lats, new_lons)), radius, output_type="ndarray"
+    )
+    it = pairs["i"].astype(np.int64)
+    ic = pairs["j"].astype(np.int64)
+
+    dist = haversine_pairs(tail_lats[it], tail_lons[it], new_lats[ic], new_lons[ic])
+    ok = dist < threshold
+    it, ic, dist = it[ok], ic[ok], dist[ok]
+
+    order = np.lexsort((ic, it, dist))
+    used_tail = np.zeros(len(tail_lats), dtype=bool)
+    for t, c in zip(it[order].tolist(), ic[order].tolist(), strict=True):
+        if not used_tail[t] and matched[c] == -1:
+            used_tail[t] = True
+            matched[c] = t
+    return matched
+
+
+def sort_step(step_data: RawDetectionStep) -> RawDetectionStep:
+    """Sorts the centers of a step by (lat, lon), the order in which they are
+    linked. Ties keep their detection order."""
+    time_val, lats, lons, vars_dict = step_data
+    sort_idx = np.lexsort((lons, lats))
+    return (
+        time_val,
+        lats[sort_idx],
+        lons[sort_idx],
+        {k: v[sort_idx] for k, v in vars_dict.items()},
+    )
+
+
 class SimpleLinker:
     """
     Heuristic nearest-neighbor linker for cyclone trajectories.
-    Uses spatial priority sorting and vectorized distance matrices for performance.
+    Uses spatial priority sorting and a KD-tree candidate search for performance.
+
+    The id and last position of every tail (track that received a center at
+    the last linked step) are kept in arrays on the linker, so the cost of a
+    step depends only on the number of active storms, not on the history
+    stored in ``Tracks``.
+
+    The tails of a step are the sorted centers of the previous step, so which
+    centers are linked depends only on those two steps. ``match_chunk``
+    computes it for a chunk of steps independently of any Tracks object, and
+    ``append`` accepts the result, so chunks can be matched in parallel and
+    replayed serially with results identical to serial linking.
     """
 
     def __init__(self, threshold: float = 500.0) -> None:
         self.threshold = threshold
+        # Tail state of the Tracks object last linked by this linker
+        self._tracks: Tracks | None = None
+        self._tail_ids: NDArray[np.int64] = np.empty(0, dtype=np.int64)
+        self._tail_lats: NDArray[np.float64] = np.empty(0, dtype=np.float64)
+        self._tail_lons: NDArray[np.float64] = np.empty(0, dtype=np.float64)
+
+    def _sync_tails(self, tracks: Tracks) -> None:
+        """Reloads the tail state from ``tracks`` if it was not left there by
+        the previous call to ``append``."""
+        if tracks is self._tracks and tracks._tail_ids == set(self._tail_ids.tolist()):
+            return
+        ids = np.array(sorted(tracks._tail_ids), dtype=np.int64)
+        index = tracks._get_index()
+        rows = index.last_rows[np.searchsorted(index.sorted_ids, ids)]
+        order = np.lexsort((ids, tracks.lons[rows], tracks.lats[rows]))
+        rows = rows[order]
+        self._set_tails(tracks, ids[order], tracks.lats[rows], tracks.lons[rows])
 
-    def append(self, tracks: Tracks, step_data: RawDetectionStep) -> None:
+    def _set_tails(
+        self,
+        tracks: Tracks,
+        ids: NDArray[np.int64],
+        lats: NDArray[np.floating[Any]],
+        lons: NDArray[np.floating[Any]],
+    ) -> None:
+        self._tracks = tracks
+        self._tail_ids = ids
+        self._tail_lats = np.asarray(lats, dtype=np.float64)
+        self._tail_lons = np.asarray(lons, dtype=np.float64)
+        tracks._tail_ids = set(ids.tolist())
+
+    def match_chunk(
+        self,
+        steps: Sequence[RawDetectionStep],
+        prev: RawDetectionStep | None = None,
+    ) -> list[NDArray[np.int64] | None]:
         """
-        Links a single time step of detections to existing track tails.
+        Matches the sorted centers of each step against those of the step
+        before it (``prev`` for the first step), as ``append`` would.
+
+        Returns, for every step, the matched index in the previous step of
+        each of its sorted centers (-1 if unmatched), or None if there is no
+        previous step.
         """
-        time_val, new_lats, new_lons, vars_dict = step_data
+        out: list[NDArray[np.int64] | None] = []
+        prev_sorted = None if prev is None else sort_step(prev)
+        for step_data in steps:
+            cur = sort_step(step_data)
+            if prev_sorted is None:
+                out.append(None)
+            else:
+                out.append(
+                    match_mutual_nearest(
+                        prev_sorted[1], prev_sorted[2], cur[1], cur[2], self.threshold
+                    )
+                )
+            prev_sorted = cur
+        return out
+
+    def append(
+        self,
+        tracks: Tracks,
+        step_data: RawDetectionStep,
+        matches: NDArray[np.int64] | None = None,
+    ) -> None:
+        """
+        Links a single time step of detections to existing track tails.
 
-        num_centers = len(new_lats)
+        ``matches`` optionally gives the result of ``match_chunk`` for this
+        step, which is only valid if the previous step was also linked by this
+        linker.
+        """
+        num_centers = len(step_data[1])
         if num_centers == 0:
             # If no centers, all previous tails die
-            tracks._tail_ids = set()
+            empty = np.empty(0, dtype=np.float64)
+            self._set_tails(tracks, np.empty(0, dtype=np.int64), empty, empty)
             return
 
         # Deterministic sorting of input centers (Spatial Priority)
         # This ensures greedy matches are reproducible.
-        sort_idx = np.lexsort((new_lons, new_lats))
-        new_lats = new_lats[sort_idx]
-        new_lons = new_lons[sort_idx]
-        vars_dict = {k: v[sort_idx] for k, v in vars_dict.items()}
+        time_val, new_lats, new_lons, vars_dict = sort_step(step_data)
 
         current_time = time_val
+        matched_indices = np.full(num_centers, -1, dtype=np.int64)
+        tail_ids = np.empty(0, dtype=np.int64)
 
         if not tracks._tail_ids:
             # First ever centers in this object
-            new_tail_ids = set()
-            for i in range(num_centers):
-                c_vars = {k: float(v[i]) for k, v in vars_dict.items()}
-                c = Center(time_val, float(new_lats[i]), float(new_lons[i]), c_vars)
-                t = tracks.add_track([c])
-                new_tail_ids.add(t.track_id)
-                tracks._head_ids.add(t.track_id)
-
-            tracks._tail_ids = new_tail_ids
-            # Update boundaries if not set
             if tracks.time_range is None:
                 tracks.time_range = TimeRange(start=current_time, end=current_time)
-            return
-
-        # Temporal gap check
-        if (
+        elif (
             tracks.time_range
             and tracks.time_range.end is not None
             and tracks.time_range.step is not None
             and current_time - tracks.time_range.step > tracks.time_range.end
         ):
             # All previous tails die due to gap
-            new_tail_ids = set()
-            for i in range(num_centers):
-                c_vars = {k: float(v[i]) for k, v in vars_dict.items()}
-                c = Center(time_val, float(new_lats[i]), float(new_lons[i]), c_vars)
-                t = tracks.add_track([c])
-                new_tail_ids.add(t.track_id)
-                tracks._head_ids.add(t.track_id)
-            tracks._tail_ids = new_tail_ids
             tracks.time_range.end = current_time
-            return
-
-        # Deterministic sorting of existing tails
-        tail_tracks = sorted(tracks.tail, key=lambda t: (t[-1].lat, t[-1].lon))
-        tail_lats = np.array([t[-1].lat for t in tail_tracks])
-        tail_lons = np.array([t[-1].lon for t in tail_tracks])
+        else:
+            # Existing tails are kept sorted like the centers they came from
+            self._sync_tails(tracks)
+            tail_ids = self._tail_ids
+            if matches is not None:
+                matched_indices = matches
+            else:
+                matched_indices = match_mutual_nearest(
+                    self._tail_lats, self._tail_lons, new_lats, new_lons, self.threshold
+                )
 
-        dist_matrix = haversine_matrix(tail_lats, tail_lons, new_lats, new_lons)
-        matched_indices = np.full(num_centers, -1, dtype=np.int64)
+        # Matched centers extend their tail, the others start new tracks
+        matched = matched_indices != -1
+        new = np.flatnonzero(~matched)
+        ids = np.empty(num_centers, dtype=np.int64)
+        ids[matched] = tail_ids[matched_indices[matched]]
+        ids[new] = tracks._get_new_ids(len(new))
+        tracks._head_ids.update(ids[new].tolist())
 
-        # Global greedy matching with mutual-closest constraint
-        while True:
-            has_match = False
-            for ic in range(num_centers):
-                if matched_indices[ic] == -1:
-                    # Find closest tail for this center
-                    col = dist_matrix[:, ic]
-                    if np.any(col < self.threshold):
-                        it_match = int(np.argmin(col))
-                        # Check if this center is also the closest for that tail
-                        if np.argmin(dist_matrix[it_match, :]) == ic:
-                            matched_indices[ic] = it_match
-                            dist_matrix[:, ic] = np.inf
-                            dist_matrix[it_match, :] = np.inf
-                            has_match = True
-            if not has_match:
-                break
-
-        # Prepare for bulk update
-        append_tids = []
-        append_times = []
-        append_lats = []
-        append_lons = []
-        append_vars: dict[str, list[float]] = {k: [] for k in vars_dict}
-
-        new_tail_ids = set()
-
-        # Handle matches
-        for ic in range(num_centers):
-            it_match = matched_indices[ic]
-            if it_match != -1:
-                t = tail_tracks[it_match]
-                tid = t.track_id
-                append_tids.append(tid)
-                append_times.append(time_val)
-                append_lats.append(new_lats[ic])
-                append_lons.append(new_lons[ic])
-                for k, v in vars_dict.items():
-                    append_vars[k].append(v[ic])
-                new_tail_ids.add(tid)
-            else:
-                # Create new track
-                c_vars = {k: float(v[ic]) for k, v in vars_dict.items()}
-                c = Center(time_val, float(new_lats[ic]), float(new_lons[ic]), c_vars)
-                t = tracks.add_track([c])
-                tracks._head_ids.add(t.track_id)
-                new_tail_ids.add(t.track_id)
-
-        if append_tids:
-            tracks.bulk_append(
-                np.array(append_tids, dtype=np.int64),
-                np.array(append_times, dtype="datetime64[s]"),
-                np.array(append_lats, dtype=np.float64),
-                np.array(append_lons, dtype=np.float64),
-                {k: np.array(v, dtype=np.float64) for k, v in append_vars.items()},
-            )
+        # New tracks first, then the extended tails
+        rows = np.concatenate((new, np.flatnonzero(matched)))
+        tracks.bulk_append(
+            ids[rows],
+            np.full(num_centers, current_time, dtype="datetime64[s]"),
+            np.asarray(new_lats[rows], dtype=np.float64),
+            np.asarray(new_lons[rows], dtype=np.float64),
+            {k: np.asarray(v[rows], dtype=np.float64) for k, v in vars_dict.items()},
+        )
 
         # Update tails: ONLY tracks that received a center at THIS time step
-        tracks._tail_ids = new_tail_ids
+        self._set_tails(tracks, ids, new_lats, new_lons)
 
-        # Bookkeeping for TimeRange
-        if tracks.time_range:
+        # Bookkeeping for TimeRange (after linking to existing tails)
+        if len(tail_ids) > 0 and tracks.time_range:
             if (
                 tracks.time_range.step is None
                 and current_time != tracks.time_range.start
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Literal
 
 import numpy as np
 import xarray as xr
+from numpy.typing import NDArray
 
 from ..hodges import constants
 from ..models import TimeRange, Tracks
@@ -15,17 +16,51 @@ if TYPE_CHECKING:
     from ..models.geo import MapExtent
 
 
+# Detections of a time chunk with the matches of each step against the
+# previous one (see SimpleLinker.match_chunk)
+LinkedChunk = tuple[list[RawDetectionStep], list[NDArray[np.int64] | None]]
+
+
 def _link_centers(
-    raw_steps: list[RawDetectionStep], time_range: TimeRange | None = None
+    raw_steps: list[RawDetectionStep],
+    time_range: TimeRange | None = None,
+    compact: bool = False,
+    matches: list[NDArray[np.int64] | None] | None = None,
 ) -> Tracks:
-    """Sequentially links raw detection steps into a global Tracks object."""
-    tracks = Tracks()
+    """Sequentially links raw detection steps into a global Tracks object.
+
+    ``matches`` optionally gives precomputed step matches (see
+    ``_stitch_chunks``), leaving only the id bookkeeping to this loop.
+    """
+    tracks = Tracks(compact=compact)
     if time_range:
         tracks.time_range = time_range
     linker = SimpleLinker()
-    for step_data in raw_steps:
-        linker.append(tracks, step_data)
-    return tracks
+    for i, step_data in enumerate(raw_steps):
+        linker.append(tracks, step_data, None if matches is None else matches[i])
+    return tracks.finalize()
+
+
+def _stitch_chunks(
+    chunks: list[LinkedChunk],
+) -> tuple[list[RawDetectionStep], list[NDArray[np.int64] | None]]:
+    """Joins consecutive linked chunks into one sequence of steps and matches.
+
+    The first step of each chunk was matched without its predecessor, so it is
+    matched here against the last step of the previous non-empty chunk.
+    """
+    linker = SimpleLinker()
+    steps: list[RawDetectionStep] = []
+    matches: list[NDArray[np.int64] | None] = []
+    for chunk_steps, chunk_matches in chunks:
+        if chunk_steps and steps:
+            chunk_matches = [
+                *linker.match_chunk(chunk_steps[:1], prev=steps[-1]),
+                *chunk_matches[1:],
+            ]
+        steps.extend(chunk_steps)
+        matches.extend(chunk_matches)
+    return steps, matches
 
 
 def _detect_and_link(
@@ -33,20 +68,47 @@ def _detect_and_link(
     size: int,
     threshold: float | None,
     mode: Literal["min", "max"],
+    parallel: bool = True,
 ) -> list[RawDetectionStep]:
     """Worker task: Detects centers and returns raw results for central linking."""
     return detector.detect(
         size=size,
         threshold=threshold,
         minmaxmode=mode,
+        parallel=parallel,
     )
 
 
+def _detect_and_match(
+    detector: SimpleDetector,
+    size: int,
+    threshold: float | None,
+    mode: Literal["min", "max"],
+) -> LinkedChunk:
+    """Worker task: Detects centers and matches consecutive steps of the chunk.
+
+    Workers already run in parallel, so detection within a chunk is serial.
+    """
+    raw_steps = _detect_and_link(
+        detector, size=size, threshold=threshold, mode=mode, parallel=False
+    )
+    return raw_steps, SimpleLinker().match_chunk(raw_steps)
+
+
 class SimpleTracker:
     """
     A tracker implementing the PyStormTracker simple parallel algorithm.
     """
 
+    def __init__(self, compact: bool = False) -> None:
+        """
+        Initialize the Simple Tracker.
+
+        Args:
+            compact: Store the output tracks with compact (float32) storage.
+        """
+        self.compact = compact
+
     def preprocess_standard_track(
         self,
         data: xr.DataArray,
@@ -56,16 +118,21 @@ class SimpleTracker:
         map_proj: Literal["global", "nh_stereo", "sh_stereo", "healpix"] = "global",
         resolution: float = 100.0,
         extent: MapExtent | None = None,
+        lazy: bool = False,
     ) -> xr.DataArray:
         """
         Applies standard spectral preprocessing using ducc0.
         Optionally regrids to a Polar Stereographic or HEALPix projection.
+
+        With ``lazy``, a dask-backed global field stays lazy: tapering and
+        filtering are added to its graph and run chunk by chunk on compute.
         """
         from ..preprocessing.spectral import SpectralFilter
         from ..preprocessing.taper import TaperFilter
 
         # Ensure data is loaded into memory for spectral filtering
-        if data.chunks:
+        lazy = lazy and bool(data.chunks) and map_proj == "global"
+        if data.chunks and not lazy:
             data = data.compute()
 
         from typing import cast
@@ -125,7 +192,7 @@ class SimpleTracker:
         else:
             # Global grid filtering
             spectral_filter = SpectralFilter(lmin=lmin, lmax=lmax)
-            data = spectral_filter.filter(data)
+            data = spectral_filter.filter(data, backend="dask" if lazy else "serial")
 
         return data
 
@@ -195,7 +262,9 @@ class SimpleTracker:
         print(f"    [Serial] Detection time: {t1 - t0_detect:.4f}s")
 
         t2 = timeit.default_timer()
-        tracks = _link_centers(raw_steps, time_range=detector_peek.time_range)
+        tracks = _link_centers(
+            raw_steps, time_range=detector_peek.time_range, compact=self.compact
+        )
         t3 = timeit.default_timer()
         print(f"    [Serial] Linking time: {t3 - t2:.4f}s")
         return tracks
@@ -210,7 +279,7 @@ class SimpleTracker:
         map_proj: Literal["global", "nh_stereo", "sh_stereo", "healpix"] = "global",
         resolution: float = 100.0,
         extent: MapExtent | None = None,
-        backend: Literal["serial", "mpi", "dask"] = "serial",
+        backend: Literal["serial", "mpi", "dask", "processes"] = "serial",
         n_workers: int | None = None,
         max_chunk_size: int | None = None,
         threshold: float | None = None,
@@ -227,6 +296,12 @@ class SimpleTracker:
 
         t0 = timeit.default_timer()
 
+        scheduler = kwargs.pop("scheduler", None)
+        if scheduler is not None and backend != "dask":
+            raise ValueError(
+                f"A scheduler is only used by the dask backend, not {backend!r}"
+            )
+
         time_range = None
         if start_time is not None or end_time is not None:
             st = np.datetime64(start_time) if start_time else None
@@ -254,6 +329,26 @@ class SimpleTracker:
                 lmax=lmax,
                 taper_points=taper_points,
                 map_proj=map_proj,
+                compact=self.compact,
+                **kwargs,
+            )
+        elif backend == "processes":
+            from .concurrent import run_simple_processes
+
+            tracks = run_simple_processes(
+                infile,
+                varname,
+                time_range,
+                mode,
+                n_workers,
+                max_chunk_size=max_chunk_size,
+                threshold=threshold,
+                engine=engine,
+                filter=filter,
+                lmin=lmin,
+                lmax=lmax,
+                taper_points=taper_points,
+                compact=self.compact,
                 **kwargs,
             )
         elif backend == "dask":
@@ -272,6 +367,8 @@ class SimpleTracker:
                 lmin=lmin,
                 lmax=lmax,
                 taper_points=taper_points,
+                compact=self.compact,
+                scheduler=None if scheduler is None else str(scheduler),
                 **kwargs,
             )
         else:
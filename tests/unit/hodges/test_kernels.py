@@ -2,7 +2,16 @@ from __future__ import annotations
 
 import numpy as np
 
+from pystormtracker.hodges import constants
 from pystormtracker.hodges.kernels import (
+    _break_track,
+    _get_cost,
+    _grow_rows,
+    _index_rows,
+    _initial_break_pass,
+    _initial_link,
+    _mge_iteration,
+    _swap_gain,
     geod_dev,
     get_adaptive_phimax,
     get_regional_dmax,
@@ -86,3 +95,139 @@ def test_subgrid_refine() -> None:
     rlat, rlon, rval = subgrid_refine(frame, 1, 1, lat, lon)
     assert rlat < 11.0  # Peak is between 10 and 11
     assert rlon == 101.0
+
+
+def _reference_initial_link(
+    lat: np.ndarray, lon: np.ndarray, offsets: np.ndarray, zones: np.ndarray
+) -> np.ndarray:
+    """Greedy nearest-neighbor seeding, one track row at a time."""
+    n_frames = len(offsets) - 1
+    matrix = np.full((offsets[1], n_frames), -1, dtype=np.int64)
+    matrix[:, 0] = np.arange(offsets[1])
+    for k in range(n_frames - 1):
+        feats = np.arange(offsets[k + 1], offsets[k + 2])
+        used = np.zeros(len(feats), dtype=bool)
+        for t in range(matrix.shape[0]):
+            idx = matrix[t, k]
+            if idx == -1:
+                continue
+            best_dist, best = 1e30, -1
+            for n, f in enumerate(feats):
+                dmax = 0.5 * (
+                    get_regional_dmax(lat[idx], lon[idx], zones, 5.0)
+                    + get_regional_dmax(lat[f], lon[f], zones, 5.0)
+                )
+                dist = geod_dist(lat[idx], lon[idx], lat[f], lon[f])
+                if not used[n] and dist < np.radians(dmax) and dist < best_dist:
+                    best_dist, best = dist, n
+            if best != -1:
+                matrix[t, k + 1] = feats[best]
+                used[best] = True
+        new_rows = np.full((int((~used).sum()), n_frames), -1, dtype=np.int64)
+        new_rows[:, k + 1] = feats[~used]
+        matrix = np.vstack((matrix, new_rows))
+    return matrix
+
+
+def test_initial_link() -> None:
+    rng = np.random.default_rng(5)
+    counts = rng.integers(0, 12, size=15)
+    counts[0] = 6
+    counts[4] = 0  # A frame without features
+    offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+    lat = rng.uniform(-60, 60, offsets[-1])
+    lon = rng.uniform(0, 40, offsets[-1])
+
+    matrix = _initial_link(lat, lon, offsets, constants.TRACK_ZONES, 5.0)
+    expected = _reference_initial_link(lat, lon, offsets, constants.TRACK_ZONES)
+    np.testing.assert_array_equal(matrix, expected)
+
+
+def test_break_track_into_spare_row() -> None:
+    lat = np.array([0.0, 0.0, 0.0, 0.0])
+    lon = np.array([0.0, 1.0, 30.0, 31.0])
+    tracks = np.array([[0, 1, 2, 3]], dtype=np.int64)
+    tracks = _grow_rows(tracks, 1, 2)
+    assert tracks.shape == (2, 4)
+    row_of, row_len = _index_rows(tracks, 4)
+    no_zones = np.zeros((0, 5))
+
+    # 1 -> 2 jumps 29 degrees, beyond dmax
+    n_rows = _break_track(
+        tracks, 1, row_of, row_len, 0, 1, lat, lon, no_zones, 5.0, True
+    )
+    assert n_rows == 2
+    np.testing.assert_array_equal(tracks, [[0, 1, -1, -1], [-1, -1, 2, 3]])
+    np.testing.assert_array_equal(row_of, [0, 0, 1, 1])
+    np.testing.assert_array_equal(row_len, [2, 2])
+
+    # Within dmax: nothing to break
+    n_rows = _break_track(
+        tracks, 2, row_of, row_len, 1, 2, lat, lon, no_zones, 5.0, True
+    )
+    assert n_rows == 2
+
+
+def test_mge_iteration_matches_all_pairs() -> None:
+    rng = np.random.default_rng(11)
+    zones = constants.TRACK_ZONES
+    params = (0.2, 0.8, 6.5, 0.5, zones, constants.ADAPT_PARAMS)
+    n_swaps = 0
+    for max_missing in (-1, 0, 2):
+        counts = rng.integers(2, 9, size=10)
+        offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        lat = rng.uniform(-30, 30, offsets[-1])
+        lon = rng.uniform(0, 10, offsets[-1])
+        tracks = _initial_link(lat, lon, offsets, zones, 6.5)
+        tracks, n_rows = _initial_break_pass(
+            tracks, lat, lon, 0.2, 0.8, 0.5, constants.ADAPT_PARAMS
+        )
+        # Scramble some points, leaving empty rows behind
+        tracks = tracks[: n_rows + 2].copy()
+        for _ in range(20):
+            frame = int(rng.integers(10))
+            i, j = (int(r) for r in rng.integers(len(tracks), size=2))
+            tracks[[i, j], frame] = tracks[[j, i], frame]
+        row_of, row_len = _index_rows(tracks, int(offsets[-1]))
+        costs = np.full(tracks.shape, np.nan)
+
+        for k in range(1, 9):
+            for forward in (True, False):
+                target = k + 1 if forward else k - 1
+                # Best gain over every pair, first pair in row order on ties
+                expected, best = (-1, -1), 1e-8
+                for i in range(len(tracks)):
+                    for j in range(i + 1, len(tracks)):
+                        if tracks[i, target] == tracks[j, target]:
+                            continue
+                        gain = _swap_gain(
+                            tracks,
+                            lat,
+                            lon,
+                            k,
+                            target,
+                            i,
+                            j,
+                            _get_cost(tracks, k, i, lat, lon, 0.2, 0.8, 0.5),
+                            _get_cost(tracks, k, j, lat, lon, 0.2, 0.8, 0.5),
+                            *params,
+                            max_missing,
+                        )
+                        if gain > best:
+                            expected, best = (i, j), gain
+                result = _mge_iteration(
+                    tracks,
+                    lat,
+                    lon,
+                    k,
+                    forward,
+                    *params,
+                    max_missing,
+                    offsets,
+                    row_of,
+                    row_len,
+                    costs,
+                )
+                assert tuple(result) == expected
+                n_swaps += expected[0] != -1
+    assert n_swaps > 0
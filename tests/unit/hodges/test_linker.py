@@ -1,8 +1,22 @@
 from __future__ import annotations
 
+import os
+import subprocess
+import sys
+from pathlib import Path
+
 import numpy as np
+import pytest
+from numpy.typing import NDArray
 
-from pystormtracker.hodges.linker import HodgesLinker
+from pystormtracker.hodges.kernels import (
+    _get_cost,
+    _mge_iteration,
+    get_regional_dmax,
+)
+from pystormtracker.hodges.linker import HodgesLinker, _MGEState
+from pystormtracker.models.geo import geod_dist
+from pystormtracker.models.tracker import RawDetectionStep
 
 
 def test_hodges_linker_init() -> None:
@@ -117,3 +131,241 @@ def test_hodges_linker_link_crossing() -> None:
             found_a = True
             break
     assert found_a
+
+
+def _random_detections(
+    seed: int, n_frames: int = 30, n_storms: int = 16
+) -> list[RawDetectionStep]:
+    """Crowded drifting storms with dropped detections, empty frames and
+    occasional jumps beyond dmax."""
+    rng = np.random.default_rng(seed)
+    lat = rng.uniform(-15, 15, n_storms)
+    lon = rng.uniform(0, 30, n_storms)
+    t0 = np.datetime64("2025-12-01T00:00:00")
+    detections: list[RawDetectionStep] = []
+    for k in range(n_frames):
+        lat = lat + rng.normal(0, 2, n_storms)
+        lon = (lon + rng.normal(2, 2, n_storms)) % 360
+        lon = np.where(rng.random(n_storms) < 0.05, (lon + 40) % 360, lon)
+        keep = (rng.random(n_storms) < 0.85) & (k % 9 != 4)
+        detections.append(
+            (
+                t0 + np.timedelta64(6 * k, "h"),
+                lat[keep],
+                lon[keep],
+                {"msl": rng.random(int(keep.sum()))},
+            )
+        )
+    return detections
+
+
+class _UncachedLinker(HodgesLinker):
+    """Searches every frame in every pass with all costs recomputed."""
+
+    def _sweep(
+        self,
+        state: _MGEState,
+        features_lat: NDArray[np.float64],
+        features_lon: NDArray[np.float64],
+        forward: bool,
+    ) -> bool:
+        state.stale[:] = True
+        return super()._sweep(state, features_lat, features_lon, forward)
+
+    def _search(
+        self,
+        state: _MGEState,
+        features_lat: NDArray[np.float64],
+        features_lon: NDArray[np.float64],
+        k: int,
+        forward: bool,
+    ) -> tuple[int, int]:
+        state.costs[:] = np.nan
+        return super()._search(state, features_lat, features_lon, k, forward)
+
+
+def test_hodges_linker_cache_matches_full_search(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    break_track = _MGEState.break_track
+    n_breaks = 0
+
+    def counting_break_track(
+        state: _MGEState,
+        row: int,
+        k: int,
+        forward: bool,
+        features_lat: NDArray[np.float64],
+        features_lon: NDArray[np.float64],
+        zones: NDArray[np.float64],
+        dmax: float,
+    ) -> None:
+        nonlocal n_breaks
+        n_rows = state.n_rows
+        break_track(state, row, k, forward, features_lat, features_lon, zones, dmax)
+        n_breaks += state.n_rows > n_rows
+
+    monkeypatch.setattr(_MGEState, "break_track", counting_break_track)
+    for seed in range(6):
+        detections = _random_detections(seed)
+        for max_missing in (-1, 0, 2):
+            tracks = HodgesLinker(max_missing=max_missing).link(detections)
+            expected = _UncachedLinker(max_missing=max_missing).link(detections)
+            np.testing.assert_array_equal(tracks.track_ids, expected.track_ids)
+            np.testing.assert_array_equal(tracks.lats, expected.lats)
+            np.testing.assert_array_equal(tracks.lons, expected.lons)
+    # Tracks were split during MGE
+    assert n_breaks > 0
+
+
+def test_mge_state_swap_invalidates_reach() -> None:
+    n_frames = 20
+    # Two features per frame on two tracks, and an empty row
+    tracks = np.full((3, n_frames), -1, dtype=np.int64)
+    step_offsets = np.arange(0, 2 * n_frames + 1, 2, dtype=np.int64)
+    tracks[0] = step_offsets[:-1]
+    tracks[1] = step_offsets[:-1] + 1
+    for max_missing in (-1, 0, 2):
+        state = _MGEState.from_matrix(tracks.copy(), 3, step_offsets, max_missing)
+        assert state.reach == max(max_missing, 0) + 3
+        state.costs[:] = 0.0
+        state.stale[:] = False
+
+        k = 10
+        state.swap(0, 1, k)
+        window = np.zeros(n_frames, dtype=bool)
+        window[k - state.reach : k + 1 + state.reach] = True
+        np.testing.assert_array_equal(state.stale, [window, window])
+        dirty = np.zeros((3, n_frames), dtype=bool)
+        dirty[:2, k - 1 : k + 2] = True
+        np.testing.assert_array_equal(np.isnan(state.costs), dirty)
+        np.testing.assert_array_equal(state.tracks[:2, k], tracks[[1, 0], k])
+
+
+class _StateLinker(HodgesLinker):
+    """Keeps the optimized track matrix and features of the last link, and
+    counts the sweeps."""
+
+    n_sweeps = 0
+
+    def _sweep(
+        self,
+        state: _MGEState,
+        features_lat: NDArray[np.float64],
+        features_lon: NDArray[np.float64],
+        forward: bool,
+    ) -> bool:
+        self.state = (state, features_lat, features_lon)
+        self.n_sweeps += 1
+        return super()._sweep(state, features_lat, features_lon, forward)
+
+    def _sweep_parallel(
+        self,
+        state: _MGEState,
+        features_lat: NDArray[np.float64],
+        features_lon: NDArray[np.float64],
+        forward: bool,
+    ) -> bool:
+        self.state = (state, features_lat, features_lon)
+        self.n_sweeps += 1
+        return super()._sweep_parallel(state, features_lat, features_lon, forward)
+
+    def total_cost(self) -> float:
+        state, lat, lon = self.state
+        return sum(
+            _get_cost(state.tracks, k, r, lat, lon, self.w1, self.w2, self.phimax)
+            for r in range(state.n_rows)
+            for k in range(1, state.tracks.shape[1] - 1)
+        )
+
+    def assert_converged(self) -> None:
+        """No frame has a swap left that improves the cost."""
+        state, lat, lon = self.state
+        for k in range(1, state.tracks.shape[1] - 1):
+            for forward in (True, False):
+                best = _mge_iteration(
+                    state.tracks[: state.n_rows],
+                    lat,
+                    lon,
+                    k,
+                    forward,
+                    self.w1,
+                    self.w2,
+                    self.dmax,
+                    self.phimax,
+                    self.zones,
+                    self.adapt_params,
+                    self.max_missing,
+                    state.step_offsets,
+                    state.row_of,
+                    state.row_len,
+                    np.full(state.tracks.shape, np.nan),
+                )
+                assert tuple(best) == (-1, -1)
+
+
+def test_hodges_linker_parallel_sweep() -> None:
+    dt = np.timedelta64(6, "h")
+    n_converged = 0
+    for seed in range(4):
+        detections = _random_detections(seed)
+        for max_missing in (0, 2):
+            linker = _StateLinker(max_missing=max_missing, n_iterations=20)
+            serial = _StateLinker(max_missing=max_missing, n_iterations=20)
+            linker.parallel = True
+            tracks = linker.link(detections)
+            serial.link(detections)
+
+            # A local optimum of the MGE cost when the passes stopped before
+            # the budget (breaks can make MGE cycle), close to the sequential
+            # one
+            if linker.n_sweeps < 2 * linker.n_iterations:
+                linker.assert_converged()
+                n_converged += 1
+            assert linker.total_cost() <= 1.01 * serial.total_cost()
+
+            # Every detection on one track, within the gap and dmax limits
+            assert len(tracks.lats) == sum(len(d[1]) for d in detections)
+            for track in tracks:
+                steps = np.diff(track.times)
+                assert (steps <= (max_missing + 1) * dt).all()
+                for a in map(int, np.flatnonzero(steps == dt)):
+                    lat0, lon0 = float(track.lats[a]), float(track.lons[a])
+                    lat1, lon1 = float(track.lats[a + 1]), float(track.lons[a + 1])
+                    dmax = 0.5 * (
+                        get_regional_dmax(lat0, lon0, linker.zones, linker.dmax)
+                        + get_regional_dmax(lat1, lon1, linker.zones, linker.dmax)
+                    )
+                    assert geod_dist(lat0, lon0, lat1, lon1) <= np.radians(dmax)
+    assert n_converged > 0
+
+
+def test_hodges_linker_parallel_sweep_threads(tmp_path: Path) -> None:
+    script = f"""
+import sys
+
+import numba
+import numpy as np
+
+sys.path.insert(0, {str(Path(__file__).parent)!r})
+from test_linker import _random_detections
+
+from pystormtracker.hodges.linker import HodgesLinker
+
+assert numba.get_num_threads() == int(sys.argv[2])
+tracks = HodgesLinker(parallel=True).link(_random_detections(3, n_frames=60))
+np.savez(sys.argv[1], ids=tracks.track_ids, lats=tracks.lats, lons=tracks.lons)
+"""
+    tracks = HodgesLinker(parallel=True).link(_random_detections(3, n_frames=60))
+    for n_threads in (1, 4):
+        out = tmp_path / f"tracks_{n_threads}.npz"
+        env = {**os.environ, "NUMBA_NUM_THREADS": str(n_threads)}
+        subprocess.run(
+            [sys.executable, "-c", script, str(out), str(n_threads)],
+            env=env,
+            check=True,
+        )
+        result = np.load(out)
+        np.testing.assert_array_equal(result["ids"], tracks.track_ids)
+        np.testing.assert_array_equal(result["lats"], tracks.lats)
+        np.testing.assert_array_equal(result["lons"], tracks.lons)
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from pystormtracker.io.store import read_store, write_store
+from pystormtracker.models.tracks import TimeRange, Tracks
+
+
+def _sample(compact: bool = False) -> Tracks:
+    t0 = np.datetime64("2025-01-01T00:00:00", "s")
+    step = np.timedelta64(6, "h")
+    tracks = Tracks(compact=compact, time_step=step if compact else None)
+    # Interleaved points of three tracks
+    tracks.bulk_append(
+        tids=np.array([1, 2, 1, 3, 2, 1], dtype=np.int64),
+        times=np.array([t0, t0, t0 + step, t0 + step, t0 + step, t0 + 2 * step]),
+        lats=np.array([10.0, -20.0, 11.0, 30.0, -21.0, 12.0]),
+        lons=np.array([100.0, 200.0, 101.0, 300.0, 201.0, 102.0]),
+        vars_dict={"msl": np.array([990.0, 1000.0, 985.0, 995.0, 1001.0, 980.0])},
+    )
+    tracks.time_range = TimeRange(start=t0, end=t0 + 2 * step, step=step)
+    return tracks
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_store_roundtrip(tmp_path: Path, compact: bool) -> None:
+    tracks = _sample(compact)
+    write_store(tracks, tmp_path / "store")
+
+    manifest = json.loads((tmp_path / "store" / "manifest.json").read_text())
+    assert manifest["n_points"] == 6
+    assert manifest["n_tracks"] == 3
+    assert manifest["compact"] is compact
+
+    loaded = read_store(tmp_path / "store")
+    assert isinstance(loaded.lats, np.memmap)
+    assert loaded.compact is compact
+    assert loaded.time_step == tracks.time_step
+    assert loaded.time_range == tracks.time_range
+    assert len(loaded) == 3
+    for a, b in zip(tracks, loaded, strict=True):
+        assert a == b
+    # Points are stored grouped by track
+    np.testing.assert_array_equal(loaded.track_ids, [1, 1, 1, 2, 2, 3])
+    assert loaded._get_index().order is None
+
+    eager = read_store(tmp_path / "store", mmap=False)
+    assert not isinstance(eager.lats, np.memmap)
+    np.testing.assert_array_equal(eager.lats, loaded.lats)
+
+
+def test_store_copy_on_write(tmp_path: Path) -> None:
+    write_store(_sample(), tmp_path / "store")
+    loaded = read_store(tmp_path / "store")
+    loaded.lats[0] = 0.0
+    loaded.bulk_append(
+        tids=np.array([4]),
+        times=np.array([np.datetime64("2025-01-02T00:00:00", "s")]),
+        lats=np.array([1.0]),
+        lons=np.array([2.0]),
+        vars_dict={"msl": np.array([1010.0])},
+    )
+    assert len(loaded) == 4
+
+    reread = read_store(tmp_path / "store")
+    assert reread.lats[0] == 10.0
+    assert len(reread) == 3
+
+
+def test_store_unordered_ids(tmp_path: Path) -> None:
+    tracks = _sample().take([3, 1])
+    tracks.track_ids[tracks.track_ids == 1] = 7
+    write_store(tracks, tmp_path / "store")
+    loaded = read_store(tmp_path / "store")
+    np.testing.assert_array_equal(loaded._get_index().ids, [7, 2])
+    assert [len(t) for t in loaded] == [1, 3]
+
+
+def test_store_rejects_unknown_format(tmp_path: Path) -> None:
+    write_store(_sample(), tmp_path / "store")
+    manifest = tmp_path / "store" / "manifest.json"
+    meta = json.loads(manifest.read_text())
+    meta["version"] = 99
+    manifest.write_text(json.dumps(meta))
+    with pytest.raises(ValueError, match="newer"):
+        read_store(tmp_path / "store")
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+import pickle
 from pathlib import Path
 
 import numpy as np
+import pytest
 from numpy.typing import NDArray
 
 from pystormtracker.io.imilast import read_imilast, write_imilast
 from pystormtracker.models.center import Center
-from pystormtracker.models.tracks import Tracks
+from pystormtracker.models.tracks import TimeRange, Tracks
 
 
 def test_tracks_init() -> None:
@@ -254,3 +256,332 @@ def test_tracks_bulk_append() -> None:
     assert np.isnan(t[2][0].vars["msl"])
     assert t[2][0].vars["new_var"] == 2.0
     assert np.isnan(t[0][0].vars["new_var"])
+
+
+def test_tracks_growable_storage() -> None:
+    t = Tracks()
+    t0 = np.datetime64("2025-12-01T00:00:00")
+    for i in range(100):
+        t.add_track([Center(t0, float(i), float(i), {"msl": float(i)})])
+
+    # Appends grow the buffers geometrically; public arrays are logical views
+    assert len(t.track_ids) == 100
+    assert t.capacity >= 100
+    assert t.vars["msl"].shape == (100,)
+    assert t.lats[-1] == 99.0
+
+    t.shrink_to_fit()
+    assert t.capacity == 100
+    assert len(t) == 100
+    assert t[50][0].vars["msl"] == 50.0
+
+
+def test_tracks_pickle_drops_spare_capacity() -> None:
+    import pickle
+
+    t = Tracks()
+    t0 = np.datetime64("2025-12-01T00:00:00")
+    tr = t.add_track([Center(t0, 1.0, 2.0, {"msl": 3.0})])
+    tr.append(Center(t0 + np.timedelta64(6, "h"), 1.5, 2.5, {"msl": 2.0}))
+    assert t.capacity > 2
+
+    t2 = pickle.loads(pickle.dumps(t))
+    assert t2.capacity == 2
+    assert t2[0] == tr
+    assert list(t2.vars) == ["msl"]
+
+
+def test_tracks_index_interleaved_points() -> None:
+    t0 = np.datetime64("2025-12-01T00:00:00", "s")
+    dt = np.timedelta64(6, "h")
+    t = Tracks(
+        track_ids=np.array([7, 3, 7, 5, 3, 7]),
+        times=np.array([t0, t0, t0 + dt, t0, t0 + dt, t0 + 2 * dt]),
+        lats=np.array([0.0, 1.0, 2.0, 3.0, 4.0, 5.0]),
+        lons=np.zeros(6),
+    )
+
+    # Tracks keep first-appearance order, points keep physical order
+    assert t.unique_track_ids == [7, 3, 5]
+    assert len(t) == 3
+    assert [len(tr) for tr in t] == [3, 2, 1]
+    assert list(t[0].indices) == [0, 2, 5]
+    assert t[0][-1].lat == 5.0
+    assert t[1][1].lat == 4.0
+
+    # The cached index is rebuilt after mutations
+    t[2].append(Center(t0 + dt, 6.0, 0.0, {}))
+    assert len(t[2]) == 2
+    t[0].extend(t[1])
+    assert t.unique_track_ids == [7, 5]
+    assert len(t[0]) == 5
+
+
+def test_tracks_sort_keys() -> None:
+    t0 = np.datetime64("2025-12-01T00:00:00")
+    dt = np.timedelta64(6, "h")
+
+    tracks = Tracks()
+    tr1 = tracks.add_track(
+        [Center(t0, 0, 0, {"msl": 990}), Center(t0 + dt, 1, 1, {"msl": 980})]
+    )
+    tr2 = tracks.add_track([Center(t0 + dt, 5, 5, {"msl": 1000})])
+    tr3 = tracks.add_track(
+        [Center(t0, 9, 9, {"msl": 995}) for _ in range(3)],
+    )
+
+    tracks.sort(by="lifetime", descending=True)
+    assert list(tracks) == [tr3, tr1, tr2]
+
+    tracks.sort(by="min_intensity")
+    assert list(tracks) == [tr1, tr3, tr2]
+
+    tracks.sort(by="max_intensity", var="msl", descending=True)
+    assert list(tracks) == [tr2, tr3, tr1]
+
+    tracks.sort()
+    assert list(tracks) == [tr1, tr3, tr2]
+    # Points within a track keep their order
+    assert [c.lat for c in tracks[0]] == [0, 1]
+
+
+def test_tracks_match() -> None:
+    t0 = np.datetime64("2025-12-01T00:00:00")
+    dt = np.timedelta64(6, "h")
+
+    a = Tracks()
+    a.add_track([Center(t0 + i * dt, 10.0 + i, 359.9, {"msl": 990}) for i in range(3)])
+    a.add_track(
+        [Center(t0 + i * dt, -40.0, 100.0 + i, {"msl": 1000}) for i in range(2)]
+    )
+
+    b = Tracks()
+    # Same as the first track of a across the dateline, one step shorter
+    b.add_track([Center(t0 + i * dt, 10.0 + i, 0.05, {"msl": 990}) for i in range(2)])
+    # Second track displaced by about 1.1 km at its last point
+    b.add_track(
+        [
+            Center(t0, -40.0, 100.0, {"msl": 1000}),
+            Center(t0 + dt, -40.01, 101.0, {"msl": 1000}),
+        ]
+    )
+
+    m = a.match(b, length_diff_tol=1, coord_tol=0.2)
+    assert len(m) == 2
+    assert list(m.ids) == a.unique_track_ids
+    assert list(m.other_ids) == b.unique_track_ids
+    assert list(m.n_common) == [2, 2]
+    np.testing.assert_allclose(m.overlap, [2 / 3, 1.0])
+    assert m.mean_dist[0] > 0.0
+
+    # Spatial tolerance in km
+    assert len(a.match(b, length_diff_tol=1, dist_tol=1.0)) == 0
+    assert len(a.match(b, length_diff_tol=1, dist_tol=20.0)) == 2
+
+    # Intensity and length tolerances
+    assert len(a.match(b, length_diff_tol=0, coord_tol=0.2)) == 1
+    b.vars["msl"][:] += 1.0
+    assert len(a.match(b, length_diff_tol=1, coord_tol=0.2)) == 0
+
+
+def test_track_array_views() -> None:
+    t0 = np.datetime64("2025-12-01T00:00:00")
+    dt = np.timedelta64(6, "h")
+
+    # Interleaved points of two tracks
+    tracks = Tracks(
+        track_ids=np.array([1, 2, 1, 2, 1], dtype=np.int64),
+        times=np.array([t0, t0, t0 + dt, t0 + dt, t0 + 2 * dt]),
+        lats=np.array([0.0, 10.0, 1.0, 11.0, 2.0]),
+        lons=np.array([0.0, 20.0, 1.0, 21.0, 2.0]),
+        vars_dict={"msl": np.array([990.0, 1000.0, 980.0, 1001.0, 970.0])},
+    )
+    tr = tracks[0]
+    np.testing.assert_array_equal(tr.lats, [0.0, 1.0, 2.0])
+    np.testing.assert_array_equal(tr.vars["msl"], [990.0, 980.0, 970.0])
+    assert not np.shares_memory(tr.lats, tracks.lats)
+
+    # finalize() stores tracks contiguously, so columns become views
+    tracks.finalize()
+    np.testing.assert_array_equal(tracks.track_ids, [1, 1, 1, 2, 2])
+    tr = tracks[0]
+    assert np.shares_memory(tr.lats, tracks.lats)
+    assert np.shares_memory(tracks[1].vars["msl"], tracks.vars["msl"])
+    np.testing.assert_array_equal(tr.times, [t0, t0 + dt, t0 + 2 * dt])
+    assert [c.lat for c in tr] == [0.0, 1.0, 2.0]
+
+    rec = tracks[1].to_records()
+    assert rec.dtype.names == ("time", "lat", "lon", "msl")
+    np.testing.assert_array_equal(rec.lon, [20.0, 21.0])
+    assert rec[0].time == t0
+
+    assert tracks[0] == tracks[0]
+    assert tracks[0] != tracks[1]
+
+
+def test_tracks_take_filter_concat() -> None:
+    t0 = np.datetime64("2025-12-01T00:00:00")
+    dt = np.timedelta64(6, "h")
+
+    a = Tracks()
+    a.add_track([Center(t0 + i * dt, 1.0, float(i), {"msl": 990}) for i in range(3)])
+    a.add_track([Center(t0, 2.0, 0.0, {"msl": 1000})])
+    a.add_track([Center(t0 + i * dt, 3.0, float(i), {"msl": 980}) for i in range(2)])
+    np.testing.assert_array_equal(a.lengths, [3, 1, 2])
+
+    sub = a.take([3, 1])
+    assert sub.unique_track_ids == [1, 2]
+    assert [c.lat for c in sub[0]] == [3.0, 3.0]
+    assert [c.lat for c in sub[1]] == [1.0, 1.0, 1.0]
+    np.testing.assert_array_equal(sub.track_ids, [1, 1, 2, 2, 2])
+    assert len(a) == 3
+
+    long = a.filter(a.lengths >= 2)
+    assert len(long) == 2
+    assert long[1] == a[2]
+
+    b = Tracks()
+    b.add_track([Center(t0, 4.0, 0.0, {"vo": 1e-4})])
+    both = Tracks.concat([a, b])
+    assert both.unique_track_ids == [1, 2, 3, 4]
+    assert [c.lat for c in both[3]] == [4.0]
+    assert np.isnan(both.vars["vo"][:6]).all()
+    assert np.isnan(both.vars["msl"][6])
+    assert both.time_range is None
+    # New tracks continue the numbering
+    assert both.add_track([Center(t0, 5.0, 0.0, {})]).track_id == 5
+
+    # Time ranges sharing a step are merged
+    a.time_range = TimeRange(t0, t0 + 2 * dt, dt)
+    b.time_range = TimeRange(t0 + dt, t0 + 4 * dt, dt)
+    assert Tracks.concat([a, b, Tracks()]).time_range == TimeRange(t0, t0 + 4 * dt, dt)
+    b.time_range = TimeRange(t0 + dt, t0 + 4 * dt, 2 * dt)
+    assert Tracks.concat([a, b]).time_range is None
+
+    assert len(Tracks.concat([])) == 0
+    with pytest.raises(KeyError):
+        a.take([7])
+    with pytest.raises(ValueError, match="does not match"):
+        a.filter(np.ones(2, dtype=bool))
+
+
+def test_tracks_where() -> None:
+    t0 = np.datetime64("2025-12-01T00:00:00")
+    dt = np.timedelta64(6, "h")
+
+    # Interleaved points of three tracks
+    tracks = Tracks(
+        track_ids=np.array([1, 2, 3, 1, 2, 1], dtype=np.int64),
+        times=np.array([t0, t0, t0 + 3 * dt, t0 + dt, t0 + dt, t0 + 2 * dt]),
+        lats=np.array([10.0, 50.0, -30.0, 11.0, 51.0, 12.0]),
+        lons=np.array([175.0, 0.0, 90.0, 179.0, 1.0, 183.0]),
+        vars_dict={"msl": np.array([1000, 990, 1010, 995, 985, 990.0])},
+    )
+
+    assert tracks.where().unique_track_ids == [1, 2, 3]
+    assert len(tracks.where(min_lifetime=2)) == 2
+    assert len(tracks.where(min_lifetime=3)) == 1
+
+    # Box across the dateline and in -180..180 longitudes
+    out = tracks.where(bbox=(-178.0, -170.0, 0.0, 20.0))
+    assert len(out) == 1
+    assert [c.lon for c in out[0]] == [175.0, 179.0, 183.0]
+    assert len(tracks.where(bbox=(-10.0, 10.0, 40.0, 60.0))) == 1
+    assert len(tracks.where(bbox=(0.0, 360.0, -90.0, 0.0))) == 1
+
+    assert len(tracks.where(time=(t0 + 2 * dt, None))) == 2
+    assert len(tracks.where(time=("2025-12-01T03", "2025-12-01T06"))) == 2
+    # Lifetimes overlapping a window that falls between two of their points
+    out = tracks.where(time=("2025-12-01T01", "2025-12-01T05"))
+    assert out.unique_track_ids == [1, 2]
+    assert len(tracks.where(time=(None, t0 - dt))) == 0
+
+    assert len(tracks.where(var_range={"msl": (None, 988.0)})) == 1
+    assert len(tracks.where(var_range={"msl": (1005.0, 1020.0)})) == 1
+    assert len(tracks.where(min_lifetime=2, var_range={"msl": (1005.0, None)})) == 0
+
+    assert len(Tracks().where(min_lifetime=2)) == 0
+
+
+def test_tracks_compact_storage() -> None:
+    t0 = np.datetime64("2025-12-01T00:00:00")
+    dt = np.timedelta64(6, "h")
+
+    tracks = Tracks(compact=True, time_step=dt)
+    tr = tracks.add_track(
+        [Center(t0 + i * dt, 10.5 + i, 200.25, {"msl": 99000.0}) for i in range(3)]
+    )
+    tr.append(Center(t0 + 3 * dt, 14.5, 201.0, {"msl": 98000.0, "vo": 1e-4}))
+
+    assert tracks.track_ids.dtype == np.int32
+    assert tracks.lats.dtype == np.float32
+    assert tracks.vars["vo"].dtype == np.float32
+    assert tracks._times.dtype == np.int32
+    np.testing.assert_array_equal(tracks.times, t0 + np.arange(4) * dt)
+    assert tr[-1].time == t0 + 3 * dt
+    assert [c.lat for c in tr] == [10.5, 11.5, 12.5, 14.5]
+
+    with pytest.raises(ValueError, match="multiples"):
+        tracks.add_track([Center(t0 + np.timedelta64(1, "h"), 0.0, 0.0, {})])
+
+    # Derived objects keep the profile; astype converts back
+    assert tracks.take([1]).compact
+    assert Tracks.concat([tracks, Tracks()]).time_step == dt
+    full = tracks.astype(compact=False)
+    assert full.lats.dtype == np.float64
+    assert full.times.dtype == np.dtype("datetime64[s]")
+    np.testing.assert_array_equal(full[0].times, tracks[0].times)
+    np.testing.assert_array_equal(full[0].vars["vo"], tracks[0].vars["vo"])
+
+    # Compact storage roughly halves the pickled size
+    big = Tracks(
+        track_ids=np.repeat(np.arange(1000), 10),
+        times=np.full(10000, t0),
+        lats=np.zeros(10000),
+        lons=np.zeros(10000),
+        vars_dict={"msl": np.zeros(10000)},
+    )
+    small = big.astype(time_step=dt)
+    assert len(pickle.dumps(small)) < 0.6 * len(pickle.dumps(big))
+
+
+def test_tracks_summary() -> None:
+    t0 = np.datetime64("2025-12-01T00:00:00")
+    dt = np.timedelta64(6, "h")
+
+    tracks = Tracks()
+    tracks.add_track(
+        [
+            Center(t0, 0.0, 0.0, {"msl": 1000.0}),
+            Center(t0 + dt, 0.0, 1.0, {"msl": np.nan}),
+            Center(t0 + 2 * dt, 0.0, 0.0, {"msl": 990.0}),
+        ]
+    )
+    tracks.add_track([Center(t0 + dt, 45.0, 10.0, {"msl": 1010.0})])
+
+    s = tracks.summary()
+    assert len(s) == 2
+    np.testing.assert_array_equal(s.track_id, [1, 2])
+    np.testing.assert_array_equal(s.n_points, [3, 1])
+    np.testing.assert_array_equal(s.start, [t0, t0 + dt])
+    np.testing.assert_array_equal(s.lifetime, [2 * dt, np.timedelta64(0, "s")])
+    np.testing.assert_array_equal(s.lysis_lon, [0.0, 10.0])
+    # Out and back along the equator: no net displacement
+    one_deg = Center(t0, 0.0, 0.0, {}).abs_dist(Center(t0, 0.0, 1.0, {}))
+    np.testing.assert_allclose(s.displacement, [0.0, 0.0], atol=1e-6)
+    np.testing.assert_allclose(s.path_length, [2 * one_deg, 0.0], rtol=1e-3)
+    np.testing.assert_allclose(s.mean_speed[0], 2 * one_deg / 12.0, rtol=1e-3)
+    assert np.isnan(s.mean_speed[1])
+    np.testing.assert_array_equal(s.var_min["msl"], [990.0, 1010.0])
+    np.testing.assert_array_equal(s.var_max["msl"], [1000.0, 1010.0])
+
+    # Cached until the points change
+    assert tracks.summary() is s
+    tracks[1].append(Center(t0 + 2 * dt, 46.0, 10.0, {"msl": 1005.0}))
+    s2 = tracks.summary()
+    assert s2 is not s
+    np.testing.assert_array_equal(s2.n_points, [3, 2])
+    tracks.vars["msl"] = tracks.vars["msl"] - 10.0
+    assert tracks.summary().var_min["msl"][1] == 995.0
+
+    assert len(Tracks().summary()) == 0
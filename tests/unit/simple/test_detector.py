@@ -59,3 +59,36 @@ def test_simple_detector_detect_mock(mock_open: MagicMock) -> None:
     assert lats_out[0] == 3.0
     assert lons_out[0] == 3.0
     assert vars_dict["msl"][0] == 950.0
+
+
+def test_simple_detector_iter_detect_blocks() -> None:
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(7, 20, 30)).cumsum(1).cumsum(2) + 1000.0
+    da = xr.DataArray(
+        data,
+        dims=("time", "latitude", "longitude"),
+        coords={
+            "time": np.arange(7).astype("datetime64[D]"),
+            "latitude": np.linspace(-45, 45, 20),
+            "longitude": np.arange(30) * 12.0,
+        },
+        name="msl",
+    )
+    detector = SimpleDetector.from_xarray(da)
+    reference = detector.detect(size=5, threshold=0.0)
+
+    # A budget below one frame streams the range one frame at a time
+    with patch.object(detector, "get_var", wraps=detector.get_var) as get_var:
+        steps = detector.iter_detect(size=5, threshold=0.0, memory_budget=1)
+        first = next(steps)
+        assert get_var.call_args_list[0].args == ((0, 1),)
+        streamed = [first, *steps]
+        assert get_var.call_count == 7
+
+    assert len(streamed) == len(reference) == 7
+    for (t1, la1, lo1, v1), (t2, la2, lo2, v2) in zip(streamed, reference, strict=True):
+        assert t1 == t2
+        np.testing.assert_array_equal(la1, la2)
+        np.testing.assert_array_equal(lo1, lo2)
+        np.testing.assert_array_equal(v1["msl"], v2["msl"])
+    assert sum(len(s[1]) for s in reference) > 0
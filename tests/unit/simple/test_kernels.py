@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+from typing import Any
+
 import numpy as np
 from numpy.typing import NDArray
 
 from pystormtracker.simple.kernels import (
+    _numba_detect_block,
+    _numba_detect_frames,
     _numba_extrema_filter,
     _numba_get_centers,
     _numba_laplace_masked,
     _numba_remove_dup,
+    _numba_running_extreme,
+    _numba_select,
 )
 
 
@@ -84,3 +90,109 @@ def test_numba_get_centers() -> None:
     assert c[1] == 8
     assert vals[0] == frame[2, 2]
     assert vals[1] == frame[8, 8]
+
+
+def _extrema_reference(
+    data: NDArray[np.floating[Any]], size: int, threshold: float, is_min: bool
+) -> NDArray[np.float64]:
+    """Brute-force extrema filter: size x size windows, wrapping in longitude
+    and skipping the rows within size // 2 of the edges."""
+    rows, cols = data.shape
+    half = size // 2
+    wrapped = np.concatenate((data[:, cols - half :], data, data[:, :half]), axis=1)
+    windows = np.lib.stride_tricks.sliding_window_view(wrapped, (size, size))
+    windows = windows.reshape(rows - size + 1, cols, size * size)
+    center = data[half : rows - half]
+    rank = size * size // 3
+    ranked = np.sort(windows, axis=2)
+    with np.errstate(invalid="ignore"):
+        if is_min:
+            ok = (ranked[:, :, 0] >= center) & (ranked[:, :, rank] - center > threshold)
+        else:
+            ok = (ranked[:, :, -1] <= center) & (
+                ranked[:, :, -1 - rank] - center < -threshold
+            )
+    out = np.zeros(data.shape)
+    out[half : rows - half] = ok & np.isfinite(center)
+    return out
+
+
+def test_numba_extrema_filter_matches_reference() -> None:
+    rng = np.random.default_rng(4)
+    frame = np.round(rng.normal(size=(20, 30)).cumsum(0).cumsum(1))
+    frame[7, 3:6] = np.inf
+    dtypes: tuple[type[np.floating[Any]], ...] = (np.float64, np.float32)
+    for dtype in dtypes:
+        data = frame.astype(dtype)
+        for size in (3, 5):
+            for is_min in (True, False):
+                for threshold in (0.0, 1.0):
+                    np.testing.assert_array_equal(
+                        _numba_extrema_filter(data, size, threshold, is_min),
+                        _extrema_reference(data, size, threshold, is_min),
+                    )
+
+
+def test_numba_detect_block_matches_pipeline() -> None:
+    rng = np.random.default_rng(3)
+    block = np.round(rng.normal(size=(3, 24, 36)).cumsum(1).cumsum(2))
+    block[1, 10, 5:9] = np.nan
+    dtypes: tuple[type[np.floating[Any]], ...] = (np.float64, np.float32)
+    for dtype in dtypes:
+        data = block.astype(dtype)
+        for is_min in (True, False):
+            out = np.empty((3, 100), dtype=np.int64)
+            counts = np.zeros(3, dtype=np.int64)
+            _numba_detect_block(data, 5, 1.0, is_min, 5, out, counts, 2)
+            out_serial = np.empty_like(out)
+            counts_serial = np.zeros_like(counts)
+            _numba_detect_frames(
+                data, 0, 3, 5, 1.0, is_min, 5, out_serial, counts_serial
+            )
+            np.testing.assert_array_equal(counts, counts_serial)
+
+            for t in range(3):
+                frame = data[t]
+                filled = np.where(np.isnan(frame), np.inf if is_min else -np.inf, frame)
+                extrema = _extrema_reference(filled, 5, 1.0, is_min)
+                laplacian = _numba_laplace_masked(filled, extrema, is_min)
+                centers = _numba_remove_dup(laplacian, size=5)
+                r_idx, c_idx, _ = _numba_get_centers(centers, frame)
+                flat = out[t, : counts[t]]
+                np.testing.assert_array_equal(flat, r_idx * 36 + c_idx)
+                np.testing.assert_array_equal(out_serial[t, : counts[t]], flat)
+
+
+def test_numba_running_extreme() -> None:
+    rng = np.random.default_rng(11)
+    frame = rng.normal(size=(13, 17))
+    frame[4, 0] = np.nan
+    rows, cols = frame.shape
+    for size in (1, 3, 7):
+        for is_min in (True, False):
+            fill = np.inf if is_min else -np.inf
+            filled = np.where(np.isnan(frame), fill, frame)
+            g = np.empty(cols + size - 1)
+            h = np.empty(cols + size - 1)
+            acc = np.empty_like(frame)
+            out = np.empty_like(frame)
+            _numba_running_extreme(frame, size, is_min, fill, g, h, acc, out)
+
+            half = size // 2
+            wrapped = np.concatenate(
+                (filled[:, cols - half :], filled, filled[:, :half]), axis=1
+            )
+            windows = np.lib.stride_tricks.sliding_window_view(wrapped, (size, size))
+            reduce = np.min if is_min else np.max
+            expected = reduce(windows, axis=(2, 3))
+            np.testing.assert_array_equal(out[: rows - size + 1], expected)
+
+
+def test_numba_select() -> None:
+    rng = np.random.default_rng(12)
+    for n in (1, 2, 9, 25, 49):
+        values = np.round(rng.normal(size=n) * 3)
+        for k in range(n):
+            a = values.copy()
+            _numba_select(a, k)
+            assert a[k] == np.sort(values)[k]
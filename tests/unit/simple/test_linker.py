@@ -4,7 +4,11 @@ import numpy as np
 from numpy.typing import NDArray
 
 from pystormtracker.models.tracks import Tracks
-from pystormtracker.simple.linker import SimpleLinker
+from pystormtracker.simple.linker import (
+    SimpleLinker,
+    haversine_matrix,
+    match_mutual_nearest,
+)
 
 
 def test_simple_linker_init() -> None:
@@ -39,3 +43,77 @@ def test_simple_linker_append() -> None:
     assert tracks.time_range.end == t6
     assert tracks.time_range.step == np.timedelta64(6, "h")
     assert len(tracks[0]) == 2
+
+
+def _dense_mutual_nearest(
+    dist: NDArray[np.float64], threshold: float
+) -> NDArray[np.int64]:
+    """Reference matcher rescanning the full distance matrix."""
+    dist = dist.copy()
+    matched = np.full(dist.shape[1], -1, dtype=np.int64)
+    changed = True
+    while changed:
+        changed = False
+        for ic in range(dist.shape[1]):
+            if matched[ic] == -1 and np.any(dist[:, ic] < threshold):
+                it = int(np.argmin(dist[:, ic]))
+                if np.argmin(dist[it, :]) == ic:
+                    matched[ic] = it
+                    dist[:, ic] = np.inf
+                    dist[it, :] = np.inf
+                    changed = True
+    return matched
+
+
+def test_match_mutual_nearest() -> None:
+    rng = np.random.default_rng(42)
+    for _ in range(50):
+        nt, nc = rng.integers(1, 40, 2)
+        # Coarse grid coordinates produce many exact distance ties
+        tail_lats = rng.integers(-8, 8, nt) * 2.5
+        tail_lons = rng.integers(0, 16, nt) * 2.5
+        new_lats = rng.integers(-8, 8, nc) * 2.5
+        new_lons = rng.integers(0, 16, nc) * 2.5
+        expected = _dense_mutual_nearest(
+            haversine_matrix(tail_lats, tail_lons, new_lats, new_lons), 800.0
+        )
+        np.testing.assert_array_equal(
+            match_mutual_nearest(tail_lats, tail_lons, new_lats, new_lons, 800.0),
+            expected,
+        )
+
+    # Nothing within the threshold
+    none = match_mutual_nearest(
+        np.array([0.0]), np.array([0.0]), np.array([40.0]), np.array([40.0]), 500.0
+    )
+    np.testing.assert_array_equal(none, [-1])
+
+
+def test_simple_linker_tail_state() -> None:
+    rng = np.random.default_rng(0)
+    t0 = np.datetime64("2025-12-01T00:00:00")
+    steps = []
+    lats = rng.uniform(-60, 60, 30)
+    lons = rng.uniform(0, 360, 30)
+    for i in range(6):
+        lats = lats + rng.normal(0, 1, 30)
+        lons = (lons + rng.normal(2, 1, 30)) % 360
+        steps.append(
+            (t0 + np.timedelta64(6 * i, "h"), lats, lons, {"msl": rng.random(30)})
+        )
+
+    reference = Tracks()
+    linker = SimpleLinker()
+    for step in steps:
+        linker.append(reference, step)
+
+    # A fresh linker per step reloads the tails from the Tracks object
+    tracks = Tracks()
+    for step in steps:
+        SimpleLinker().append(tracks, step)
+
+    np.testing.assert_array_equal(tracks.track_ids, reference.track_ids)
+    np.testing.assert_array_equal(tracks.lats, reference.lats)
+    np.testing.assert_array_equal(tracks.lons, reference.lons)
+    assert tracks._tail_ids == reference._tail_ids
+    assert tracks._head_ids == reference._head_ids
@@ -1,7 +1,28 @@
+from itertools import pairwise
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import numpy as np
+import pytest
+import xarray as xr
+
+from pystormtracker.models.tracker import RawDetectionStep
 from pystormtracker.models.tracks import Tracks
-from pystormtracker.simple.tracker import SimpleTracker
+from pystormtracker.simple.concurrent import (
+    _detect_rank_slice,
+    _detect_shared,
+    _pack_linked_chunk,
+    _unpack_linked_chunks,
+    _unpack_steps,
+    run_simple_dask,
+)
+from pystormtracker.simple.detector import detect_block
+from pystormtracker.simple.linker import SimpleLinker
+from pystormtracker.simple.tracker import (
+    SimpleTracker,
+    _link_centers,
+    _stitch_chunks,
+)
 
 
 def test_tracker_time_range() -> None:
@@ -38,3 +59,184 @@ def test_tracker_dask_backend() -> None:
     ) as mock_run_dask:
         tracker.track("dummy.nc", "msl", backend="dask")
         mock_run_dask.assert_called_once()
+
+
+def test_tracker_processes_backend() -> None:
+    tracker = SimpleTracker()
+
+    with patch(
+        "pystormtracker.simple.concurrent.run_simple_processes",
+        return_value=Tracks(),
+    ) as mock_run_processes:
+        tracker.track("dummy.nc", "msl", backend="processes", n_workers=2)
+        mock_run_processes.assert_called_once()
+
+
+def test_detect_shared() -> None:
+    from multiprocessing import shared_memory
+
+    rng = np.random.default_rng(1)
+    field = rng.normal(size=(4, 16, 24)).cumsum(1).cumsum(2).astype(np.float32)
+    times = np.arange(4).astype("datetime64[D]").astype("datetime64[s]")
+    lat = np.linspace(60, -60, 16)
+    lon = np.arange(24) * 15.0
+
+    shm = shared_memory.SharedMemory(create=True, size=field.nbytes)
+    try:
+        np.ndarray(field.shape, dtype=field.dtype, buffer=shm.buf)[...] = field
+        counts, flat, vals, packed = _detect_shared(
+            shm.name,
+            field.shape,
+            field.dtype.str,
+            1,
+            4,
+            times[1:],
+            lat,
+            lon,
+            5,
+            0.0,
+            "min",
+        )
+    finally:
+        shm.close()
+        shm.unlink()
+
+    expected_flat, expected_counts = detect_block(field[1:], 5, 0.0, True)
+    np.testing.assert_array_equal(counts, expected_counts)
+    np.testing.assert_array_equal(flat, expected_flat)
+    steps = _unpack_steps(times[1:], lat, lon, "msl", counts, flat, vals)
+    assert [len(s[1]) for s in steps] == counts.tolist()
+    # Matches of the second and third steps against their predecessors
+    expected = SimpleLinker().match_chunk(steps)[1:]
+    np.testing.assert_array_equal(packed, np.concatenate(expected))
+
+
+def test_stitch_chunks_matches_serial() -> None:
+    rng = np.random.default_rng(7)
+    t0 = np.datetime64("2025-01-01T00:00:00")
+    steps: list[RawDetectionStep] = []
+    lats = rng.uniform(-70, 70, 40)
+    lons = rng.uniform(0, 360, 40)
+    for i in range(20):
+        keep = rng.random(40) < 0.9
+        lats = lats + rng.normal(0, 2, 40)
+        lons = (lons + rng.normal(3, 2, 40)) % 360
+        n = 0 if i == 9 else int(keep.sum())  # One step without centers
+        steps.append(
+            (
+                t0 + np.timedelta64(6 * i, "h"),
+                lats[keep][:n],
+                lons[keep][:n],
+                {"msl": rng.random(n)},
+            )
+        )
+
+    serial = _link_centers(steps)
+
+    # Uneven chunks, including an empty one
+    bounds = [0, 3, 3, 11, 12, 20]
+    linker = SimpleLinker()
+    chunks = []
+    for a, b in pairwise(bounds):
+        chunks.append((steps[a:b], linker.match_chunk(steps[a:b])))
+    stitched_steps, matches = _stitch_chunks(chunks)
+    stitched = _link_centers(stitched_steps, matches=matches)
+
+    assert len(stitched) == len(serial)
+    np.testing.assert_array_equal(stitched.track_ids, serial.track_ids)
+    np.testing.assert_array_equal(stitched.times, serial.times)
+    np.testing.assert_array_equal(stitched.lats, serial.lats)
+    np.testing.assert_array_equal(stitched.vars["msl"], serial.vars["msl"])
+
+
+def _write_msl(path: Path, n_times: int = 12) -> str:
+    rng = np.random.default_rng(3)
+    field = rng.normal(size=(n_times, 73, 144)).cumsum(1).cumsum(2)
+    ds = xr.Dataset(
+        {"msl": (("time", "latitude", "longitude"), 1e5 + 50 * field)},
+        coords={
+            "time": np.datetime64("2025-01-01T00")
+            + np.arange(n_times) * np.timedelta64(6, "h"),
+            "latitude": np.linspace(90, -90, 73),
+            "longitude": np.arange(144) * 2.5,
+        },
+    )
+    infile = str(path / "msl.nc")
+    ds.to_netcdf(infile)
+    return infile
+
+
+def _assert_same_tracks(tracks: Tracks, expected: Tracks) -> None:
+    assert len(tracks) == len(expected)
+    np.testing.assert_array_equal(tracks.track_ids, expected.track_ids)
+    np.testing.assert_array_equal(tracks.times, expected.times)
+    np.testing.assert_array_equal(tracks.lats, expected.lats)
+    np.testing.assert_array_equal(tracks.lons, expected.lons)
+    assert tracks.vars.keys() == expected.vars.keys()
+    for k in expected.vars:
+        np.testing.assert_array_equal(tracks.vars[k], expected.vars[k])
+
+
+def test_run_simple_dask_matches_serial(tmp_path: Path) -> None:
+    infile = _write_msl(tmp_path)
+    serial = SimpleTracker().track(infile, "msl")
+    # Uneven time chunks, filtered and detected lazily chunk by chunk
+    tracks = run_simple_dask(infile, "msl", None, "min", n_workers=2, max_chunk_size=5)
+
+    _assert_same_tracks(tracks, serial)
+
+    # The scheduler is threaded through to dask, and refused by other backends
+    tracks = SimpleTracker().track(
+        infile, "msl", backend="dask", n_workers=2, scheduler="synchronous"
+    )
+    _assert_same_tracks(tracks, serial)
+    with pytest.raises(ValueError, match="dask backend"):
+        SimpleTracker().track(infile, "msl", scheduler="threads")
+
+
+def test_detect_rank_slice_matches_serial(tmp_path: Path) -> None:
+    infile = _write_msl(tmp_path, n_times=5)
+    serial = SimpleTracker().track(infile, "msl")
+
+    # More ranks than frames leaves the last ranks without frames
+    size = 7
+    chunks = [
+        _detect_rank_slice(infile, "msl", None, "min", rank, size)
+        for rank in range(size)
+    ]
+    assert [len(c[0]) for c in chunks] == [1, 1, 1, 1, 1, 0, 0]
+    steps, matches = _stitch_chunks(chunks)
+    _assert_same_tracks(_link_centers(steps, matches=matches), serial)
+
+
+def test_pack_linked_chunks_round_trip(tmp_path: Path) -> None:
+    infile = _write_msl(tmp_path, n_times=5)
+    size = 3
+    chunks = [
+        _detect_rank_slice(infile, "msl", None, "min", rank, size)
+        for rank in range(size)
+    ]
+    chunks.append(([], []))  # A rank without frames
+
+    # What Gatherv concatenates at root
+    packed = [_pack_linked_chunk(c) for c in chunks]
+    buffers = [np.concatenate(bufs) for bufs in zip(*packed, strict=True)]
+    n_steps = np.array([len(c[0]) for c in chunks])
+    var_name = next(iter(chunks[0][0][0][3]))
+    unpacked = _unpack_linked_chunks(buffers, n_steps, var_name)
+
+    assert len(unpacked) == len(chunks)
+    for (steps, matches), (exp_steps, exp_matches) in zip(
+        unpacked, chunks, strict=True
+    ):
+        assert len(steps) == len(exp_steps)
+        for step, exp in zip(steps, exp_steps, strict=True):
+            assert step[0] == exp[0]
+            np.testing.assert_array_equal(step[1], exp[1])
+            np.testing.assert_array_equal(step[2], exp[2])
+            np.testing.assert_array_equal(step[3][var_name], exp[3][var_name])
+        for m, exp_m in zip(matches, exp_matches, strict=True):
+            if exp_m is None:
+                assert m is None
+            else:
+                np.testing.assert_array_equal(m, exp_m)
@@ -7,6 +7,7 @@ import pytest
 from utils import fetch_era5_msl
 
 from pystormtracker.cli import main, parse_args, run_tracker
+from pystormtracker.hodges.tracker import HodgesTracker
 
 
 @pytest.fixture
@@ -73,6 +74,48 @@ def test_parse_args() -> None:
         assert args.workers == 4
 
 
+def test_processes_backend_simple_only(tmp_path: Path) -> None:
+    base = ["stormtracker", "-i", "input.nc", "-v", "msl", "-o", "out.txt"]
+    with patch("sys.argv", [*base, "-b", "processes"]):
+        assert parse_args().backend == "processes"
+    for extra in (["-a", "hodges"], ["--map-proj", "healpix"]):
+        with (
+            patch("sys.argv", [*base, "-b", "processes", *extra]),
+            pytest.raises(SystemExit),
+        ):
+            parse_args()
+
+    outfile = str(tmp_path / "out.txt")
+    with pytest.raises(ValueError, match="simple tracker"):
+        run_tracker("input.nc", "msl", outfile, backend="processes", algorithm="hodges")
+    with pytest.raises(ValueError, match="simple tracker"):
+        HodgesTracker().track("input.nc", "msl", backend="processes")
+
+
+def test_scheduler_simple_only(tmp_path: Path) -> None:
+    base = ["stormtracker", "-i", "input.nc", "-v", "msl", "-o", "out.txt"]
+    with patch("sys.argv", [*base, "--scheduler", "distributed"]):
+        assert parse_args().scheduler == "distributed"
+    for extra in (["-a", "hodges"], ["--map-proj", "healpix"]):
+        with (
+            patch("sys.argv", [*base, "--scheduler", "distributed", *extra]),
+            pytest.raises(SystemExit),
+        ):
+            parse_args()
+
+    outfile = str(tmp_path / "out.txt")
+    for algorithm, map_proj in (("hodges", "global"), ("simple", "healpix")):
+        with pytest.raises(ValueError, match="simple tracker"):
+            run_tracker(
+                "input.nc",
+                "msl",
+                outfile,
+                map_proj=map_proj,  # type: ignore[arg-type]
+                algorithm=algorithm,  # type: ignore[arg-type]
+                scheduler="distributed",
+            )
+
+
 def test_main(msl_data: str, tmp_path: Path) -> None:
     output_file = tmp_path / "main_output.txt"
     test_args = [